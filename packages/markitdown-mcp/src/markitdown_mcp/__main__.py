@@ -20,7 +20,11 @@ mcp = FastMCP("markitdown")
 @mcp.tool()
 async def convert_to_markdown(uri: str) -> str:
     """Convert a resource described by an http:, https:, file: or data: URI to markdown"""
-    return MarkItDown(enable_plugins=check_plugins_enabled()).convert_uri(uri).markdown
+    # Convert without blocking the event loop (fetching http(s) uris asynchronously if httpx is installed)
+    result = await MarkItDown(enable_plugins=check_plugins_enabled()).convert_uri_async(
+        uri
+    )
+    return result.markdown
 
 
 def check_plugins_enabled() -> bool:
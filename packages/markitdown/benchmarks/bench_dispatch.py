@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Measures the converter dispatch overhead of MarkItDown._convert as a function of the
+number of registered plugin converters.
+
+Inputs are tiny in-memory .txt, .html and .csv documents whose stream info is passed
+explicitly, so that the measurement excludes content sniffing (Magika, charset detection).
+Plugins are registered either with dispatch hints (indexed) or without (always probed).
+
+Usage:
+
+    python benchmarks/bench_dispatch.py [--plugins 0,10,50,100] [--repeat 2000]
+"""
+import argparse
+import io
+import time
+from typing import Any, BinaryIO, List
+
+from markitdown import (
+    MarkItDown,
+    DispatchHints,
+    DocumentConverter,
+    DocumentConverterResult,
+    StreamInfo,
+)
+
+SAMPLES = [
+    (b"Hello, world!\n", StreamInfo(extension=".txt", mimetype="text/plain")),
+    (
+        b"<html><body><h1>Hello</h1><p>world</p></body></html>",
+        StreamInfo(extension=".html", mimetype="text/html", charset="utf-8"),
+    ),
+    (b"a,b,c\n1,2,3\n", StreamInfo(extension=".csv", mimetype="text/csv")),
+]
+
+
+class _PluginConverter(DocumentConverter):
+    """A plugin that accepts a single, unrelated extension, without dispatch hints."""
+
+    def __init__(self, extension: str):
+        super().__init__()
+        self._extension = extension
+
+    def accepts(
+        self, file_stream: BinaryIO, stream_info: StreamInfo, **kwargs: Any
+    ) -> bool:
+        return (stream_info.extension or "").lower() == self._extension
+
+    def convert(
+        self, file_stream: BinaryIO, stream_info: StreamInfo, **kwargs: Any
+    ) -> DocumentConverterResult:
+        return DocumentConverterResult(markdown="")
+
+
+class _IndexedPluginConverter(_PluginConverter):
+    """The same plugin, declaring dispatch hints."""
+
+    def accepts(
+        self, file_stream: BinaryIO, stream_info: StreamInfo, **kwargs: Any
+    ) -> bool:
+        return super().accepts(file_stream, stream_info, **kwargs)
+
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(extensions=[self._extension])
+
+
+def _time_dispatch(markitdown: MarkItDown, repeat: int) -> float:
+    """Return the mean time, in microseconds, to dispatch and convert one sample."""
+    streams = [(io.BytesIO(data), stream_info) for data, stream_info in SAMPLES]
+
+    # Warm up (and build the dispatch index)
+    for stream, stream_info in streams:
+        markitdown._convert(file_stream=stream, stream_info_guesses=[stream_info])
+        stream.seek(0)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for stream, stream_info in streams:
+            markitdown._convert(file_stream=stream, stream_info_guesses=[stream_info])
+            stream.seek(0)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(streams)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--plugins",
+        default="0,10,50,100,200",
+        help="Comma-separated numbers of plugin converters to register.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=2000, help="Iterations per measurement."
+    )
+    args = parser.parse_args()
+
+    counts: List[int] = [int(n) for n in args.plugins.split(",")]
+
+    print(f"{'plugins':>8} {'unindexed (us)':>16} {'indexed (us)':>14}")
+    for count in counts:
+        results = []
+        for plugin_class in [_PluginConverter, _IndexedPluginConverter]:
+            markitdown = MarkItDown()
+            for i in range(count):
+                markitdown.register_converter(plugin_class(f".plugin{i}"))
+            results.append(_time_dispatch(markitdown, args.repeat))
+        print(f"{count:>8} {results[0]:>16.1f} {results[1]:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
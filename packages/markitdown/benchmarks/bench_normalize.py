@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Measures the output normalization pass that MarkItDown._convert runs on every result,
+comparing the previous regex-based implementation with normalize_markdown().
+
+Inputs are synthetic multi-MB outputs shaped like those of the largest converters:
+Markdown tables (spreadsheets), and paragraphs of wrapped text with ragged
+trailing whitespace and runs of blank lines (PDFs).
+
+Usage:
+
+    python benchmarks/bench_normalize.py [--size-mb 1,8,32] [--repeat 5]
+"""
+import argparse
+import re
+import time
+from typing import Callable, Dict, List
+
+from markitdown._text_utils import normalize_markdown
+
+
+def _legacy_normalize(text: str) -> str:
+    """The regex post-pass previously used by MarkItDown._convert."""
+    text = "\n".join([line.rstrip() for line in re.split(r"\r?\n", text)])
+    return re.sub(r"\n{3,}", "\n\n", text)
+
+
+def _spreadsheet_output(size: int) -> str:
+    lines: List[str] = [
+        "## Sheet1",
+        "| id | name | amount | notes |",
+        "| --- | --- | --- | --- |",
+    ]
+    total = 0
+    i = 0
+    while total < size:
+        line = f"| {i} | item {i % 97} | {i * 1.5:.2f} | NaN |"
+        lines.append(line)
+        total += len(line) + 1
+        i += 1
+    return "\n".join(lines) + "\n"
+
+
+def _pdf_output(size: int) -> str:
+    words = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do".split()
+    lines: List[str] = []
+    total = 0
+    i = 0
+    while total < size:
+        line = " ".join(words[(i + j) % len(words)] for j in range(12)) + " " * (i % 3)
+        if i % 9 == 8:
+            line += "\r\n\r\n\n\x0c"  # Page break, with blank lines around it
+        lines.append(line)
+        total += len(line) + 2
+        i += 1
+    return "\r\n".join(lines)
+
+
+def _time(func: Callable[[str], str], text: str, repeat: int) -> float:
+    """Return the best time, in milliseconds, over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--size-mb",
+        default="1,8,32",
+        help="Comma-separated output sizes, in MB.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per measurement (best is kept)."
+    )
+    args = parser.parse_args()
+
+    generators: Dict[str, Callable[[int], str]] = {
+        "spreadsheet": _spreadsheet_output,
+        "pdf": _pdf_output,
+    }
+
+    print(f"{'output':>12} {'MB':>4} {'regex (ms)':>12} {'single pass (ms)':>18}")
+    for name, generate in generators.items():
+        for size_mb in [int(n) for n in args.size_mb.split(",")]:
+            text = generate(size_mb * 1024 * 1024)
+            assert normalize_markdown(text) == _legacy_normalize(text)
+            legacy = _time(_legacy_normalize, text, args.repeat)
+            single_pass = _time(normalize_markdown, text, args.repeat)
+            print(f"{name:>12} {size_mb:>4} {legacy:>12.1f} {single_pass:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
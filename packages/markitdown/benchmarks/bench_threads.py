@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Measures the throughput of one MarkItDown instance shared by a pool of threads,
+converting the test corpus concurrently, for a range of thread counts.
+
+Thread scaling depends on how much of each conversion releases the GIL (I/O, lxml,
+onnxruntime, etc.). On free-threaded CPython builds, pure-Python converters scale too.
+
+Usage:
+
+    python benchmarks/bench_threads.py [--threads 1,2,4,8] [--rounds 5]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from markitdown import MarkItDown
+
+TEST_FILES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "tests", "test_files"
+)
+
+
+def _corpus() -> List[str]:
+    return sorted(
+        os.path.join(TEST_FILES_DIR, name)
+        for name in os.listdir(TEST_FILES_DIR)
+        if os.path.isfile(os.path.join(TEST_FILES_DIR, name))
+    )
+
+
+def _convert(markitdown: MarkItDown, path: str) -> int:
+    try:
+        return len(markitdown.convert(path).markdown)
+    except Exception:
+        return 0  # Unsupported or broken test files are part of the workload too
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--threads",
+        default="1,2,4,8",
+        help="Comma-separated thread counts.",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="Passes over the corpus per measurement."
+    )
+    args = parser.parse_args()
+
+    markitdown = MarkItDown()
+    paths = _corpus() * args.rounds
+
+    # Warm up (loads Magika, imports the optional dependencies, etc.)
+    for path in _corpus():
+        _convert(markitdown, path)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{len(paths)} conversions per run, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'threads':>8} {'seconds':>9} {'files/s':>9} {'speedup':>8}")
+    baseline = None
+    for num_threads in [int(n) for n in args.threads.split(",")]:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            list(executor.map(lambda path: _convert(markitdown, path), paths))
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = elapsed
+        print(
+            f"{num_threads:>8} {elapsed:>9.2f} {len(paths) / elapsed:>9.1f} {baseline / elapsed:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""
+Benchmark suite for MarkItDown: throughput, latency percentiles and peak memory, per input
+and per converter, over the test corpus and scalable synthetic inputs (see __main__.py).
+"""
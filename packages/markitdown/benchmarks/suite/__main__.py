@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Runs the benchmark suite over the test corpus and scalable synthetic inputs (N-page PDFs,
+wide and tall XLSX and CSV files, deep and long HTML, large PPTX, big ZIPs), and reports the
+throughput, latency percentiles and peak traced memory of each input, and of each converter.
+Some inputs are also measured with other converter options (e.g., each PDF in every pdf_mode).
+
+Results are written as JSON. With --baseline, they are compared with a stored run, and the
+exit status is 1 if any input got slower (or used more memory) by more than --threshold.
+
+Usage (from packages/markitdown):
+
+    python -m benchmarks.suite run [--scale 1] [--repeat 5] [--only REGEX] [-o results.json]
+    python -m benchmarks.suite run --baseline baseline.json [--threshold 0.15]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.15]
+"""
+import argparse
+import json
+import platform
+import re
+import sys
+from typing import Any, Dict, List
+
+from markitdown import __version__
+
+from .compare import compare
+from .generators import synthetic_inputs
+from .runner import Case, corpus_cases, measure, summarize_converters, with_variants
+
+# Bump this if the layout of the results changes
+RESULTS_FORMAT_VERSION = 1
+
+
+def _cases(args) -> List[Case]:
+    cases: List[Case] = []
+    if not args.no_corpus:
+        cases.extend(corpus_cases())
+    if not args.no_synthetic:
+        for synthetic in synthetic_inputs(args.scale):
+            cases.append(
+                Case(
+                    name=f"synthetic/{synthetic.name}",
+                    extension=synthetic.extension,
+                    load=synthetic.generate,
+                )
+            )
+    cases = with_variants(cases)
+    if args.only:
+        cases = [case for case in cases if re.search(args.only, case.name)]
+    return cases
+
+
+def _run(args) -> Dict[str, Any]:
+    measured = []
+    for case in _cases(args):
+        result = measure(case, repeat=args.repeat, warmup=args.warmup)
+        measured.append(result)
+        if "latency_ms" in result:
+            status = (
+                f"p50 {result['latency_ms']['p50']:9.1f} ms  "
+                f"p90 {result['latency_ms']['p90']:9.1f} ms  "
+                f"{result['throughput_mb_s']:7.2f} MB/s  "
+                f"peak {result['peak_traced_memory_bytes'] / 1e6:7.1f} MB  "
+                f"{result['converter']}"
+            )
+        else:
+            status = result.get("error") or result.get("skipped")
+        print(f"{case.name:<48} {status}", file=sys.stderr)
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "markitdown_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "scale": args.scale,
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+        },
+        "cases": measured,
+        "converters": summarize_converters(measured),
+    }
+
+
+def _report(baseline: Dict[str, Any], results: Dict[str, Any], threshold: float) -> int:
+    if baseline.get("settings", {}).get("scale") != results.get("settings", {}).get(
+        "scale"
+    ):
+        print(
+            "Warning: the runs have different scales, so synthetic inputs differ.",
+            file=sys.stderr,
+        )
+    lines, regressions = compare(baseline, results, threshold=threshold)
+    print("\n".join(lines), file=sys.stderr)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        return 1
+    print("\nNo regressions.", file=sys.stderr)
+    return 0
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, "rt", encoding="utf-8") as fh:
+        results = json.load(fh)
+    if results.get("format_version") != RESULTS_FORMAT_VERSION:
+        sys.exit(f"{path}: unsupported results format")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description=__doc__.strip().splitlines()[0],
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier of the size of synthetic inputs (pages, rows, slides, etc.).",
+    )
+    run_parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed conversions per input."
+    )
+    run_parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed conversions per input."
+    )
+    run_parser.add_argument(
+        "--only", help="Only run the inputs whose name matches this regex."
+    )
+    run_parser.add_argument(
+        "--no-corpus", action="store_true", help="Skip the test corpus."
+    )
+    run_parser.add_argument(
+        "--no-synthetic", action="store_true", help="Skip the synthetic inputs."
+    )
+    run_parser.add_argument(
+        "-o", "--output", help="Write the results to this file (default: stdout)."
+    )
+    run_parser.add_argument(
+        "--baseline", help="Compare the results with those stored in this file."
+    )
+    run_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Relative increase that counts as a regression (default: 0.15).",
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare stored results with a baseline."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(_report(_load(args.baseline), _load(args.results), args.threshold))
+
+    baseline = None if args.baseline is None else _load(args.baseline)
+    results = _run(args)
+    if args.output:
+        with open(args.output, "wt", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if baseline is not None:
+        sys.exit(_report(baseline, results, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares benchmark results against a stored baseline, case by case.
+"""
+from typing import Any, Dict, List, Tuple
+
+# The metrics compared (label, path in the case), for all of which lower is better
+METRICS: List[Tuple[str, str]] = [
+    ("p50 ms", "latency_ms.p50"),
+    ("peak MB", "peak_traced_memory_bytes"),
+]
+
+
+def _get(case: Dict[str, Any], path: str) -> Any:
+    value: Any = case
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(
+    baseline: Dict[str, Any], results: Dict[str, Any], *, threshold: float
+) -> Tuple[List[str], List[str]]:
+    """
+    Compare results with a baseline. Returns the lines of a report, and the regressions: cases
+    for which a metric grew by more than threshold (e.g., 0.15 for 15%), or that newly fail.
+    Cases that are not in both runs are listed, but are not regressions.
+    """
+    baseline_cases = {case["name"]: case for case in baseline["cases"]}
+    result_cases = {case["name"]: case for case in results["cases"]}
+
+    lines = [
+        f"{'case':<48} {'metric':>8} {'baseline':>12} {'current':>12} {'change':>8}"
+    ]
+    regressions: List[str] = []
+    for name, case in result_cases.items():
+        base = baseline_cases.get(name)
+        if base is None:
+            lines.append(f"{name:<48} (new)")
+            continue
+        if "error" in case and "error" not in base:
+            lines.append(f"{name:<48} now fails: {case['error']}")
+            regressions.append(f"{name}: now fails")
+            continue
+        for label, path in METRICS:
+            before, after = _get(base, path), _get(case, path)
+            if not before or after is None:
+                continue
+            change = after / before - 1
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name}: {label} {change:+.0%}")
+            scale = 1e-6 if path == "peak_traced_memory_bytes" else 1
+            lines.append(
+                f"{name:<48} {label:>8} {before * scale:>12.2f} {after * scale:>12.2f} {change:>+8.0%}{flag}"
+            )
+
+    for name in baseline_cases:
+        if name not in result_cases:
+            lines.append(f"{name:<48} (missing)")
+    return lines, regressions
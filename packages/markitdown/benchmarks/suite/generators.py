@@ -0,0 +1,258 @@
+"""
+Generators of synthetic inputs, scaled by a size parameter (pages, rows, slides, members, etc.),
+to exercise the hot paths of the converters on inputs larger than those of the test corpus.
+
+Generators return the bytes of the document. Inputs are deterministic, so that results are
+comparable across runs. Generators that need an optional dependency (e.g., openpyxl, python-pptx)
+raise ImportError if it is missing, and the case is skipped.
+"""
+import csv
+import io
+import zipfile
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua ut enim ad minim veniam quis nostrud"
+).split()
+
+
+@dataclass(frozen=True)
+class SyntheticInput:
+    """A generated input, named after its shape and size (e.g., pdf_pages_20)."""
+
+    name: str
+    extension: str
+    generate: Callable[[], bytes]
+
+
+def _sentence(i: int, length: int = 12) -> str:
+    return " ".join(WORDS[(i * 7 + j) % len(WORDS)] for j in range(length))
+
+
+def pdf(num_pages: int, lines_per_page: int = 45) -> bytes:
+    """A text PDF, with lines_per_page lines of text per page (written directly, with no dependency)."""
+    page_ids = [4 + 2 * i for i in range(num_pages)]
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>".encode("ascii"),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page, page_id in enumerate(page_ids):
+        text = ["BT /F1 10 Tf 15 TL 50 760 Td", f"(Page {page + 1}) Tj"]
+        for i in range(lines_per_page):
+            text.append(f"({_sentence(page * lines_per_page + i)}) '")
+        text.append("ET")
+        content = "\n".join(text).encode("ascii")
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>"
+        ).encode("ascii")
+        objects[page_id + 1] = (
+            b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+        )
+    return _write_pdf(objects)
+
+
+def scanned_pdf(num_pages: int, strips: int = 64, width: int = 300) -> bytes:
+    """
+    An image-only PDF, like a scan. Each page is drawn as strips grayscale images, as some
+    scanners (and compressors that segment pages) produce, which are costly to lay out.
+    """
+    objects = {1: b"<< /Type /Catalog /Pages 2 0 R >>"}
+    page_ids = [3 + (strips + 2) * i for i in range(num_pages)]
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[2] = f"<< /Type /Pages /Kids [{kids}] /Count {num_pages} >>".encode("ascii")
+
+    height = 792 / strips
+    for page, page_id in enumerate(page_ids):
+        names = " ".join(f"/Im{s} {page_id + 2 + s} 0 R" for s in range(strips))
+        content = "\n".join(
+            f"q 612 0 0 {height:.4f} 0 {s * height:.4f} cm /Im{s} Do Q"
+            for s in range(strips)
+        ).encode("ascii")
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /XObject << {names} >> >> /Contents {page_id + 1} 0 R >>"
+        ).encode("ascii")
+        objects[page_id + 1] = (
+            b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+        )
+        for s in range(strips):
+            # Bands of gray, different on every strip, compress like a scan of text would
+            pixels = bytes(((s + page) * 37 + x // 7) % 256 for x in range(width)) * 4
+            image = zlib.compress(pixels)
+            objects[page_id + 2 + s] = (
+                b"<< /Type /XObject /Subtype /Image /Width %d /Height 4 /ColorSpace /DeviceGray "
+                b"/BitsPerComponent 8 /Filter /FlateDecode /Length %d >>\nstream\n"
+                % (width, len(image))
+                + image
+                + b"\nendstream"
+            )
+    return _write_pdf(objects)
+
+
+def _write_pdf(objects: Dict[int, bytes]) -> bytes:
+    """Write the objects (numbered from 1, with the catalog first) as a PDF file."""
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = out.tell()
+        out.write(b"%d 0 obj\n" % object_id + objects[object_id] + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for object_id in sorted(objects):
+        out.write(b"%010d 00000 n \n" % offsets[object_id])
+    out.write(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref)
+    )
+    return out.getvalue()
+
+
+def _cell(row: int, col: int) -> object:
+    # A mix of numbers and short strings, like most real spreadsheets
+    if col % 3 == 0:
+        return row * 1.5 + col
+    return f"{WORDS[(row + col) % len(WORDS)]} {row}"
+
+
+def xlsx(rows: int, cols: int) -> bytes:
+    """A single-sheet workbook of rows x cols cells."""
+    import openpyxl
+
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Data")
+    sheet.append([f"column {c}" for c in range(cols)])
+    for r in range(rows):
+        sheet.append([_cell(r, c) for c in range(cols)])
+    out = io.BytesIO()
+    workbook.save(out)
+    return out.getvalue()
+
+
+def csv_(rows: int, cols: int) -> bytes:
+    """A CSV file of rows x cols cells."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow([f"column {c}" for c in range(cols)])
+    for r in range(rows):
+        writer.writerow([_cell(r, c) for c in range(cols)])
+    return out.getvalue().encode("utf-8")
+
+
+def deep_html(depth: int, trees: int) -> bytes:
+    """An HTML page of trees nested <div>s, each depth levels deep, with text at every level."""
+    parts = ["<html><head><title>Deep</title></head><body>"]
+    for t in range(trees):
+        for d in range(depth):
+            parts.append(f"<div><p>{_sentence(t * depth + d, 6)}</p>")
+        parts.append("</div>" * depth)
+    parts.append("</body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def long_html(paragraphs: int) -> bytes:
+    """A long HTML article: headings, paragraphs with links and emphasis, lists and tables."""
+    parts = ["<html><head><title>Long</title></head><body><article>"]
+    for i in range(paragraphs):
+        if i % 20 == 0:
+            parts.append(f"<h2>Section {i // 20}</h2>")
+        parts.append(
+            f"<p>{_sentence(i)} <a href='https://example.com/{i}'>link {i}</a> "
+            f"<em>{_sentence(i + 1, 4)}</em> <strong>{_sentence(i + 2, 3)}</strong></p>"
+        )
+        if i % 10 == 5:
+            parts.append(
+                "<ul>" + "".join(f"<li>item {j}</li>" for j in range(5)) + "</ul>"
+            )
+        if i % 25 == 24:
+            rows = "".join(
+                f"<tr><td>{j}</td><td>{_sentence(j, 3)}</td></tr>" for j in range(10)
+            )
+            parts.append(f"<table><tr><th>#</th><th>Text</th></tr>{rows}</table>")
+    parts.append("</article></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def pptx(num_slides: int) -> bytes:
+    """A presentation with a title and bullets on every slide, and a table on every fifth slide."""
+    import pptx as python_pptx
+    from pptx.util import Inches
+
+    presentation = python_pptx.Presentation()
+    layout = presentation.slide_layouts[1]  # Title and content
+    for s in range(num_slides):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Slide {s + 1}"
+        body = slide.placeholders[1].text_frame
+        body.text = _sentence(s)
+        for b in range(4):
+            body.add_paragraph().text = _sentence(s * 4 + b, 8)
+        if s % 5 == 4:
+            table = slide.shapes.add_table(
+                6, 4, Inches(1), Inches(4), Inches(8), Inches(2)
+            ).table
+            for r in range(6):
+                for c in range(4):
+                    table.cell(r, c).text = str(_cell(r, c))
+        slide.notes_slide.notes_text_frame.text = _sentence(s, 20)
+    out = io.BytesIO()
+    presentation.save(out)
+    return out.getvalue()
+
+
+def zip_(members: int) -> bytes:
+    """An archive of small text, HTML and CSV members."""
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for m in range(members):
+            kind = m % 3
+            if kind == 0:
+                archive.writestr(
+                    f"notes/{m}.txt", "\n".join(_sentence(m + i) for i in range(20))
+                )
+            elif kind == 1:
+                archive.writestr(f"pages/{m}.html", long_html(5))
+            else:
+                archive.writestr(f"data/{m}.csv", csv_(20, 5))
+    return out.getvalue()
+
+
+def synthetic_inputs(scale: float = 1.0) -> List[SyntheticInput]:
+    """The synthetic inputs of the suite, with sizes multiplied by scale."""
+
+    def n(size: int) -> int:
+        return max(1, int(size * scale))
+
+    pages, slides, members = n(20), n(40), n(150)
+    tall_rows, wide_cols = n(5000), n(100)
+    csv_rows, csv_cols = n(20000), n(200)
+    trees, paragraphs = n(20), n(2000)
+    # Nesting depth is not scaled, since converters recurse into the tree
+    depth = 60
+
+    return [
+        SyntheticInput(f"pdf_pages_{pages}", ".pdf", lambda: pdf(pages)),
+        SyntheticInput(
+            f"pdf_scanned_pages_{pages}", ".pdf", lambda: scanned_pdf(pages)
+        ),
+        SyntheticInput(f"xlsx_tall_{tall_rows}x8", ".xlsx", lambda: xlsx(tall_rows, 8)),
+        SyntheticInput(
+            f"xlsx_wide_100x{wide_cols}", ".xlsx", lambda: xlsx(100, wide_cols)
+        ),
+        SyntheticInput(f"csv_tall_{csv_rows}x8", ".csv", lambda: csv_(csv_rows, 8)),
+        SyntheticInput(f"csv_wide_200x{csv_cols}", ".csv", lambda: csv_(200, csv_cols)),
+        SyntheticInput(
+            f"html_deep_{depth}x{trees}", ".html", lambda: deep_html(depth, trees)
+        ),
+        SyntheticInput(
+            f"html_long_{paragraphs}", ".html", lambda: long_html(paragraphs)
+        ),
+        SyntheticInput(f"pptx_slides_{slides}", ".pptx", lambda: pptx(slides)),
+        SyntheticInput(f"zip_members_{members}", ".zip", lambda: zip_(members)),
+    ]
@@ -0,0 +1,200 @@
+"""
+Measures conversions: latency percentiles and throughput over repeated runs, and peak traced
+memory over one more run (tracemalloc slows conversions down, so it is not enabled while timing).
+"""
+import io
+import os
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from markitdown import ConversionObserver, ConversionStage, MarkItDown, StreamInfo
+from markitdown.converters._pdf_converter import PDF_BACKENDS
+
+TEST_FILES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "tests", "test_files"
+)
+
+# Converter options to also measure inputs of these extensions with, as variants of the case
+# (which is otherwise measured with the default options). Variants that use a PDF backend that
+# is not installed are skipped.
+VARIANTS: Dict[str, List[Dict[str, Any]]] = {
+    ".pdf": [
+        {"pdf_mode": "fast"},
+        {"pdf_mode": "layout"},
+        {"pdf_backend": "pypdfium2"},
+        {"pdf_backend": "pypdf"},
+    ],
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    """An input to convert: a file of the test corpus, or a synthetic input."""
+
+    name: str
+    extension: str
+    load: Callable[[], bytes]
+    options: Mapping[str, Any] = field(default_factory=dict)
+
+
+class _ConverterObserver(ConversionObserver):
+    """Records the converter chosen by the last top-level conversion."""
+
+    def __init__(self):
+        self.converter: Optional[str] = None
+
+    def stage_finished(self, stage: ConversionStage) -> None:
+        if stage.name == "convert" and stage.parent is None:
+            self.converter = stage.attributes.get("converter")
+
+
+def corpus_cases() -> List[Case]:
+    """The files of tests/test_files."""
+    cases = []
+    for filename in sorted(os.listdir(TEST_FILES_DIR)):
+        path = os.path.join(TEST_FILES_DIR, filename)
+        if os.path.isfile(path):
+            cases.append(
+                Case(
+                    name=f"corpus/{filename}",
+                    extension=os.path.splitext(filename)[1],
+                    load=lambda path=path: open(path, "rb").read(),
+                )
+            )
+    return cases
+
+
+def _format_options(options: Mapping[str, Any]) -> str:
+    return ",".join(f"{k}={v}" for k, v in options.items())
+
+
+def with_variants(cases: List[Case]) -> List[Case]:
+    """Add, after each case, its variants (see VARIANTS), named like "corpus/test.pdf[pdf_mode=fast]"."""
+    expanded = []
+    for case in cases:
+        expanded.append(case)
+        for options in VARIANTS.get(case.extension, []):
+            expanded.append(
+                Case(
+                    name=f"{case.name}[{_format_options(options)}]",
+                    extension=case.extension,
+                    load=case.load,
+                    options=options,
+                )
+            )
+    return expanded
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """The q-th percentile (0 <= q <= 100) of sorted values, interpolating between ranks."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (
+        rank - low
+    )
+
+
+def measure(case: Case, *, repeat: int, warmup: int = 1) -> Dict[str, Any]:
+    """Convert the case warmup + repeat times (plus once with tracemalloc), and summarize."""
+    result: Dict[str, Any] = {"name": case.name}
+    if case.options:
+        result["options"] = dict(case.options)
+    backend = PDF_BACKENDS.get(case.options.get("pdf_backend", ""))
+    if backend is not None and not backend.is_available():
+        result["skipped"] = f"Missing dependency: {backend.package}"
+        return result
+    try:
+        data = case.load()
+    except ImportError as e:
+        result["skipped"] = f"Missing dependency: {e}"
+        return result
+
+    observer = _ConverterObserver()
+    markitdown = MarkItDown(observer=observer)
+    stream_info = StreamInfo(extension=case.extension)
+
+    def _convert() -> int:
+        return len(
+            markitdown.convert_stream(
+                io.BytesIO(data), stream_info=stream_info, **case.options
+            ).markdown
+        )
+
+    result["input_bytes"] = len(data)
+    try:
+        for _ in range(warmup):
+            _convert()
+        latencies = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output_chars = _convert()
+            latencies.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            _convert()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    latencies.sort()
+    total = sum(latencies)
+    result.update(
+        {
+            "converter": observer.converter,
+            "output_chars": output_chars,
+            "runs": repeat,
+            "latency_ms": {
+                "min": latencies[0] * 1e3,
+                "p50": percentile(latencies, 50) * 1e3,
+                "p90": percentile(latencies, 90) * 1e3,
+                "p99": percentile(latencies, 99) * 1e3,
+                "max": latencies[-1] * 1e3,
+                "mean": total / repeat * 1e3,
+            },
+            "throughput_mb_s": len(data) * repeat / total / 1e6,
+            "peak_traced_memory_bytes": peak,
+        }
+    )
+    return result
+
+
+def summarize_converters(cases: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Aggregate the measured cases by the converter that won (and the options of variants)."""
+    converters: Dict[str, Dict[str, Any]] = {}
+    for case in cases:
+        if "latency_ms" not in case:
+            continue
+        key = case["converter"] or "(none)"
+        if "options" in case:
+            key += f"[{_format_options(case['options'])}]"
+        summary = converters.setdefault(
+            key,
+            {
+                "cases": 0,
+                "input_bytes": 0,
+                "p50_ms_total": 0.0,
+                "peak_traced_memory_bytes": 0,
+            },
+        )
+        summary["cases"] += 1
+        summary["input_bytes"] += case["input_bytes"]
+        summary["p50_ms_total"] += case["latency_ms"]["p50"]
+        summary["peak_traced_memory_bytes"] = max(
+            summary["peak_traced_memory_bytes"], case["peak_traced_memory_bytes"]
+        )
+    for summary in converters.values():
+        summary["throughput_mb_s"] = (
+            summary["input_bytes"] / summary["p50_ms_total"] / 1e3
+            if summary["p50_ms_total"] > 0
+            else None
+        )
+    return dict(sorted(converters.items()))
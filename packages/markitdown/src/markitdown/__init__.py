@@ -8,14 +8,28 @@ from ._markitdown import (
     PRIORITY_SPECIFIC_FILE_FORMAT,
     PRIORITY_GENERIC_FILE_FORMAT,
 )
-from ._base_converter import DocumentConverterResult, DocumentConverter
+from ._base_converter import DocumentConverterResult, DocumentConverter, cached_probe
 from ._stream_info import StreamInfo
+from ._dispatch_index import DispatchHints
+from ._conversion_cache import (
+    ConversionCache,
+    MemoryConversionCache,
+    SqliteConversionCache,
+    CacheStats,
+)
+from ._isolation import ResourceLimits
+from ._instrumentation import (
+    ConversionObserver,
+    ConversionStage,
+    OpenTelemetryObserver,
+)
 from ._exceptions import (
     MarkItDownException,
     MissingDependencyException,
     FailedConversionAttempt,
     FileConversionException,
     UnsupportedFormatException,
+    ResourceLimitExceededException,
 )
 
 __all__ = [
@@ -23,12 +37,23 @@ __all__ = [
     "MarkItDown",
     "DocumentConverter",
     "DocumentConverterResult",
+    "cached_probe",
     "MarkItDownException",
     "MissingDependencyException",
     "FailedConversionAttempt",
     "FileConversionException",
     "UnsupportedFormatException",
+    "ResourceLimitExceededException",
     "StreamInfo",
+    "DispatchHints",
+    "ConversionCache",
+    "MemoryConversionCache",
+    "SqliteConversionCache",
+    "CacheStats",
+    "ResourceLimits",
+    "ConversionObserver",
+    "ConversionStage",
+    "OpenTelemetryObserver",
     "PRIORITY_SPECIFIC_FILE_FORMAT",
     "PRIORITY_GENERIC_FILE_FORMAT",
 ]
@@ -2,12 +2,21 @@
 #
 # SPDX-License-Identifier: MIT
 import argparse
+import os
 import sys
 import codecs
+import threading
 from textwrap import dedent
-from importlib.metadata import entry_points
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from .__about__ import __version__
 from ._markitdown import MarkItDown, StreamInfo, DocumentConverterResult
+from ._instrumentation import ConversionObserver, ConversionStage
+from .converters import PageSelection
+from .converters._pdf_converter import PDF_BACKENDS, PDF_MODES
+
+# The number of modules, and of functions per module, listed by --profile
+_PROFILE_MODULES = 15
+_PROFILE_FUNCTIONS = 5
 
 
 def main():
@@ -41,6 +50,10 @@ def main():
                 OR
 
                 markitdown example.pdf > example.md
+
+                OR to diagnose a slow conversion
+
+                markitdown example.pdf --stats --profile > /dev/null
             """
         ).strip(),
     )
@@ -110,6 +123,47 @@ def main():
         help="Keep data URIs (like base64-encoded images) in the output. By default, data URIs are truncated.",
     )
 
+    parser.add_argument(
+        "--pages",
+        help='Only convert these pages of a PDF, e.g. "1-5" (the first 5 pages), "r5-z" (the last 5 pages), or "3,7,10-".',
+    )
+
+    parser.add_argument(
+        "--page-markers",
+        action="store_true",
+        help="Precede the text of each page of a PDF with a marker, e.g. <!-- Page 12 -->.",
+    )
+
+    parser.add_argument(
+        "--pdf-mode",
+        choices=PDF_MODES,
+        help="How PDFs are extracted: fast (no layout analysis), balanced (the default), or layout (the full layout analysis).",
+    )
+
+    parser.add_argument(
+        "--pdf-backend",
+        choices=[*PDF_BACKENDS, "auto"],
+        help="The engine that extracts the text of PDFs: pdfminer (the default), pypdfium2 or pypdf (if installed), or auto (the fastest one that is installed).",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the output incrementally (e.g., page by page), as it is converted.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the conversion, and print the hottest functions, grouped by module, to stderr.",
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print a JSON summary of the conversion (stage timings, sizes, peak traced memory, converters tried) to stderr. Tracing memory slows the conversion down.",
+    )
+
     parser.add_argument("filename", nargs="?")
     args = parser.parse_args()
 
@@ -145,6 +199,13 @@ def main():
         else:
             charset_hint = None
 
+    # Check the page selection
+    if args.pages is not None:
+        try:
+            PageSelection.parse(args.pages)
+        except ValueError as e:
+            _exit_with_error(str(e))
+
     stream_info = None
     if (
         extension_hint is not None
@@ -157,6 +218,8 @@ def main():
 
     if args.list_plugins:
         # List installed plugins, then exit
+        from importlib.metadata import entry_points
+
         print("Installed MarkItDown 3rd-party Plugins:\n")
         plugin_entry_points = list(entry_points(group="markitdown.plugin"))
         if len(plugin_entry_points) == 0:
@@ -172,6 +235,9 @@ def main():
             )
         sys.exit(0)
 
+    # Collects the stages of the conversion, for --stats
+    observer = _StatsObserver() if args.stats else None
+
     if args.use_docintel:
         if args.endpoint is None:
             _exit_with_error(
@@ -181,23 +247,234 @@ def main():
             _exit_with_error("Filename is required when using Document Intelligence.")
 
         markitdown = MarkItDown(
-            enable_plugins=args.use_plugins, docintel_endpoint=args.endpoint
+            enable_plugins=args.use_plugins,
+            docintel_endpoint=args.endpoint,
+            observer=observer,
         )
     else:
-        markitdown = MarkItDown(enable_plugins=args.use_plugins)
+        markitdown = MarkItDown(enable_plugins=args.use_plugins, observer=observer)
+
+    if args.profile or args.stats:
+        _convert_with_diagnostics(args, markitdown, stream_info, observer)
+    else:
+        _convert(args, markitdown, stream_info)
+
+
+def _conversion_options(args) -> Dict[str, Any]:
+    """The options passed to the converters."""
+    options: Dict[str, Any] = {"keep_data_uris": args.keep_data_uris}
+    if args.pages is not None:
+        options["pages"] = args.pages
+    if args.page_markers:
+        options["pdf_page_markers"] = True
+    if args.pdf_mode is not None:
+        options["pdf_mode"] = args.pdf_mode
+    if args.pdf_backend is not None:
+        options["pdf_backend"] = args.pdf_backend
+    return options
+
+
+def _convert(args, markitdown: MarkItDown, stream_info: Optional[StreamInfo]) -> int:
+    """Convert the input, and write the output. Returns the size of the Markdown, in UTF-8 bytes."""
+    if args.stream:
+        source = sys.stdin.buffer if args.filename is None else args.filename
+        chunks = markitdown.convert_iter(
+            source, stream_info=stream_info, **_conversion_options(args)
+        )
+        return _handle_streamed_output(args, chunks)
 
     if args.filename is None:
         result = markitdown.convert_stream(
             sys.stdin.buffer,
             stream_info=stream_info,
-            keep_data_uris=args.keep_data_uris,
+            **_conversion_options(args),
         )
     else:
         result = markitdown.convert(
-            args.filename, stream_info=stream_info, keep_data_uris=args.keep_data_uris
+            args.filename, stream_info=stream_info, **_conversion_options(args)
         )
 
     _handle_output(args, result)
+    return len(result.markdown.encode("utf-8"))
+
+
+def _convert_with_diagnostics(
+    args,
+    markitdown: MarkItDown,
+    stream_info: Optional[StreamInfo],
+    observer: Optional["_StatsObserver"],
+):
+    """Convert under the profiler (--profile) and/or tracemalloc (--stats), then report to stderr."""
+    import cProfile
+    import json
+    import time
+    import tracemalloc
+
+    profiler = cProfile.Profile() if args.profile else None
+    if observer is not None:
+        tracemalloc.start()
+
+    output_bytes = None
+    error = None
+    start = time.perf_counter()
+    try:
+        if profiler is not None:
+            output_bytes = profiler.runcall(_convert, args, markitdown, stream_info)
+        else:
+            output_bytes = _convert(args, markitdown, stream_info)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        if profiler is not None:
+            _print_profile(profiler)
+        if observer is not None:
+            _, peak_traced_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            summary = {"source": "-" if args.filename is None else args.filename}
+            summary.update(observer.summary())
+            summary.update(
+                {
+                    "output_bytes": output_bytes,
+                    "peak_traced_memory_bytes": peak_traced_memory,
+                    "total_seconds": round(elapsed, 6),
+                    "error": None
+                    if error is None
+                    else f"{type(error).__name__}: {error}",
+                }
+            )
+            print(json.dumps(summary, indent=2), file=sys.stderr)
+
+
+class _StatsObserver(ConversionObserver):
+    """Collects the stages of a conversion, for the --stats summary."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: List[ConversionStage] = []
+
+    def stage_finished(self, stage: ConversionStage) -> None:
+        with self._lock:
+            self._stages.append(stage)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = list(self._stages)
+
+        # Total time per stage name (nested conversions, e.g., of ZIP members, included)
+        timings: Dict[str, Dict[str, Any]] = {}
+        for stage in stages:
+            timing = timings.setdefault(stage.name, {"count": 0, "seconds": 0.0})
+            timing["count"] += 1
+            timing["seconds"] += stage.duration or 0.0
+        for timing in timings.values():
+            timing["seconds"] = round(timing["seconds"], 6)
+
+        # The outcome of the top-level conversion (convert_iter has no enclosing "convert" stage)
+        root = next(
+            (s for s in stages if s.name == "convert" and s.parent is None), None
+        )
+        attempts = [s for s in stages if s.name == "attempt" and _is_top_level_stage(s)]
+        succeeded = [s for s in attempts if s.error is None]
+        converter = succeeded[-1].attributes.get("converter") if succeeded else None
+
+        attributes = {} if root is None else root.attributes
+        return {
+            "converter": attributes.get("converter", converter),
+            "input_bytes": attributes.get("input_bytes"),
+            "output_chars": attributes.get("output_chars"),
+            "guesses_tried": attributes.get("guesses_tried"),
+            "failed_attempts": [
+                {
+                    "converter": s.attributes.get("converter"),
+                    "error": f"{type(s.error).__name__}: {s.error}",
+                }
+                for s in attempts
+                if s.error is not None
+            ],
+            "stages": timings,
+        }
+
+
+def _is_top_level_stage(stage: ConversionStage) -> bool:
+    """Return True if the stage is not part of a nested conversion (e.g., of a ZIP member)."""
+    parent = stage.parent
+    while parent is not None and parent.name != "convert":
+        parent = parent.parent
+    return parent is None or parent.parent is None
+
+
+def _print_profile(profiler) -> None:
+    """
+    Print the time spent in each converter (cumulative, i.e., including the libraries it calls),
+    then the functions with the most own time, grouped by module, to stderr.
+    """
+    import pstats
+
+    # Map source files to module names (converter modules, or third-party packages)
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, "__file__", None)
+        if filename:
+            modules[os.path.abspath(filename)] = name
+
+    groups: Dict[str, List[Tuple[float, float, int, str]]] = {}
+    total = 0.0
+    for (filename, lineno, funcname), (_, calls, own, cumulative, _) in pstats.Stats(
+        profiler
+    ).stats.items():  # type: ignore[attr-defined]
+        total += own
+        groups.setdefault(_profile_group(modules.get(filename, filename)), []).append(
+            (
+                own,
+                cumulative,
+                calls,
+                f"{funcname} ({os.path.basename(filename)}:{lineno})",
+            )
+        )
+
+    converters = sorted(
+        (
+            (max(f[1] for f in functions), group)
+            for group, functions in groups.items()
+            if group.startswith("markitdown.converters.")
+        ),
+        reverse=True,
+    )
+    print("Profile: cumulative time by converter module", file=sys.stderr)
+    for cumulative, group in converters:
+        if cumulative < 0.001:
+            break  # Converters that were only probed
+        print(f"  {cumulative:>9.3f}  {group}", file=sys.stderr)
+
+    ranked = sorted(
+        groups.items(), key=lambda item: sum(f[0] for f in item[1]), reverse=True
+    )
+    print(f"Profile: {total:.3f}s of own time, by module", file=sys.stderr)
+    print(f"  {'own (s)':>9} {'cum (s)':>9} {'calls':>9}  function", file=sys.stderr)
+    for group, functions in ranked[:_PROFILE_MODULES]:
+        print(f"{group}: {sum(f[0] for f in functions):.3f}s", file=sys.stderr)
+        functions.sort(reverse=True)
+        for own, cumulative, calls, function in functions[:_PROFILE_FUNCTIONS]:
+            print(
+                f"  {own:>9.3f} {cumulative:>9.3f} {calls:>9}  {function}",
+                file=sys.stderr,
+            )
+
+
+def _profile_group(module: str) -> str:
+    """Group markitdown functions by module (e.g., by converter), and others by package."""
+    if module.startswith("~"):
+        return "(built-in)"
+    if module.startswith("<"):
+        # E.g., <frozen importlib._bootstrap>
+        module = module.strip("<>").split()[-1]
+    if module.startswith("markitdown"):
+        return module
+    if os.path.isabs(module):
+        return "(other)"
+    return module.split(".")[0]
 
 
 def _handle_output(args, result: DocumentConverterResult):
@@ -214,6 +491,27 @@ def _handle_output(args, result: DocumentConverterResult):
         )
 
 
+def _handle_streamed_output(args, chunks: Iterator[str]) -> int:
+    """Write chunks to stdout or file, as they are produced. Returns the size written, in UTF-8 bytes."""
+    size = 0
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size += len(chunk.encode("utf-8"))
+    else:
+        for chunk in chunks:
+            sys.stdout.write(
+                chunk.encode(sys.stdout.encoding, errors="replace").decode(
+                    sys.stdout.encoding
+                )
+            )
+            sys.stdout.flush()
+            size += len(chunk.encode("utf-8"))
+        sys.stdout.write("\n")
+    return size
+
+
 def _exit_with_error(message: str):
     print(message)
     sys.exit(1)
@@ -1,5 +1,26 @@
-from typing import Any, BinaryIO, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, TypeVar
 from ._stream_info import StreamInfo
+from ._dispatch_index import DispatchHints
+
+T = TypeVar("T")
+
+
+def cached_probe(kwargs: Any, key: str, probe: Callable[[], T]) -> T:
+    """
+    Return the result of an expensive check of the stream (e.g., parsing its header) made by
+    accepts(), running probe() only the first time the key is seen during the conversion.
+
+    MarkItDown may call accepts() several times on the same bytes (once per StreamInfo guess),
+    and passes a per-conversion cache in kwargs["_probe_cache"]. Keys should be namespaced by
+    module (e.g., f"{__name__}.is_ole"). Without a cache (e.g., if accepts() is called directly),
+    probe() is simply run.
+    """
+    cache = kwargs.get("_probe_cache")
+    if cache is None:
+        return probe()
+    if key not in cache:
+        cache[key] = probe()
+    return cache[key]
 
 
 class DocumentConverterResult:
@@ -10,6 +31,7 @@ class DocumentConverterResult:
         markdown: str,
         *,
         title: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize the DocumentConverterResult.
@@ -20,9 +42,13 @@ class DocumentConverterResult:
         Parameters:
         - markdown: The converted Markdown text.
         - title: Optional title of the document.
+        - metadata: Optional metadata about the document, specific to the converter (e.g., the
+            text coverage of the pages of a PDF, see PdfTextCoverage). Must be JSON-serializable,
+            so that it can be cached.
         """
         self.markdown = markdown
         self.title = title
+        self.metadata: Dict[str, Any] = {} if metadata is None else metadata
 
     @property
     def text_content(self) -> str:
@@ -40,7 +66,19 @@ class DocumentConverterResult:
 
 
 class DocumentConverter:
-    """Abstract superclass of all DocumentConverters."""
+    """
+    Abstract superclass of all DocumentConverters.
+
+    A MarkItDown instance (and so, each of its converters) may be shared by several threads, and
+    accepts() and convert() may be called concurrently on different streams. Converters must
+    therefore be reentrant: any per-call state (options from kwargs, parsers, buffers) must be kept
+    in local variables, or passed explicitly to helper methods, and never stored on self. State set
+    in __init__ should be treated as read-only afterwards.
+    """
+
+    # True if the Markdown depends on the local path or filename of the stream (e.g., the ZIP
+    # converter names the archive in its header), so that cached results are keyed by them
+    output_depends_on_path: bool = False
 
     def accepts(
         self,
@@ -81,6 +119,24 @@ class DocumentConverter:
             f"The subclass, {type(self).__name__}, must implement the accepts() method to determine if they can handle the document."
         )
 
+    def dispatch_hints(self) -> Optional[DispatchHints]:
+        """
+        Return the extensions, mimetype prefixes and (optionally) url patterns that this
+        converter accepts, or None if unknown.
+
+        MarkItDown uses these hints to build a dispatch index, so that accepts() is first
+        called only on converters that are likely to handle a given stream. Returning hints is
+        a promise that accepts() returns False for any stream that does not match them. Converters
+        that inspect the stream content (or the charset, etc.) in accepts() should return None,
+        which is the default, and which causes the converter to be probed for every stream.
+
+        Hints are ignored if a subclass overrides accepts() without also overriding this method.
+
+        Returns:
+        - DispatchHints | None: The hints, or None if the converter should always be probed.
+        """
+        return None
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -103,3 +159,24 @@ class DocumentConverter:
         - MissingDependencyException: If the converter requires a dependency that is not installed.
         """
         raise NotImplementedError("Subclasses must implement this method")
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """
+        Convert a document to Markdown text, yielding it in chunks as it is produced.
+
+        The default implementation yields the Markdown of convert() as a single chunk. Converters
+        for documents with natural boundaries (pages, slides, sheets, etc.) can override this to
+        yield one chunk per boundary, so that consumers receive output sooner, and the full Markdown
+        never needs to be held in memory. The concatenated chunks should equal the Markdown of convert().
+
+        Parameters and exceptions are the same as for convert().
+
+        Returns:
+        - Iterator[str]: The chunks of Markdown text.
+        """
+        yield self.convert(file_stream, stream_info, **kwargs).markdown
@@ -0,0 +1,319 @@
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+
+from ._base_converter import DocumentConverterResult
+from ._stream_utils import read_as_buffer
+
+# Bump this if the layout of cache keys or values changes
+_CACHE_FORMAT_VERSION = 3
+
+
+@dataclass(kw_only=True, frozen=True)
+class CacheStats:
+    """A snapshot of a conversion cache's statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class ConversionCache:
+    """
+    Abstract superclass of conversion caches, which map cache keys (computed by MarkItDown
+    from the input bytes, the hints about the input, the registered converters and the
+    conversion options) to conversion results.
+
+    Subclasses implement _get(), _set() and _sizes(). Implementations must be thread-safe.
+    """
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str, *fallback_keys: str) -> Optional[DocumentConverterResult]:
+        """
+        Return the cached result for the key (or else, for the first of the fallback keys that
+        has one), or None. A single hit or miss is recorded.
+        """
+        result = self._get(key)
+        for fallback_key in fallback_keys:
+            if result is not None:
+                break
+            result = self._get(fallback_key)
+        with self._stats_lock:
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return result
+
+    def set(self, key: str, result: DocumentConverterResult) -> None:
+        """Cache the result under the key, evicting older entries as needed."""
+        self._set(key, result)
+
+    def stats(self) -> CacheStats:
+        """Return the hit and miss counts (since creation), and the current size of the cache."""
+        entries, size_bytes = self._sizes()
+        with self._stats_lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=entries,
+                size_bytes=size_bytes,
+            )
+
+    def _get(self, key: str) -> Optional[DocumentConverterResult]:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def _set(self, key: str, result: DocumentConverterResult) -> None:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def _sizes(self) -> Tuple[int, int]:
+        """Return the number of entries, and their approximate total size in bytes."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class MemoryConversionCache(ConversionCache):
+    """
+    An in-memory, least-recently-used conversion cache, bounded by a number of entries
+    and (optionally) by the total size of the cached Markdown.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None):
+        super().__init__()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[DocumentConverterResult, int]]" = (
+            OrderedDict()
+        )
+        self._size_bytes = 0
+
+    def _get(self, key: str) -> Optional[DocumentConverterResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return _copy_result(entry[0])
+
+    def _set(self, key: str, result: DocumentConverterResult) -> None:
+        size = _result_size(result)
+        if self._max_bytes is not None and size > self._max_bytes:
+            return  # Too large to cache
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+
+            self._entries[key] = (_copy_result(result), size)
+            self._size_bytes += size
+
+            # Evict the least recently used entries
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._size_bytes > self._max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+
+    def _sizes(self) -> Tuple[int, int]:
+        with self._lock:
+            return len(self._entries), self._size_bytes
+
+
+class SqliteConversionCache(ConversionCache):
+    """
+    An on-disk conversion cache, stored in a SQLite database, and bounded by the total size
+    of the cached results. When the bound is exceeded, the least recently used entries are evicted.
+    The database can be shared by several processes.
+
+    The total size is kept up to date by triggers, in a one-row table of the database (so that
+    it stays correct when several processes write), and storing a result does not scan the table.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], max_bytes: int = 1024**3):
+        super().__init__()
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.fspath(path), check_same_thread=False, timeout=30
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS conversions ("
+                " key TEXT PRIMARY KEY,"
+                " markdown TEXT NOT NULL,"
+                " title TEXT,"
+                " size INTEGER NOT NULL,"
+                " accessed REAL NOT NULL,"
+                " metadata TEXT)"
+            )
+            columns = [
+                row[1]
+                for row in self._connection.execute("PRAGMA table_info(conversions)")
+            ]
+            if "metadata" not in columns:
+                # (A database created before results had metadata)
+                self._connection.execute(
+                    "ALTER TABLE conversions ADD COLUMN metadata TEXT"
+                )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS conversions_accessed ON conversions (accessed)"
+            )
+
+            # The running total of the sizes, initialized once (e.g., for databases created
+            # before it existed), then updated on every insert, update and eviction
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS totals ("
+                " id INTEGER PRIMARY KEY CHECK (id = 0),"
+                " size INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO totals (id, size)"
+                " SELECT 0, COALESCE(SUM(size), 0) FROM conversions"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS conversions_insert AFTER INSERT ON conversions"
+                " BEGIN UPDATE totals SET size = size + NEW.size WHERE id = 0; END"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS conversions_update AFTER UPDATE OF size ON conversions"
+                " BEGIN UPDATE totals SET size = size - OLD.size + NEW.size WHERE id = 0; END"
+            )
+            self._connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS conversions_delete AFTER DELETE ON conversions"
+                " BEGIN UPDATE totals SET size = size - OLD.size WHERE id = 0; END"
+            )
+
+    def _get(self, key: str) -> Optional[DocumentConverterResult]:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT markdown, title, metadata FROM conversions WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE conversions SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        return DocumentConverterResult(
+            markdown=row[0],
+            title=row[1],
+            metadata=None if row[2] is None else json.loads(row[2]),
+        )
+
+    def _set(self, key: str, result: DocumentConverterResult) -> None:
+        size = _result_size(result)
+        if size > self._max_bytes:
+            return  # Too large to cache
+
+        try:
+            metadata = json.dumps(result.metadata) if result.metadata else None
+        except (TypeError, ValueError):
+            return  # The metadata cannot be stored
+
+        with self._lock, self._connection:
+            # (An upsert, rather than INSERT OR REPLACE, whose implicit delete fires no trigger)
+            self._connection.execute(
+                "INSERT INTO conversions"
+                " (key, markdown, title, size, accessed, metadata)"
+                " VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET markdown = excluded.markdown,"
+                " title = excluded.title, size = excluded.size, accessed = excluded.accessed,"
+                " metadata = excluded.metadata",
+                (key, result.markdown, result.title, size, time.time(), metadata),
+            )
+
+            # Evict the least recently used entries
+            total = self._total_size()
+            if total > self._max_bytes:
+                rows = self._connection.execute(
+                    "SELECT key, size FROM conversions ORDER BY accessed ASC"
+                )
+                evicted = []
+                for evicted_key, evicted_size in rows:
+                    if total <= self._max_bytes:
+                        break
+                    evicted.append((evicted_key,))
+                    total -= evicted_size
+                self._connection.executemany(
+                    "DELETE FROM conversions WHERE key = ?", evicted
+                )
+
+    def _total_size(self) -> int:
+        (total,) = self._connection.execute(
+            "SELECT size FROM totals WHERE id = 0"
+        ).fetchone()
+        return total
+
+    def _sizes(self) -> Tuple[int, int]:
+        with self._lock:
+            (entries,) = self._connection.execute(
+                "SELECT COUNT(*) FROM conversions"
+            ).fetchone()
+            return entries, self._total_size()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def hash_stream(file_stream: BinaryIO) -> str:
+    """Return the SHA-256 digest of the remainder of the stream, leaving its position unchanged."""
+    digest = hashlib.sha256()
+    cur_pos = file_stream.tell()
+    try:
+        buffer = read_as_buffer(file_stream)
+        if isinstance(buffer, memoryview):
+            # Hash the view directly, without copying the content
+            with buffer:
+                digest.update(buffer)
+        else:
+            digest.update(buffer)
+    finally:
+        file_stream.seek(cur_pos)
+    return digest.hexdigest()
+
+
+def make_cache_key(content_digest: str, fields: Dict[str, Any]) -> Optional[str]:
+    """
+    Combine the digest of the input bytes with everything else that can affect the result
+    (hints, converters, options). Returns None if the fields cannot be serialized (e.g., they
+    include a client object), in which case the conversion should not be cached.
+    """
+    try:
+        serialized = json.dumps(
+            [_CACHE_FORMAT_VERSION, content_digest, fields],
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _copy_result(result: DocumentConverterResult) -> DocumentConverterResult:
+    # Results are mutable, so the cache never shares them with callers. Strings are copied as
+    # plain str, since some converters return str subclasses that reference a whole parse tree.
+    return DocumentConverterResult(
+        markdown=str(result.markdown),
+        title=None if result.title is None else str(result.title),
+        metadata=copy.deepcopy(result.metadata),
+    )
+
+
+def _result_size(result: DocumentConverterResult) -> int:
+    return len(result.markdown.encode("utf-8")) + len(
+        (result.title or "").encode("utf-8")
+    )
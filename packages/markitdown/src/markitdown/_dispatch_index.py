@@ -0,0 +1,225 @@
+import codecs
+import re
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from ._stream_info import StreamInfo
+
+# Break otherwise circular import for type hinting
+if TYPE_CHECKING:
+    from ._base_converter import DocumentConverter
+    from ._markitdown import ConverterRegistration
+
+# Upper bound on the number of (extension, mimetype, url) combinations whose candidates are memoized
+_MAX_CACHED_CANDIDATES = 1024
+
+
+@dataclass(kw_only=True, frozen=True)
+class DispatchHints:
+    """
+    A static description of the inputs a DocumentConverter can accept, used to
+    build MarkItDown's dispatch index.
+
+    Hints are a promise about accepts(): if a stream matches none of the listed
+    extensions or mimetype prefixes (or, when url_patterns is given, its url does
+    not match any of the patterns), then accepts() returns False. Converters whose
+    accepts() also looks at the stream content, the charset, or anything else
+    should not declare hints; they are then probed for every input.
+
+    Fields:
+    - extensions: File extensions, including the leading dot (e.g., ".pdf").
+    - mimetype_prefixes: Mimetype prefixes (e.g., "text/html", "application/vnd.ms-excel").
+    - url_patterns: Regular expressions, at least one of which must match (re.search) the stream's url.
+    """
+
+    extensions: Sequence[str] = ()
+    mimetype_prefixes: Sequence[str] = ()
+    url_patterns: Sequence[str] = ()
+
+
+def _get_trusted_hints(converter: Any) -> Optional[DispatchHints]:
+    """
+    Return the converter's DispatchHints, but only if they were declared by a class at
+    least as derived as the one implementing accepts(). This keeps subclasses that
+    override accepts() (e.g., a plugin extending HtmlConverter) from inheriting hints
+    that no longer describe them.
+    """
+    hints_owner = _get_defining_class(converter, "dispatch_hints")
+    accepts_owner = _get_defining_class(converter, "accepts")
+    if hints_owner is None or accepts_owner is None:
+        return None
+    if not issubclass(hints_owner, accepts_owner):
+        return None
+
+    hints = converter.dispatch_hints()
+    if hints is None:
+        return None
+    assert isinstance(hints, DispatchHints)
+    return hints
+
+
+def _get_defining_class(obj: Any, name: str) -> Optional[type]:
+    for klass in type(obj).__mro__:
+        if name in vars(klass):
+            return klass
+    return None
+
+
+class DispatchIndex:
+    """
+    Maps normalized extensions, mimetype prefixes and url patterns to the converter
+    registrations that might accept a stream. The index is built from a snapshot of
+    the registrations (sorted by priority), and must be rebuilt if they change.
+    """
+
+    def __init__(self, registrations: Sequence["ConverterRegistration"]):
+        # The sort is guaranteed to be stable, so converters with the same priority will remain in the same order.
+        self.sorted_registrations: List["ConverterRegistration"] = sorted(
+            registrations, key=lambda x: x.priority
+        )
+
+        # Positions (in sorted_registrations) of converters without hints. These are always candidates.
+        self._unindexed: Set[int] = set()
+        self._by_extension: Dict[str, Set[int]] = {}
+        self._by_mimetype_prefix: Dict[str, Set[int]] = {}
+        self._url_patterns: Dict[int, List[Pattern[str]]] = {}
+        self._candidates_cache: Dict[Tuple[str, str, str], Tuple[int, ...]] = {}
+
+        for position, registration in enumerate(self.sorted_registrations):
+            hints = _get_trusted_hints(registration.converter)
+            if hints is None:
+                self._unindexed.add(position)
+                continue
+
+            for extension in hints.extensions:
+                self._by_extension.setdefault(extension.lower(), set()).add(position)
+
+            for prefix in hints.mimetype_prefixes:
+                self._by_mimetype_prefix.setdefault(prefix.lower(), set()).add(position)
+
+            if len(hints.url_patterns) > 0:
+                self._url_patterns[position] = [
+                    re.compile(pattern) for pattern in hints.url_patterns
+                ]
+
+    def plan(self, stream_info: StreamInfo) -> Iterator["ConverterRegistration"]:
+        """
+        Yield all registrations in the order in which they should be probed for the
+        given stream_info: first the candidates selected by the index, then (as a
+        fallback) all remaining registrations. Each group retains priority order.
+        """
+        candidates = self.candidates(stream_info)
+        for position in candidates:
+            yield self.sorted_registrations[position]
+
+        # Only reached if none of the candidates produced a result
+        if len(candidates) < len(self.sorted_registrations):
+            selected = set(candidates)
+            for position, registration in enumerate(self.sorted_registrations):
+                if position not in selected:
+                    yield registration
+
+    def candidates(self, stream_info: StreamInfo) -> Tuple[int, ...]:
+        """
+        Return the sorted positions of the registrations whose hints match the
+        stream_info, together with those of all converters that declared no hints.
+        """
+        extension = (stream_info.extension or "").lower()
+        mimetype = (stream_info.mimetype or "").lower()
+        url = stream_info.url or ""
+
+        key = (extension, mimetype, url)
+        cached = self._candidates_cache.get(key)
+        if cached is not None:
+            return cached
+
+        positions = set(self._unindexed)
+
+        if extension in self._by_extension:
+            positions.update(self._by_extension[extension])
+
+        if mimetype:
+            for prefix, prefix_positions in self._by_mimetype_prefix.items():
+                if mimetype.startswith(prefix):
+                    positions.update(prefix_positions)
+
+        # Drop candidates that are gated on a url that doesn't match
+        for position, patterns in self._url_patterns.items():
+            if position in positions and not any(p.search(url) for p in patterns):
+                positions.discard(position)
+
+        candidates = tuple(sorted(positions))
+        if len(self._candidates_cache) >= _MAX_CACHED_CANDIDATES:
+            self._candidates_cache.clear()
+        self._candidates_cache[key] = candidates
+        return candidates
+
+
+def _normalize_charset(charset: Optional[str]) -> Optional[str]:
+    if charset is None:
+        return None
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return charset.lower()
+
+
+class AttemptPlanner:
+    """
+    Plans the (guess, converter) pairs tried by a single conversion, so that no work is repeated:
+
+    - Guesses that are equivalent (same mimetype and extension, ignoring case, same charset once
+      normalized, and same filename, local_path and url) are only tried once, since converters
+      would answer them identically.
+    - A converter whose convert() failed is not attempted again on the same bytes, under a later
+      guess. The charset is the exception: text converters decode the stream with it, so a
+      different charset can succeed where another failed.
+    """
+
+    def __init__(self, dispatch_index: DispatchIndex):
+        self._dispatch_index = dispatch_index
+        self._failed: Set[Tuple[int, Optional[str]]] = set()
+        self.guesses_tried = 0
+
+    def guesses(
+        self, stream_info_guesses: Sequence[StreamInfo]
+    ) -> Iterator[StreamInfo]:
+        """Yield the distinct guesses, followed by an empty StreamInfo (the last resort)."""
+        seen: Set[Tuple[Optional[str], ...]] = set()
+        for stream_info in list(stream_info_guesses) + [StreamInfo()]:
+            key = (
+                (stream_info.mimetype or "").lower(),
+                (stream_info.extension or "").lower(),
+                _normalize_charset(stream_info.charset),
+                stream_info.filename,
+                stream_info.local_path,
+                stream_info.url,
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+            self.guesses_tried += 1
+            yield stream_info
+
+    def converters(self, stream_info: StreamInfo) -> Iterator["ConverterRegistration"]:
+        """Yield the registrations to probe for the guess, skipping those that already failed."""
+        charset = _normalize_charset(stream_info.charset)
+        for registration in self._dispatch_index.plan(stream_info):
+            if (id(registration.converter), charset) not in self._failed:
+                yield registration
+
+    def record_failure(
+        self, converter: "DocumentConverter", stream_info: StreamInfo
+    ) -> None:
+        self._failed.add((id(converter), _normalize_charset(stream_info.charset)))
@@ -39,6 +39,28 @@ class UnsupportedFormatException(MarkItDownException):
     pass
 
 
+class ResourceLimitExceededException(MarkItDownException):
+    """
+    Thrown when a conversion run under resource limits (see ResourceLimits) exceeds one of
+    them. limit is the name of the limit ("timeout", "max_rss_bytes" or "max_output_chars"),
+    and value is the value that exceeded it.
+    """
+
+    def __init__(self, message: str, *, limit: str, value: Any):
+        super().__init__(message)
+        self.limit = limit
+        self.value = value
+
+    def __reduce__(self):
+        return (_rebuild_resource_limit_exception, (str(self), self.limit, self.value))
+
+
+def _rebuild_resource_limit_exception(
+    message: str, limit: str, value: Any
+) -> ResourceLimitExceededException:
+    return ResourceLimitExceededException(message, limit=limit, value=value)
+
+
 class FailedConversionAttempt(object):
     """
     Represents an a single attempt to convert a file.
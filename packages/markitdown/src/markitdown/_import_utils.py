@@ -0,0 +1,42 @@
+import sys
+import threading
+from types import TracebackType
+from typing import Callable, Optional, Tuple, Type
+
+ExcInfo = Tuple[Type[BaseException], BaseException, TracebackType]
+
+
+class OptionalDependencies:
+    """
+    Imports a module's optional dependencies on first use, rather than when the module is
+    imported, so that `import markitdown` does not pay for libraries (pandas, python-pptx,
+    the Azure SDK, etc.) that the process may never use.
+
+    import_dependencies() performs the imports (declaring the imported names global, so that
+    the rest of the module can use them as usual). It is called at most once. As with imports
+    at module load time, an ImportError is saved, and reported by the caller when the
+    dependencies are actually needed.
+    """
+
+    def __init__(self, import_dependencies: Callable[[], None]):
+        self._import_dependencies = import_dependencies
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._exc_info: Optional[ExcInfo] = None
+
+    def load(self) -> Optional[ExcInfo]:
+        """
+        Import the dependencies, if not already done. Returns the sys.exc_info() of the
+        ImportError if they are missing, or None if they are available.
+        """
+        if not self._loaded:
+            with self._lock:
+                # Another thread may have loaded the dependencies while we waited
+                if not self._loaded:
+                    try:
+                        self._import_dependencies()
+                    except ImportError:
+                        # Preserve the error and stack trace for later
+                        self._exc_info = sys.exc_info()  # type: ignore[assignment]
+                    self._loaded = True
+        return self._exc_info
@@ -0,0 +1,179 @@
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Union
+
+from .__about__ import __version__
+from ._exceptions import MissingDependencyException
+
+
+class ConversionStage:
+    """
+    A timed stage of a conversion, as reported to a ConversionObserver. Stages nest: the
+    "convert" stage of each conversion encloses its "fetch", "buffer", "cache_lookup",
+    "identify", "accepts", "attempt" and "normalize" stages (and nested conversions, e.g.,
+    of the members of a ZIP file, are stages of the enclosing "attempt").
+
+    start_time is a time.perf_counter() value. duration (in seconds) and error (the exception
+    that ended the stage, if any) are set when the stage finishes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        observer: "ConversionObserver",
+        attributes: Dict[str, Any],
+    ):
+        self.name = name
+        self.attributes = attributes
+        self.parent: Optional[ConversionStage] = None
+        self.start_time: float = 0.0
+        self.duration: Optional[float] = None
+        self.error: Optional[BaseException] = None
+        self._observer = observer
+        self._token: Any = None
+
+    def set(self, key: str, value: Any) -> None:
+        """Set an attribute of the stage (e.g., the converter chosen, or the output size)."""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "ConversionStage":
+        self.parent = _current_stage.get()
+        self._token = _current_stage.set(self)
+        self.start_time = time.perf_counter()
+        self._observer.stage_started(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.duration = time.perf_counter() - self.start_time
+        self.error = exc_value
+        _current_stage.reset(self._token)
+        self._observer.stage_finished(self)
+        return False
+
+    def __repr__(self) -> str:
+        return f"ConversionStage({self.name!r}, {self.attributes!r})"
+
+
+class _NullStage:
+    """Stands in for a ConversionStage when no observer is attached, at (almost) no cost."""
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullStage":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+
+NULL_STAGE = _NullStage()
+
+# The innermost stage being timed in the current thread (or task)
+_current_stage: ContextVar[Optional[ConversionStage]] = ContextVar(
+    "markitdown_current_stage", default=None
+)
+
+
+def current_stage() -> Union[ConversionStage, _NullStage]:
+    """Return the innermost stage being timed, so deeper code can annotate it."""
+    stage = _current_stage.get()
+    return NULL_STAGE if stage is None else stage
+
+
+class ConversionObserver:
+    """
+    Receives the timed stages and counters of conversions, when passed to MarkItDown(observer=...).
+    Override any of the methods (which do nothing by default).
+
+    A shared MarkItDown instance reports concurrent conversions from many threads, so
+    implementations must be thread-safe. They are called synchronously, so they should be quick.
+
+    Counters:
+    - "conversions": 1 per completed conversion (attributes: converter)
+    - "input_bytes": the size of each converted input
+    - "output_chars": the length of each Markdown output
+    - "failed_attempts": 1 per converter that accepted the input, but raised (attributes: converter)
+    """
+
+    def stage_started(self, stage: ConversionStage) -> None:
+        pass
+
+    def stage_finished(self, stage: ConversionStage) -> None:
+        pass
+
+    def counter_added(
+        self, name: str, value: Union[int, float], attributes: Dict[str, Any]
+    ) -> None:
+        pass
+
+
+class OpenTelemetryObserver(ConversionObserver):
+    """
+    Reports stages as OpenTelemetry spans (named "markitdown.<stage>"), and counters as
+    OpenTelemetry counters (named "markitdown.<counter>"). Requires opentelemetry-api, which
+    is imported when the observer is created.
+
+    By default, the global tracer provider is used, and counters are not reported. Spans of
+    conversions nest under the span that is current when the conversion starts.
+    """
+
+    def __init__(self, tracer: Any = None, meter: Any = None):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise MissingDependencyException(
+                "OpenTelemetryObserver requires opentelemetry-api. Install it with: pip install opentelemetry-api"
+            )
+        self._trace = trace
+        self._tracer = (
+            trace.get_tracer("markitdown", __version__) if tracer is None else tracer
+        )
+        self._meter = meter
+        self._lock = threading.Lock()
+        self._spans: Dict[int, Any] = {}
+        self._counters: Dict[str, Any] = {}
+
+    def stage_started(self, stage: ConversionStage) -> None:
+        context = None
+        if stage.parent is not None:
+            with self._lock:
+                parent_span = self._spans.get(id(stage.parent))
+            if parent_span is not None:
+                context = self._trace.set_span_in_context(parent_span)
+        span = self._tracer.start_span(f"markitdown.{stage.name}", context=context)
+        with self._lock:
+            self._spans[id(stage)] = span
+
+    def stage_finished(self, stage: ConversionStage) -> None:
+        with self._lock:
+            span = self._spans.pop(id(stage), None)
+        if span is None:
+            return
+        span.set_attributes(_to_otel_attributes(stage.attributes))
+        if stage.error is not None:
+            span.record_exception(stage.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+    def counter_added(
+        self, name: str, value: Union[int, float], attributes: Dict[str, Any]
+    ) -> None:
+        if self._meter is None:
+            return
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._meter.create_counter(f"markitdown.{name}")
+                self._counters[name] = counter
+        counter.add(value, attributes=_to_otel_attributes(attributes))
+
+
+def _to_otel_attributes(attributes: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenTelemetry attribute values must be str, bool, int or float (and not None)."""
+    return {
+        f"markitdown.{k}": (v if isinstance(v, (str, bool, int, float)) else str(v))
+        for k, v in attributes.items()
+        if v is not None
+    }
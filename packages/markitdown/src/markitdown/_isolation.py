@@ -0,0 +1,270 @@
+import io
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from warnings import warn
+
+from ._base_converter import DocumentConverterResult
+from ._exceptions import FileConversionException, ResourceLimitExceededException
+from ._stream_info import StreamInfo
+
+# How often the parent checks the memory of a busy worker, in seconds
+_POLL_INTERVAL = 0.05
+
+# How long a new worker may take to start (and load its Magika model), in seconds. This is
+# not counted in the timeout of the first conversion.
+_STARTUP_TIMEOUT = 120.0
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass(kw_only=True, frozen=True)
+class ResourceLimits:
+    """
+    Limits on each conversion of a MarkItDown instance created with resource_limits=ResourceLimits(...).
+
+    Conversions then run in a pool of (up to max_workers) worker processes, each holding its own
+    MarkItDown instance. If a conversion runs longer than timeout seconds, or its worker's resident
+    memory exceeds max_rss_bytes, the worker is killed (and replaced on the next conversion), and
+    ResourceLimitExceededException is raised. Markdown longer than max_output_chars is discarded
+    by the worker, and also raises ResourceLimitExceededException.
+
+    Workers are recycled after max_conversions_per_worker conversions, to bound the memory that
+    they accumulate (e.g., through caches or leaks in third-party libraries).
+
+    Note that max_rss_bytes includes the baseline of a worker (the interpreter, the imported
+    libraries and the Magika model). It is enforced on platforms where the memory of another
+    process can be read: Linux (/proc), or anywhere psutil is installed.
+    """
+
+    timeout: Optional[float] = None
+    max_rss_bytes: Optional[int] = None
+    max_output_chars: Optional[int] = None
+    max_workers: Optional[int] = None  # Default: the number of CPUs
+    max_conversions_per_worker: Optional[int] = None
+
+
+def _get_rss(pid: int) -> Optional[int]:
+    """Return the resident set size of a process, in bytes, or None if it cannot be read."""
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import psutil
+
+        return psutil.Process(pid).memory_info().rss
+    except Exception:
+        return None
+
+
+def _worker_main(
+    conn: Any, init_kwargs: Dict[str, Any], max_output_chars: Optional[int]
+):
+    """The loop of a worker process: convert the requests received on conn, until told to stop."""
+    from ._markitdown import MarkItDown
+    from ._process_pool import make_sendable, _make_picklable
+
+    # Interrupts are handled by the parent, which kills its busy workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        markitdown = MarkItDown(**init_kwargs)
+        markitdown._magika  # Load the model before the first conversion's clock starts
+    except Exception as e:
+        conn.send(("error", _make_picklable(e)))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        payload, base_guess, kwargs = request
+        try:
+            result = markitdown._guess_and_convert(
+                file_stream=io.BytesIO(payload), base_guess=base_guess, **kwargs
+            )
+            if max_output_chars is not None and len(result.markdown) > max_output_chars:
+                conn.send(("output", len(result.markdown)))
+            else:
+                conn.send(("result", make_sendable(result)))
+        except Exception as e:
+            conn.send(("error", _make_picklable(e)))
+
+
+class _Worker:
+    """A worker process, and the parent's end of the pipe to it."""
+
+    def __init__(
+        self, context: Any, init_kwargs: Dict[str, Any], max_output_chars: Optional[int]
+    ):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, init_kwargs, max_output_chars),
+            name="markitdown-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.conversions = 0
+
+    def stop(self) -> None:
+        """Ask the worker to exit, and kill it if it doesn't."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class IsolatedWorkerPool:
+    """
+    The worker processes of a MarkItDown instance created with resource limits. Thread-safe:
+    each conversion checks out an idle worker (starting one if needed, up to max_workers),
+    or waits for one to be returned.
+    """
+
+    def __init__(self, limits: ResourceLimits, init_kwargs: Dict[str, Any]):
+        from ._process_pool import get_mp_context
+
+        self._limits = limits
+        self._init_kwargs = init_kwargs
+        self._context = get_mp_context()
+        self._slots = threading.BoundedSemaphore(
+            limits.max_workers or os.cpu_count() or 1
+        )
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._closed = False
+        self._warned_rss = False
+
+    def convert(
+        self, payload: bytes, base_guess: StreamInfo, kwargs: Dict[str, Any]
+    ) -> DocumentConverterResult:
+        """Convert the payload in a worker (see MarkItDown._guess_and_convert for the arguments)."""
+        with self._slots:
+            worker = self._checkout()
+            try:
+                if not worker.ready:
+                    kind, value = self._receive(
+                        worker, timeout=_STARTUP_TIMEOUT, max_rss_bytes=None
+                    )
+                    if kind == "error":
+                        raise value
+                    worker.ready = True
+
+                worker.conn.send((payload, base_guess, kwargs))
+                kind, value = self._receive(
+                    worker,
+                    timeout=self._limits.timeout,
+                    max_rss_bytes=self._limits.max_rss_bytes,
+                )
+            except BaseException:
+                # Timeouts, memory violations, crashes, interrupts, etc.
+                worker.kill()
+                raise
+            self._checkin(worker)
+
+        if kind == "error":
+            raise value
+        if kind == "output":
+            raise ResourceLimitExceededException(
+                f"The conversion produced {value} characters of Markdown, more than the limit of {self._limits.max_output_chars}.",
+                limit="max_output_chars",
+                value=value,
+            )
+        return value
+
+    def close(self) -> None:
+        """Stop the idle workers. Busy workers are stopped when their conversion completes."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            if self._closed:
+                raise RuntimeError("The worker pool is closed")
+        return _Worker(self._context, self._init_kwargs, self._limits.max_output_chars)
+
+    def _checkin(self, worker: _Worker) -> None:
+        worker.conversions += 1
+        recycle = (
+            self._limits.max_conversions_per_worker is not None
+            and worker.conversions >= self._limits.max_conversions_per_worker
+        )
+        if not recycle:
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(worker)
+                    return
+        worker.stop()
+
+    def _receive(
+        self,
+        worker: _Worker,
+        *,
+        timeout: Optional[float],
+        max_rss_bytes: Optional[int],
+    ) -> Tuple[str, Any]:
+        """Wait for the worker's reply, enforcing the limits."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = None if max_rss_bytes is None else _POLL_INTERVAL
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ResourceLimitExceededException(
+                        f"The conversion did not complete within {timeout} seconds.",
+                        limit="timeout",
+                        value=timeout,
+                    )
+                wait = remaining if wait is None else min(wait, remaining)
+
+            # (poll() also returns when the worker exits, and recv() then raises EOFError)
+            if worker.conn.poll(wait):
+                try:
+                    return worker.conn.recv()
+                except EOFError:
+                    worker.process.join(timeout=1)
+                    raise FileConversionException(
+                        f"The worker process exited unexpectedly (exit code {worker.process.exitcode})."
+                    )
+
+            if max_rss_bytes is not None:
+                rss = _get_rss(worker.process.pid)
+                if rss is None:
+                    if not self._warned_rss:
+                        self._warned_rss = True
+                        warn(
+                            "max_rss_bytes cannot be enforced on this platform. Install psutil to enable it."
+                        )
+                elif rss > max_rss_bytes:
+                    raise ResourceLimitExceededException(
+                        f"The worker process used {rss} bytes of memory, more than the limit of {max_rss_bytes}.",
+                        limit="max_rss_bytes",
+                        value=rss,
+                    )
@@ -1,3 +1,5 @@
+import contextlib
+import contextvars
 import mimetypes
 import os
 import re
@@ -5,19 +7,55 @@ import sys
 import shutil
 import traceback
 import io
+import threading
+import functools
+import itertools
+import weakref
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from importlib.metadata import entry_points
-from typing import Any, List, Dict, Optional, Union, BinaryIO
+from typing import (
+    Any,
+    AsyncContextManager,
+    Callable,
+    ContextManager,
+    List,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    BinaryIO,
+    TYPE_CHECKING,
+)
 from pathlib import Path
 from urllib.parse import urlparse
 from warnings import warn
-import requests
-import magika
-import charset_normalizer
 import codecs
 
 from ._stream_info import StreamInfo
 from ._uri_utils import parse_data_uri, file_uri_to_path
+from ._dispatch_index import AttemptPlanner, DispatchIndex
+from ._text_utils import normalize_markdown, MarkdownNormalizer
+from ._conversion_cache import ConversionCache, hash_stream, make_cache_key
+from ._isolation import ResourceLimits
+from ._instrumentation import (
+    ConversionObserver,
+    ConversionStage,
+    current_stage,
+    NULL_STAGE,
+)
+from .__about__ import __version__
+from ._stream_utils import (
+    open_local_stream,
+    spool_stream,
+    spool_chunks,
+    spool_async_chunks,
+    read_as_buffer,
+    DEFAULT_SPOOL_THRESHOLD,
+    DEFAULT_READ_CHUNK_SIZE,
+)
 
 from .converters import (
     PlainTextConverter,
@@ -49,6 +87,14 @@ from ._exceptions import (
     FailedConversionAttempt,
 )
 
+# Only needed for type hinting here. These are slow to import, so they are imported on first use
+# (see _get_magika, _requests_session, etc.)
+if TYPE_CHECKING:
+    import asyncio
+    import magika
+    import requests
+    from ._isolation import IsolatedWorkerPool
+
 
 # Lower priority values are tried first.
 PRIORITY_SPECIFIC_FILE_FORMAT = (
@@ -58,8 +104,12 @@ PRIORITY_GENERIC_FILE_FORMAT = (
     10.0  # Near catch-all converters for mimetypes like text/*, etc.
 )
 
+# Content sniffing policies (see MarkItDown._convert_with_guesses)
+SNIFF_POLICIES = ("always", "when_ambiguous", "never")
+
 
 _plugins: Union[None, List[Any]] = None  # If None, plugins have not been loaded yet.
+_plugins_lock = threading.Lock()
 
 
 def _load_plugins() -> Union[None, List[Any]]:
@@ -70,18 +120,115 @@ def _load_plugins() -> Union[None, List[Any]]:
     if _plugins is not None:
         return _plugins
 
-    # Load plugins
-    _plugins = []
-    for entry_point in entry_points(group="markitdown.plugin"):
-        try:
-            _plugins.append(entry_point.load())
-        except Exception:
-            tb = traceback.format_exc()
-            warn(f"Plugin '{entry_point.name}' failed to load ... skipping:\n{tb}")
+    with _plugins_lock:
+        # Another thread may have loaded the plugins while we waited
+        if _plugins is None:
+            from importlib.metadata import entry_points
+
+            # Load plugins (published only once complete)
+            plugins = []
+            for entry_point in entry_points(group="markitdown.plugin"):
+                try:
+                    plugins.append(entry_point.load())
+                except Exception:
+                    tb = traceback.format_exc()
+                    warn(
+                        f"Plugin '{entry_point.name}' failed to load ... skipping:\n{tb}"
+                    )
+            _plugins = plugins
 
     return _plugins
 
 
+# The Magika model shared by all instances. If None, the model has not been loaded yet.
+_magika: Union[None, "magika.Magika"] = None
+_magika_lock = threading.Lock()
+
+
+def _get_magika() -> "magika.Magika":
+    """
+    Lazy load the Magika model, exiting early if already loaded. The model is
+    shared by all MarkItDown instances in the process.
+    """
+    global _magika
+
+    # Skip if we've already loaded the model
+    if _magika is not None:
+        return _magika
+
+    with _magika_lock:
+        # Another thread may have loaded the model while we waited
+        if _magika is None:
+            import magika
+
+            _magika = magika.Magika()
+
+    return _magika
+
+
+def _is_requests_response(source: Any) -> bool:
+    """
+    Return isinstance(source, requests.Response), without importing requests. (If requests
+    has not been imported yet, source cannot be a Response.)
+    """
+    requests = sys.modules.get("requests")
+    return requests is not None and isinstance(source, requests.Response)
+
+
+def _remaining_size(file_stream: BinaryIO) -> Optional[int]:
+    """The number of bytes from the current position to the end of a seekable stream."""
+    try:
+        cur_pos = file_stream.tell()
+        size = file_stream.seek(0, os.SEEK_END) - cur_pos
+        file_stream.seek(cur_pos)
+        return size
+    except (OSError, ValueError):
+        return None
+
+
+def _llm_client_identity(llm_client: Any) -> Optional[List[Optional[str]]]:
+    """
+    Identify an LLM client in cache keys, by its type and (e.g., for OpenAI clients) its base URL.
+    Clients of the same type and base URL share cache entries, even if they differ otherwise (e.g.,
+    in their credentials, or their default headers). Use separate caches for such clients.
+    """
+    if llm_client is None:
+        return None
+    base_url = getattr(llm_client, "base_url", None)
+    return [
+        f"{type(llm_client).__module__}.{type(llm_client).__qualname__}",
+        None if base_url is None else str(base_url),
+    ]
+
+
+@functools.lru_cache(maxsize=8)
+def _find_exiftool(search_path: Optional[str]) -> Optional[str]:
+    """
+    Look for exiftool in well-known locations on the search path. Results are
+    memoized (per PATH value), since scanning the path dominates MarkItDown
+    construction time.
+    """
+    candidate = shutil.which("exiftool", path=search_path)
+    if candidate:
+        candidate = os.path.abspath(candidate)
+        if any(
+            d == os.path.dirname(candidate)
+            for d in [
+                "/usr/bin",
+                "/usr/local/bin",
+                "/opt",
+                "/opt/bin",
+                "/opt/local/bin",
+                "/opt/homebrew/bin",
+                "C:\\Windows\\System32",
+                "C:\\Program Files",
+                "C:\\Program Files (x86)",
+            ]
+        ):
+            return candidate
+    return None
+
+
 @dataclass(kw_only=True, frozen=True)
 class ConverterRegistration:
     """A registration of a converter with its priority and other metadata."""
@@ -92,7 +239,12 @@ class ConverterRegistration:
 
 class MarkItDown:
     """(In preview) An extremely simple text-based document reader, suitable for LLM use.
-    This reader will convert common file-types or webpages to Markdown."""
+    This reader will convert common file-types or webpages to Markdown.
+
+    Instances are thread-safe: once constructed (and once any converters are registered), one
+    instance can be shared by many threads converting concurrently. The requests session, the
+    Magika model and the converters are shared, and built-in converters keep no per-call state.
+    """
 
     def __init__(
         self,
@@ -104,13 +256,54 @@ class MarkItDown:
         self._builtins_enabled = False
         self._plugins_enabled = False
 
-        requests_session = kwargs.get("requests_session")
-        if requests_session is None:
-            self._requests_session = requests.Session()
-        else:
-            self._requests_session = requests_session
+        # Guards the state that is created lazily, on first use (the requests session, etc.)
+        self._lazy_init_lock = threading.Lock()
+
+        # Kept to create equivalent instances in worker processes (see convert_many)
+        self._init_kwargs: Dict[str, Any] = dict(kwargs)
 
-        self._magika = magika.Magika()
+        # If no session is provided, one is created on first use (see _requests_session)
+        self._provided_requests_session: Optional[requests.Session] = kwargs.get(
+            "requests_session"
+        )
+
+        # A preloaded magika.Magika instance can be injected. Otherwise, the shared
+        # process-wide instance is loaded the first time it is needed.
+        self._injected_magika: Union[None, "magika.Magika"] = kwargs.get("magika")
+
+        # When to sniff the stream content (with Magika and charset detection)
+        self._sniff: str = self._validate_sniff(kwargs.get("sniff", "always"))
+
+        # Non-seekable streams and HTTP responses are buffered in memory up to spool_threshold
+        # bytes, and spilled to a temporary file beyond that. They are read read_chunk_size bytes at a time.
+        self._spool_threshold: int = kwargs.get(
+            "spool_threshold", DEFAULT_SPOOL_THRESHOLD
+        )
+        self._read_chunk_size: int = kwargs.get(
+            "read_chunk_size", DEFAULT_READ_CHUNK_SIZE
+        )
+
+        # An optional cache of conversion results, keyed by the input bytes (see _get_cache_keys)
+        self._cache: Optional[ConversionCache] = kwargs.get("cache")
+
+        # Used by the async API (see convert_async): An httpx.AsyncClient-compatible client to
+        # fetch http(s) uris, the executor on which to run conversions (default: the event loop's
+        # default executor), and a limit on the number of concurrent conversions.
+        self._async_http_client: Any = kwargs.get("async_http_client")
+        self._executor: Optional[Executor] = kwargs.get("executor")
+        self._max_concurrency: Optional[int] = kwargs.get("max_concurrency")
+        self._async_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+        # An optional observer of the timed stages and counters of conversions. When None,
+        # the stages are not timed (see _stage).
+        self._observer: Optional[ConversionObserver] = kwargs.get("observer")
+
+        # Optional limits on each conversion, which then runs in a worker process (see ResourceLimits).
+        # The workers are started on first use (see _isolated_workers).
+        self._resource_limits: Optional[ResourceLimits] = kwargs.get("resource_limits")
+        self._worker_pool: Optional[IsolatedWorkerPool] = None
 
         # TODO - remove these (see enable_builtins)
         self._llm_client: Any = None
@@ -120,6 +313,8 @@ class MarkItDown:
 
         # Register the converters
         self._converters: List[ConverterRegistration] = []
+        self._dispatch_index: Optional[DispatchIndex] = None
+        self._converters_signature: Optional[List[Any]] = None
 
         if (
             enable_builtins is None or enable_builtins
@@ -129,6 +324,41 @@ class MarkItDown:
         if enable_plugins:
             self.enable_plugins(**kwargs)
 
+    @property
+    def _requests_session(self) -> "requests.Session":
+        """The requests session used to fetch http: and https: URIs, created on first use."""
+        if self._provided_requests_session is None:
+            with self._lazy_init_lock:
+                if self._provided_requests_session is None:
+                    import requests
+
+                    self._provided_requests_session = requests.Session()
+        return self._provided_requests_session
+
+    @property
+    def _isolated_workers(self) -> "IsolatedWorkerPool":
+        """The worker processes that run conversions under resource limits, created on first use."""
+        if self._worker_pool is None:
+            with self._lazy_init_lock:
+                if self._worker_pool is None:
+                    from ._isolation import IsolatedWorkerPool
+
+                    assert self._resource_limits is not None
+                    worker_pool = IsolatedWorkerPool(
+                        self._resource_limits, self._get_worker_init_kwargs()
+                    )
+                    # Stop the workers when this instance is garbage collected (or at exit)
+                    weakref.finalize(self, worker_pool.close)
+                    self._worker_pool = worker_pool
+        return self._worker_pool
+
+    @property
+    def _magika(self) -> "magika.Magika":
+        """The Magika instance used to identify streams, loaded on first use."""
+        if self._injected_magika is not None:
+            return self._injected_magika
+        return _get_magika()
+
     def enable_builtins(self, **kwargs) -> None:
         """
         Enable and register built-in converters.
@@ -147,24 +377,7 @@ class MarkItDown:
 
             # Still none? Check well-known paths
             if self._exiftool_path is None:
-                candidate = shutil.which("exiftool")
-                if candidate:
-                    candidate = os.path.abspath(candidate)
-                    if any(
-                        d == os.path.dirname(candidate)
-                        for d in [
-                            "/usr/bin",
-                            "/usr/local/bin",
-                            "/opt",
-                            "/opt/bin",
-                            "/opt/local/bin",
-                            "/opt/homebrew/bin",
-                            "C:\\Windows\\System32",
-                            "C:\\Program Files",
-                            "C:\\Program Files (x86)",
-                        ]
-                    ):
-                        self._exiftool_path = candidate
+                self._exiftool_path = _find_exiftool(os.getenv("PATH"))
 
             # Register converters for successful browsing operations
             # Later registrations are tried first / take higher priority than earlier registrations
@@ -242,7 +455,7 @@ class MarkItDown:
 
     def convert(
         self,
-        source: Union[str, requests.Response, Path, BinaryIO],
+        source: Union[str, "requests.Response", Path, BinaryIO],
         *,
         stream_info: Optional[StreamInfo] = None,
         **kwargs: Any,
@@ -251,6 +464,8 @@ class MarkItDown:
         Args:
             - source: can be a path (str or Path), url, or a requests.response object
             - stream_info: optional stream info to use for the conversion. If None, infer from source
+            - sniff: optional override of the content sniffing policy ("always", "when_ambiguous" or "never")
+            - stream_info_guesses: optional guesses precomputed by identify_many(). If provided, the content is not sniffed again
             - kwargs: additional arguments to pass to the converter
         """
 
@@ -276,7 +491,7 @@ class MarkItDown:
         elif isinstance(source, Path):
             return self.convert_local(source, stream_info=stream_info, **kwargs)
         # Request response
-        elif isinstance(source, requests.Response):
+        elif _is_requests_response(source):
             return self.convert_response(source, stream_info=stream_info, **kwargs)
         # Binary stream
         elif (
@@ -297,8 +512,164 @@ class MarkItDown:
         stream_info: Optional[StreamInfo] = None,
         file_extension: Optional[str] = None,  # Deprecated -- use stream_info
         url: Optional[str] = None,  # Deprecated -- use stream_info
+        sniff: Optional[str] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        with self._conversion_stage("local"), self._open_local(
+            path, stream_info=stream_info, file_extension=file_extension, url=url
+        ) as (file_stream, base_guess):
+            return self._convert_with_guesses(
+                file_stream=file_stream, base_guess=base_guess, sniff=sniff, **kwargs
+            )
+
+    def convert_stream(
+        self,
+        stream: BinaryIO,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,  # Deprecated -- use stream_info
+        url: Optional[str] = None,  # Deprecated -- use stream_info
+        sniff: Optional[str] = None,
         **kwargs: Any,
     ) -> DocumentConverterResult:
+        with self._conversion_stage("stream"), self._open_stream(
+            stream, stream_info=stream_info, file_extension=file_extension, url=url
+        ) as (file_stream, base_guess):
+            return self._convert_with_guesses(
+                file_stream=file_stream, base_guess=base_guess, sniff=sniff, **kwargs
+            )
+
+    def convert_url(
+        self,
+        url: str,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,
+        mock_url: Optional[str] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """Alias for convert_uri()"""
+        # convert_url will likely be deprecated in the future in favor of convert_uri
+        return self.convert_uri(
+            url,
+            stream_info=stream_info,
+            file_extension=file_extension,
+            mock_url=mock_url,
+            **kwargs,
+        )
+
+    def convert_uri(
+        self,
+        uri: str,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,  # Deprecated -- use stream_info
+        mock_url: Optional[
+            str
+        ] = None,  # Mock the request as if it came from a different URL
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        with self._conversion_stage("uri"), self._open_uri(
+            uri,
+            stream_info=stream_info,
+            file_extension=file_extension,
+            mock_url=mock_url,
+        ) as (file_stream, base_guess):
+            return self._convert_with_guesses(
+                file_stream=file_stream, base_guess=base_guess, **kwargs
+            )
+
+    def convert_response(
+        self,
+        response: "requests.Response",
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,  # Deprecated -- use stream_info
+        url: Optional[str] = None,  # Deprecated -- use stream_info
+        sniff: Optional[str] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        with self._conversion_stage("response"), self._open_response(
+            response, stream_info=stream_info, file_extension=file_extension, url=url
+        ) as (file_stream, base_guess):
+            return self._convert_with_guesses(
+                file_stream=file_stream, base_guess=base_guess, sniff=sniff, **kwargs
+            )
+
+    def convert_iter(
+        self,
+        source: Union[str, "requests.Response", Path, BinaryIO],
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Like convert(), but yield the (normalized) Markdown in chunks, as it is produced. Converters with
+        a native convert_iter() (e.g., PDF, PowerPoint, Excel, ZIP and EPUB) yield at natural boundaries
+        like pages, slides, sheets, archive members, or chapters. Others yield a single chunk.
+
+        The concatenated chunks are the same as the Markdown of convert(). Errors raised before the
+        first chunk is produced (e.g., UnsupportedFormatException) are raised by the first call to next().
+
+        The source is held open until the iterator is exhausted or closed. With a cache, hits are yielded
+        as a single chunk, and (since the Markdown is never held in full) misses are not cached.
+
+        With an observer, the stages up to the first chunk are reported, without an enclosing "convert" stage.
+        """
+        # Deprecated -- use stream_info
+        file_extension: Optional[str] = kwargs.pop("file_extension", None)
+        url: Optional[str] = kwargs.pop("url", None)
+        mock_url: Optional[str] = kwargs.pop("mock_url", url)
+
+        opened: ContextManager[Tuple[BinaryIO, StreamInfo]]
+        if isinstance(source, str) and (
+            source.startswith("http:")
+            or source.startswith("https:")
+            or source.startswith("file:")
+            or source.startswith("data:")
+        ):
+            opened = self._open_uri(
+                source,
+                stream_info=stream_info,
+                file_extension=file_extension,
+                mock_url=mock_url,
+            )
+        elif isinstance(source, (str, Path)):
+            opened = self._open_local(
+                source, stream_info=stream_info, file_extension=file_extension, url=url
+            )
+        elif _is_requests_response(source):
+            opened = self._open_response(
+                source, stream_info=stream_info, file_extension=file_extension, url=url
+            )
+        elif (
+            hasattr(source, "read")
+            and callable(source.read)
+            and not isinstance(source, io.TextIOBase)
+        ):
+            opened = self._open_stream(
+                source, stream_info=stream_info, file_extension=file_extension, url=url
+            )
+        else:
+            raise TypeError(
+                f"Invalid source type: {type(source)}. Expected str, requests.Response, BinaryIO."
+            )
+
+        with opened as (file_stream, base_guess):
+            yield from self._convert_iter_with_guesses(
+                file_stream=file_stream, base_guess=base_guess, **kwargs
+            )
+
+    @contextlib.contextmanager
+    def _open_local(
+        self,
+        path: Union[str, Path],
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,  # Deprecated -- use stream_info
+        url: Optional[str] = None,  # Deprecated -- use stream_info
+    ) -> Iterator[Tuple[BinaryIO, StreamInfo]]:
+        """Open a local file, and yield it with a base guess of its stream info."""
         if isinstance(path, Path):
             path = str(path)
 
@@ -321,23 +692,20 @@ class MarkItDown:
             # Deprecated -- use stream_info
             base_guess = base_guess.copy_and_update(url=url)
 
-        with open(path, "rb") as fh:
-            guesses = self._get_stream_info_guesses(
-                file_stream=fh, base_guess=base_guess
-            )
-            return self._convert(file_stream=fh, stream_info_guesses=guesses, **kwargs)
+        # Memory-map the file when possible, so converters can view its content without copying it
+        with open_local_stream(path) as fh:
+            yield fh, base_guess
 
-    def convert_stream(
+    @contextlib.contextmanager
+    def _open_stream(
         self,
         stream: BinaryIO,
         *,
         stream_info: Optional[StreamInfo] = None,
         file_extension: Optional[str] = None,  # Deprecated -- use stream_info
         url: Optional[str] = None,  # Deprecated -- use stream_info
-        **kwargs: Any,
-    ) -> DocumentConverterResult:
-        guesses: List[StreamInfo] = []
-
+    ) -> Iterator[Tuple[BinaryIO, StreamInfo]]:
+        """Yield a seekable version of the stream, with a base guess of its stream info."""
         # Do we have anything on which to base a guess?
         base_guess = None
         if stream_info is not None or file_extension is not None or url is not None:
@@ -357,43 +725,21 @@ class MarkItDown:
                 assert base_guess is not None  # for mypy
                 base_guess = base_guess.copy_and_update(url=url)
 
-        # Check if we have a seekable stream. If not, load the entire stream into memory.
+        # Check if we have a seekable stream. If not, buffer the entire stream (spilling to disk if large).
         if not stream.seekable():
-            buffer = io.BytesIO()
-            while True:
-                chunk = stream.read(4096)
-                if not chunk:
-                    break
-                buffer.write(chunk)
-            buffer.seek(0)
-            stream = buffer
-
-        # Add guesses based on stream content
-        guesses = self._get_stream_info_guesses(
-            file_stream=stream, base_guess=base_guess or StreamInfo()
-        )
-        return self._convert(file_stream=stream, stream_info_guesses=guesses, **kwargs)
-
-    def convert_url(
-        self,
-        url: str,
-        *,
-        stream_info: Optional[StreamInfo] = None,
-        file_extension: Optional[str] = None,
-        mock_url: Optional[str] = None,
-        **kwargs: Any,
-    ) -> DocumentConverterResult:
-        """Alias for convert_uri()"""
-        # convert_url will likely be deprecated in the future in favor of convert_uri
-        return self.convert_uri(
-            url,
-            stream_info=stream_info,
-            file_extension=file_extension,
-            mock_url=mock_url,
-            **kwargs,
-        )
+            with self._stage("buffer"):
+                buffer = spool_stream(
+                    stream,
+                    spool_threshold=self._spool_threshold,
+                    chunk_size=self._read_chunk_size,
+                )
+            with buffer:
+                yield buffer, base_guess or StreamInfo()
+        else:
+            yield stream, base_guess or StreamInfo()
 
-    def convert_uri(
+    @contextlib.contextmanager
+    def _open_uri(
         self,
         uri: str,
         *,
@@ -402,10 +748,12 @@ class MarkItDown:
         mock_url: Optional[
             str
         ] = None,  # Mock the request as if it came from a different URL
-        **kwargs: Any,
-    ) -> DocumentConverterResult:
+    ) -> Iterator[Tuple[BinaryIO, StreamInfo]]:
+        """Open (or fetch) the resource described by the uri, and yield it with a base guess of its stream info."""
         uri = uri.strip()
 
+        opened: ContextManager[Tuple[BinaryIO, StreamInfo]]
+
         # File URIs
         if uri.startswith("file:"):
             netloc, path = file_uri_to_path(uri)
@@ -413,12 +761,11 @@ class MarkItDown:
                 raise ValueError(
                     f"Unsupported file URI: {uri}. Netloc must be empty or localhost."
                 )
-            return self.convert_local(
+            opened = self._open_local(
                 path,
                 stream_info=stream_info,
                 file_extension=file_extension,
                 url=mock_url,
-                **kwargs,
             )
         # Data URIs
         elif uri.startswith("data:"):
@@ -431,44 +778,79 @@ class MarkItDown:
             if stream_info is not None:
                 base_guess = base_guess.copy_and_update(stream_info)
 
-            return self.convert_stream(
+            opened = self._open_stream(
                 io.BytesIO(data),
                 stream_info=base_guess,
                 file_extension=file_extension,
                 url=mock_url,
-                **kwargs,
             )
         # HTTP/HTTPS URIs
         elif uri.startswith("http:") or uri.startswith("https:"):
-            response = self._requests_session.get(uri, stream=True)
-            response.raise_for_status()
-            return self.convert_response(
+            with self._stage("fetch", uri=uri) as stage:
+                response = self._requests_session.get(uri, stream=True)
+                stage.set("status_code", response.status_code)
+                response.raise_for_status()
+            opened = self._open_response(
                 response,
                 stream_info=stream_info,
                 file_extension=file_extension,
                 url=mock_url,
-                **kwargs,
             )
         else:
             raise ValueError(
                 f"Unsupported URI scheme: {uri.split(':')[0]}. Supported schemes are: file:, data:, http:, https:"
             )
 
-    def convert_response(
+        with opened as (file_stream, base_guess):
+            yield file_stream, base_guess
+
+    @contextlib.contextmanager
+    def _open_response(
         self,
-        response: requests.Response,
+        response: "requests.Response",
         *,
         stream_info: Optional[StreamInfo] = None,
         file_extension: Optional[str] = None,  # Deprecated -- use stream_info
         url: Optional[str] = None,  # Deprecated -- use stream_info
-        **kwargs: Any,
-    ) -> DocumentConverterResult:
+    ) -> Iterator[Tuple[BinaryIO, StreamInfo]]:
+        """Read the body of the response into a buffer, and yield it with a base guess of its stream info."""
+        base_guess = self._get_response_base_guess(
+            response.headers,
+            response.url,
+            stream_info=stream_info,
+            file_extension=file_extension,
+            url=url,
+        )
+
+        # Read into a buffer (spilling to disk if large)
+        with self._stage("buffer"):
+            buffer = spool_chunks(
+                response.iter_content(chunk_size=self._read_chunk_size),
+                spool_threshold=self._spool_threshold,
+                expected_size=self._get_expected_body_size(response.headers),
+            )
+        with buffer:
+            yield buffer, base_guess
+
+    def _get_response_base_guess(
+        self,
+        headers: Mapping[str, str],
+        response_url: str,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,  # Deprecated -- use stream_info
+        url: Optional[str] = None,  # Deprecated -- use stream_info
+    ) -> StreamInfo:
+        """
+        Build a base guess from the headers and url of an HTTP response (from requests or an
+        async HTTP client), updated with any stream info provided by the caller.
+        """
         # If there is a content-type header, get the mimetype and charset (if present)
         mimetype: Optional[str] = None
         charset: Optional[str] = None
 
-        if "content-type" in response.headers:
-            parts = response.headers["content-type"].split(";")
+        if "content-type" in headers:
+            parts = headers["content-type"].split(";")
             mimetype = parts.pop(0).strip()
             for part in parts:
                 if part.strip().startswith("charset="):
@@ -479,8 +861,8 @@ class MarkItDown:
         # If there is a content-disposition header, get the filename and possibly the extension
         filename: Optional[str] = None
         extension: Optional[str] = None
-        if "content-disposition" in response.headers:
-            m = re.search(r"filename=([^;]+)", response.headers["content-disposition"])
+        if "content-disposition" in headers:
+            m = re.search(r"filename=([^;]+)", headers["content-disposition"])
             if m:
                 filename = m.group(1).strip("\"'")
                 _, _extension = os.path.splitext(filename)
@@ -489,7 +871,7 @@ class MarkItDown:
 
         # If there is still no filename, try to read it from the url
         if filename is None:
-            parsed_url = urlparse(response.url)
+            parsed_url = urlparse(response_url)
             _, _extension = os.path.splitext(parsed_url.path)
             if len(_extension) > 0:  # Looks like this might be a file!
                 filename = os.path.basename(parsed_url.path)
@@ -501,7 +883,7 @@ class MarkItDown:
             charset=charset,
             filename=filename,
             extension=extension,
-            url=response.url,
+            url=response_url,
         )
 
         # Update with any additional info from the arguments
@@ -514,74 +896,738 @@ class MarkItDown:
             # Deprecated -- use stream_info
             base_guess = base_guess.copy_and_update(url=url)
 
-        # Read into BytesIO
-        buffer = io.BytesIO()
-        for chunk in response.iter_content(chunk_size=512):
-            buffer.write(chunk)
-        buffer.seek(0)
+        return base_guess
+
+    def _get_expected_body_size(self, headers: Mapping[str, str]) -> Optional[int]:
+        """
+        Return the Content-Length, which is the size of the body we will read, unless it is
+        compressed (HTTP clients transparently decode the content).
+        """
+        if headers.get("content-encoding", "identity").lower() == "identity":
+            try:
+                return int(headers["content-length"])
+            except (KeyError, ValueError):
+                pass
+        return None
+
+    async def convert_async(
+        self,
+        source: Union[str, "requests.Response", Path, BinaryIO],
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """
+        Asynchronous version of convert(). Http(s) uris are fetched without blocking the event loop
+        (see convert_uri_async), and conversions run on the executor passed to the constructor (or,
+        by default, on the event loop's default executor).
+
+        If the MarkItDown instance was created with max_concurrency, at most that many conversions
+        run at once (per event loop); the others wait for a free slot.
+
+        Cancelling the task cancels any pending wait or download. A conversion that has already started
+        on the executor runs to completion, but its result is discarded.
+        """
+        if isinstance(source, str) and (
+            source.startswith("http:") or source.startswith("https:")
+        ):
+            # Rename the url argument to mock_url (see convert)
+            _kwargs = {k: v for k, v in kwargs.items()}
+            if "url" in _kwargs:
+                _kwargs["mock_url"] = _kwargs["url"]
+                del _kwargs["url"]
+            return await self.convert_uri_async(
+                source, stream_info=stream_info, **_kwargs
+            )
+
+        async with self._async_slot():
+            return await self._run_in_executor(
+                functools.partial(
+                    self.convert, source, stream_info=stream_info, **kwargs
+                )
+            )
+
+    async def convert_uri_async(
+        self,
+        uri: str,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,  # Deprecated -- use stream_info
+        mock_url: Optional[
+            str
+        ] = None,  # Mock the request as if it came from a different URL
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """
+        Asynchronous version of convert_uri() (see convert_async).
+
+        Http(s) uris are fetched with the async_http_client passed to the constructor, which must be
+        compatible with httpx.AsyncClient. Otherwise, if httpx is installed, a client is created for the
+        request. As a last resort, the uri is fetched with requests, on the executor.
+        """
+        uri = uri.strip()
+        if not (uri.startswith("http:") or uri.startswith("https:")):
+            async with self._async_slot():
+                return await self._run_in_executor(
+                    functools.partial(
+                        self.convert_uri,
+                        uri,
+                        stream_info=stream_info,
+                        file_extension=file_extension,
+                        mock_url=mock_url,
+                        **kwargs,
+                    )
+                )
+
+        async with self._async_slot():
+            if self._async_http_client is not None:
+                return await self._fetch_and_convert_async(
+                    self._async_http_client,
+                    uri,
+                    stream_info=stream_info,
+                    file_extension=file_extension,
+                    url=mock_url,
+                    **kwargs,
+                )
+
+            try:
+                import httpx
+            except ImportError:
+                # Fetch (and convert) with requests, without blocking the event loop
+                return await self._run_in_executor(
+                    functools.partial(
+                        self.convert_uri,
+                        uri,
+                        stream_info=stream_info,
+                        file_extension=file_extension,
+                        mock_url=mock_url,
+                        **kwargs,
+                    )
+                )
+
+            async with httpx.AsyncClient(follow_redirects=True) as client:
+                return await self._fetch_and_convert_async(
+                    client,
+                    uri,
+                    stream_info=stream_info,
+                    file_extension=file_extension,
+                    url=mock_url,
+                    **kwargs,
+                )
+
+    async def _fetch_and_convert_async(
+        self,
+        client: Any,
+        uri: str,
+        *,
+        stream_info: Optional[StreamInfo] = None,
+        file_extension: Optional[str] = None,
+        url: Optional[str] = None,
+        sniff: Optional[str] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        with self._conversion_stage("uri"):
+            with self._stage("fetch", uri=uri) as stage:
+                async with client.stream("GET", uri) as response:
+                    stage.set("status_code", response.status_code)
+                    response.raise_for_status()
+                    base_guess = self._get_response_base_guess(
+                        response.headers,
+                        str(response.url),
+                        stream_info=stream_info,
+                        file_extension=file_extension,
+                        url=url,
+                    )
+
+                    # Read into a buffer (spilling to disk if large)
+                    with self._stage("buffer"):
+                        buffer = await spool_async_chunks(
+                            response.aiter_bytes(self._read_chunk_size),
+                            spool_threshold=self._spool_threshold,
+                            expected_size=self._get_expected_body_size(
+                                response.headers
+                            ),
+                        )
+
+            def _convert_buffer() -> DocumentConverterResult:
+                # The buffer is closed by the executor thread, when the conversion is done (even if the
+                # awaiting task was cancelled in the meantime)
+                with buffer:
+                    return self._convert_with_guesses(
+                        file_stream=buffer, base_guess=base_guess, sniff=sniff, **kwargs
+                    )
+
+            return await self._run_in_executor(_convert_buffer)
+
+    async def _run_in_executor(self, func: Callable[[], Any]) -> Any:
+        # (asyncio is imported on first use, since most callers never need it)
+        import asyncio
+
+        # Run in a copy of the current context, so that stages nest across threads (see _stage)
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, context.run, func)
+
+    def _async_slot(self) -> AsyncContextManager[Any]:
+        """Return an async context manager that holds one of the max_concurrency slots, if limited."""
+        if self._max_concurrency is None:
+            return contextlib.nullcontext()
+
+        import asyncio
+
+        # Semaphores are bound to an event loop, so each loop gets its own
+        loop = asyncio.get_running_loop()
+        with self._lazy_init_lock:
+            semaphore = self._async_semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self._max_concurrency)
+                self._async_semaphores[loop] = semaphore
+        return semaphore
+
+    def convert_many(
+        self,
+        sources: Iterable[
+            Union[
+                str,
+                Path,
+                bytes,
+                BinaryIO,
+                Tuple[Union[str, Path, bytes, BinaryIO], StreamInfo],
+            ]
+        ],
+        *,
+        max_workers: Optional[int] = None,
+        chunksize: int = 1,
+        ordered: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[Any, Union[DocumentConverterResult, Exception]]]:
+        """
+        Convert many sources in a pool of worker processes, and yield (source, result) pairs.
+
+        Conversion is mostly CPU-bound Python code, so threads don't help. Instead, each of the
+        max_workers processes (default: the number of CPUs) holds its own warm MarkItDown instance,
+        created with the same constructor arguments as this one (except the magika model and the
+        cache, which are not shared). Converters registered with register_converter() after
+        construction are not available to the workers.
+
+        Args:
+            - sources: paths, uris, bytes or binary streams (which are read into memory), or
+                (source, StreamInfo) pairs to provide hints for individual sources
+            - max_workers: the number of worker processes
+            - chunksize: the number of sources sent to a worker at once. Larger chunks reduce
+                inter-process overhead when converting many small documents
+            - ordered: if True, yield results in the order of the sources. Otherwise, yield them
+                as they complete
+            - kwargs: additional arguments to pass to convert(), for every source
+
+        Yields (source, result) pairs, where result is either a DocumentConverterResult or, if the
+        conversion of that source failed, the exception. Failures don't stop the other conversions.
+        If a worker dies (e.g., it crashes, or is killed for its memory), the sources of the batches
+        in flight fail with BrokenProcessPool, and the remaining sources are converted in a new pool.
+        Workers are started with forkserver (or spawn, where it is not available), and create their
+        own MarkItDown with the arguments of this one, so these must be picklable (TypeError).
+        """
+        from ._process_pool import convert_in_pool
+
+        return convert_in_pool(
+            sources,
+            init_kwargs=self._get_worker_init_kwargs(),
+            max_workers=max_workers,
+            chunksize=chunksize,
+            ordered=ordered,
+            kwargs=kwargs,
+        )
+
+    def _get_worker_init_kwargs(self) -> Dict[str, Any]:
+        """The constructor arguments of equivalent instances, in worker processes."""
+        from ._process_pool import get_worker_init_kwargs
+
+        init_kwargs = dict(self._init_kwargs)
+        init_kwargs["enable_builtins"] = self._builtins_enabled
+        init_kwargs["enable_plugins"] = self._plugins_enabled
+        return get_worker_init_kwargs(init_kwargs)
+
+    def identify_many(
+        self,
+        sources: Iterable[Union[str, Path, BinaryIO]],
+        *,
+        batch_size: int = 1000,
+    ) -> List[List[StreamInfo]]:
+        """
+        Guess the stream info of many local files or binary streams at once.
+
+        Local paths are identified with Magika's batched inference (identify_paths), batch_size
+        files at a time, rather than one model invocation per file. Streams are identified one
+        at a time, and their positions are left unchanged.
+
+        The result holds, for each source (in order), the same list of guesses that converting
+        the source would compute. It can be passed back to any of the convert methods as
+        `stream_info_guesses`, so that the content isn't identified twice. E.g.,
+
+            guesses = markitdown.identify_many(paths)
+            for path, path_guesses in zip(paths, guesses):
+                markitdown.convert(path, stream_info_guesses=path_guesses)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        sources = list(sources)
+        results: List[List[StreamInfo]] = [[] for _ in sources]
+
+        # Paths are identified in batches
+        path_positions: List[int] = []
+        for i, source in enumerate(sources):
+            if isinstance(source, (str, Path)):
+                path_positions.append(i)
+            else:
+                results[i] = self._get_stream_info_guesses(
+                    file_stream=source, base_guess=StreamInfo()
+                )
+
+        for start in range(0, len(path_positions), batch_size):
+            batch = path_positions[start : start + batch_size]
+            paths = [Path(sources[i]) for i in batch]
+            magika_results = self._magika.identify_paths(paths)
+            for i, path, result in zip(batch, paths, magika_results):
+                base_guess = StreamInfo(
+                    local_path=str(path),
+                    extension=os.path.splitext(path)[1],
+                    filename=os.path.basename(path),
+                )
+                if result.status == "ok" and result.prediction.output.is_text:
+                    # The charset is guessed from the head of the file
+                    with open(path, "rb") as fh:
+                        results[i] = self._get_guesses_from_magika_result(
+                            result, file_stream=fh, base_guess=base_guess
+                        )
+                else:
+                    results[i] = self._get_guesses_from_magika_result(
+                        result, file_stream=None, base_guess=base_guess
+                    )
+
+        return results
+
+    def _convert_with_guesses(
+        self,
+        *,
+        file_stream: BinaryIO,
+        base_guess: StreamInfo,
+        sniff: Optional[str] = None,
+        stream_info_guesses: Optional[List[StreamInfo]] = None,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """
+        Return the cached result for the stream, if any. Otherwise, guess the stream info
+        and convert the stream (see _guess_and_convert), caching the result.
+        """
+        if self._observer is not None:
+            input_bytes = _remaining_size(file_stream)
+            if input_bytes is not None:
+                current_stage().set("input_bytes", input_bytes)
+
+        # Under resource limits, conversions run in worker processes
+        guess_and_convert = (
+            self._guess_and_convert
+            if self._resource_limits is None
+            else self._guess_and_convert_isolated
+        )
+
+        if self._cache is None:
+            return guess_and_convert(
+                file_stream=file_stream,
+                base_guess=base_guess,
+                sniff=sniff,
+                stream_info_guesses=stream_info_guesses,
+                **kwargs,
+            )
+
+        cache_keys = self._get_cache_keys(
+            file_stream=file_stream,
+            base_guess=base_guess,
+            sniff=sniff,
+            stream_info_guesses=stream_info_guesses,
+            **kwargs,
+        )
+        if cache_keys is not None:
+            with self._stage("cache_lookup") as stage:
+                cached = self._cache.get(*cache_keys)
+                stage.set("hit", cached is not None)
+            if cached is not None:
+                stage = current_stage()
+                stage.set("cache_hit", True)
+                stage.set("output_chars", len(cached.markdown))
+                return cached
+
+        result = guess_and_convert(
+            file_stream=file_stream,
+            base_guess=base_guess,
+            sniff=sniff,
+            stream_info_guesses=stream_info_guesses,
+            **kwargs,
+        )
+        if cache_keys is not None:
+            cache_key, path_cache_key = cache_keys
+            if getattr(result, "_depends_on_path", False):
+                cache_key = path_cache_key
+            self._cache.set(cache_key, result)
+        return result
+
+    def _convert_iter_with_guesses(
+        self,
+        *,
+        file_stream: BinaryIO,
+        base_guess: StreamInfo,
+        sniff: Optional[str] = None,
+        stream_info_guesses: Optional[List[StreamInfo]] = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Streaming version of _convert_with_guesses. Cache hits are returned as a single chunk.
+        Misses are not cached, since the Markdown is never held in full.
+
+        Under resource limits, the conversion runs in a worker process, and its Markdown is
+        returned as a single chunk.
+        """
+        if self._resource_limits is not None:
+            result = self._convert_with_guesses(
+                file_stream=file_stream,
+                base_guess=base_guess,
+                sniff=sniff,
+                stream_info_guesses=stream_info_guesses,
+                **kwargs,
+            )
+            return iter([result.markdown])
+
+        if self._cache is not None:
+            cache_keys = self._get_cache_keys(
+                file_stream=file_stream,
+                base_guess=base_guess,
+                sniff=sniff,
+                stream_info_guesses=stream_info_guesses,
+                **kwargs,
+            )
+            if cache_keys is not None:
+                cached = self._cache.get(*cache_keys)
+                if cached is not None:
+                    return iter([cached.markdown])
+
+        return self._guess_and_convert(
+            file_stream=file_stream,
+            base_guess=base_guess,
+            sniff=sniff,
+            stream_info_guesses=stream_info_guesses,
+            convert_with=self._convert_iter,
+            **kwargs,
+        )
+
+    def _get_cache_keys(
+        self,
+        *,
+        file_stream: BinaryIO,
+        base_guess: StreamInfo,
+        sniff: Optional[str] = None,
+        stream_info_guesses: Optional[List[StreamInfo]] = None,
+        **kwargs: Any,
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Compute the cache keys of a conversion, from a hash of the input bytes, and everything else that
+        can affect the result: the hints about the stream, the sniffing policy, the registered converters
+        (and their versions), and the conversion options.
+
+        Returns two keys. The first leaves out the local path and filename, so that identical content
+        reached through different paths shares an entry. The url is kept, since some converters depend on
+        it (e.g., Wikipedia). The second also includes the path and filename, and keys the results of the
+        converters whose output depends on them (see DocumentConverter.output_depends_on_path).
+
+        The LLM client is identified by its type and base URL (see _llm_client_identity).
+
+        Returns None if the conversion should not be cached (e.g., a kwarg is a client object).
+        """
+        if self._converters_signature is None:
+            self._converters_signature = [
+                [
+                    f"{type(r.converter).__module__}.{type(r.converter).__qualname__}",
+                    getattr(r.converter, "__version__", None),
+                    r.priority,
+                ]
+                for r in self._get_dispatch_index().sorted_registrations
+            ]
+
+        def _hints(stream_info: StreamInfo) -> List[Optional[str]]:
+            return [
+                stream_info.mimetype,
+                stream_info.extension,
+                stream_info.charset,
+                stream_info.url,
+            ]
+
+        fields: Dict[str, Any] = {
+            "version": __version__,
+            "converters": self._converters_signature,
+            "stream_info": _hints(base_guess),
+            "guesses": (
+                None
+                if stream_info_guesses is None
+                else [_hints(g) for g in stream_info_guesses]
+            ),
+            "sniff": self._sniff if sniff is None else sniff,
+            "options": {
+                "llm_client": _llm_client_identity(self._llm_client),
+                "llm_model": self._llm_model,
+                "exiftool_path": self._exiftool_path,
+                "style_map": self._style_map,
+            },
+            "kwargs": kwargs,
+        }
+        content_digest = hash_stream(file_stream)
+        cache_key = make_cache_key(content_digest, fields)
+        if cache_key is None:
+            return None
+
+        guesses = [base_guess] + (stream_info_guesses or [])
+        fields["paths"] = [[g.local_path, g.filename] for g in guesses]
+        path_cache_key = make_cache_key(content_digest, fields)
+        assert path_cache_key is not None
+        return cache_key, path_cache_key
+
+    def _guess_and_convert(
+        self,
+        *,
+        file_stream: BinaryIO,
+        base_guess: StreamInfo,
+        sniff: Optional[str] = None,
+        stream_info_guesses: Optional[List[StreamInfo]] = None,
+        convert_with: Optional[Callable[..., Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Guess the stream info, according to the sniffing policy, then convert the stream.
+        If stream_info_guesses are provided (e.g., by identify_many), they are used as-is.
+
+        The conversion is done by convert_with (default: _convert, which returns a
+        DocumentConverterResult; _convert_iter returns an iterator of chunks instead).
+
+        Sniffing policies:
+        - "always": Always identify the content with Magika (and detect the charset of text).
+        - "when_ambiguous": Trust the base guess when it is unambiguous (see _is_unambiguous_guess),
+            and only sniff the content if no converter accepts the stream based on the hints alone.
+        - "never": Never sniff the content. Conversion relies entirely on the provided hints.
+        """
+        if convert_with is None:
+            convert_with = self._convert
+
+        if stream_info_guesses is not None:
+            return convert_with(
+                file_stream=file_stream,
+                stream_info_guesses=list(stream_info_guesses),
+                **kwargs,
+            )
+
+        sniff = self._sniff if sniff is None else self._validate_sniff(sniff)
+
+        if sniff == "never" or (
+            sniff == "when_ambiguous" and self._is_unambiguous_guess(base_guess)
+        ):
+            try:
+                return convert_with(
+                    file_stream=file_stream,
+                    stream_info_guesses=[self._enhance_guess(base_guess)],
+                    **kwargs,
+                )
+            except UnsupportedFormatException:
+                if sniff == "never":
+                    raise
+                # Nothing accepted the trusted hints. Fall back to sniffing.
 
-        # Convert
         guesses = self._get_stream_info_guesses(
-            file_stream=buffer, base_guess=base_guess
+            file_stream=file_stream, base_guess=base_guess
+        )
+        return convert_with(
+            file_stream=file_stream, stream_info_guesses=guesses, **kwargs
         )
-        return self._convert(file_stream=buffer, stream_info_guesses=guesses, **kwargs)
+
+    def _guess_and_convert_isolated(
+        self,
+        *,
+        file_stream: BinaryIO,
+        base_guess: StreamInfo,
+        **kwargs: Any,
+    ) -> DocumentConverterResult:
+        """
+        Like _guess_and_convert, but in a worker process, under the resource limits. The rest of
+        the stream is sent to the worker, so kwargs must be picklable (as with convert_many).
+        """
+        payload = bytes(read_as_buffer(file_stream))
+        with self._stage("isolated_conversion"):
+            return self._isolated_workers.convert(payload, base_guess, kwargs)
+
+    def _is_unambiguous_guess(self, guess: StreamInfo) -> bool:
+        """
+        A guess is unambiguous if (after filling in blanks from the mimetypes database)
+        it has both a mimetype and an extension, and, for text/* types, a charset.
+        """
+        guess = self._enhance_guess(guess)
+        if guess.mimetype is None or guess.extension is None:
+            return False
+        if guess.mimetype.lower().startswith("text/") and guess.charset is None:
+            return False
+        return True
+
+    def _validate_sniff(self, sniff: str) -> str:
+        if sniff not in SNIFF_POLICIES:
+            raise ValueError(
+                f"Invalid sniff policy: {sniff}. Expected one of: {', '.join(SNIFF_POLICIES)}"
+            )
+        return sniff
 
     def _convert(
         self, *, file_stream: BinaryIO, stream_info_guesses: List[StreamInfo], **kwargs
     ) -> DocumentConverterResult:
-        res: Union[None, DocumentConverterResult] = None
+        def _attempt(
+            converter: DocumentConverter,
+            stream_info: StreamInfo,
+            _kwargs: Dict[str, Any],
+        ) -> DocumentConverterResult:
+            res = converter.convert(file_stream, stream_info, **_kwargs)
+            # Results that depend on the path are cached by path (see _get_cache_keys)
+            res._depends_on_path = converter.output_depends_on_path  # type: ignore[attr-defined]
+            return res
+
+        res: DocumentConverterResult = self._try_converters(
+            file_stream=file_stream,
+            stream_info_guesses=stream_info_guesses,
+            attempt=_attempt,
+            **kwargs,
+        )
+
+        # Normalize the content
+        with self._stage("normalize"):
+            res.text_content = normalize_markdown(res.text_content)
+        current_stage().set("output_chars", len(res.text_content))
+        return res
+
+    def _convert_iter(
+        self, *, file_stream: BinaryIO, stream_info_guesses: List[StreamInfo], **kwargs
+    ) -> Iterator[str]:
+        """
+        Streaming version of _convert. The converter is selected, and its first chunk produced, before
+        returning, so that failures can still fall back to other converters (and raise here). Once the
+        first chunk is produced, the converter is committed to, and later errors propagate to the caller.
+        """
+
+        def _attempt(
+            converter: DocumentConverter,
+            stream_info: StreamInfo,
+            _kwargs: Dict[str, Any],
+        ) -> Tuple[str, Iterator[str], int]:
+            chunks = iter(converter.convert_iter(file_stream, stream_info, **_kwargs))
+            first_chunk = next(chunks, "")
+            # The converter may continue reading from where it left off
+            return first_chunk, chunks, file_stream.tell()
+
+        first_chunk, chunks, resume_pos = self._try_converters(
+            file_stream=file_stream,
+            stream_info_guesses=stream_info_guesses,
+            attempt=_attempt,
+            **kwargs,
+        )
+
+        def _normalized_chunks() -> Iterator[str]:
+            file_stream.seek(resume_pos)
+            normalizer = MarkdownNormalizer()
+            for chunk in itertools.chain([first_chunk], chunks):
+                normalized = normalizer.feed(chunk)
+                if normalized:
+                    yield normalized
+            normalized = normalizer.flush()
+            if normalized:
+                yield normalized
+
+        return _normalized_chunks()
+
+    def _try_converters(
+        self,
+        *,
+        file_stream: BinaryIO,
+        stream_info_guesses: List[StreamInfo],
+        attempt: Callable[[DocumentConverter, StreamInfo, Dict[str, Any]], Any],
+        **kwargs,
+    ) -> Any:
+        """
+        Probe the converters, for each guess in turn, and call attempt(converter, stream_info, kwargs)
+        on those that accept the stream, until one succeeds. Return the result of that attempt.
+
+        Equivalent guesses are only tried once, and converters that fail are not attempted again
+        (see AttemptPlanner). Probes that accepts() caches with cached_probe() run once per stream.
+        """
+        res: Any = None
+
+        # The enclosing stage, if any, on which to record the outcome
+        enclosing_stage = current_stage()
 
         # Keep track of which converters throw exceptions
         failed_attempts: List[FailedConversionAttempt] = []
 
-        # Create a copy of the page_converters list, sorted by priority.
-        # We do this with each call to _convert because the priority of converters may change between calls.
-        # The sort is guaranteed to be stable, so converters with the same priority will remain in the same order.
-        sorted_registrations = sorted(self._converters, key=lambda x: x.priority)
+        # The dispatch index holds a copy of the converters list, sorted by priority.
+        # It is rebuilt whenever a converter is registered.
+        planner = AttemptPlanner(self._get_dispatch_index())
 
         # Remember the initial stream position so that we can return to it
         cur_pos = file_stream.tell()
 
-        for stream_info in stream_info_guesses + [StreamInfo()]:
-            for converter_registration in sorted_registrations:
-                converter = converter_registration.converter
-                # Sanity check -- make sure the cur_pos is still the same
-                assert (
-                    cur_pos == file_stream.tell()
-                ), "File stream position should NOT change between guess iterations"
+        # Prepare the options shared by all converters
+        base_kwargs = {k: v for k, v in kwargs.items()}
 
-                _kwargs = {k: v for k, v in kwargs.items()}
+        # Copy any additional global options
+        if "llm_client" not in base_kwargs and self._llm_client is not None:
+            base_kwargs["llm_client"] = self._llm_client
 
-                # Copy any additional global options
-                if "llm_client" not in _kwargs and self._llm_client is not None:
-                    _kwargs["llm_client"] = self._llm_client
+        if "llm_model" not in base_kwargs and self._llm_model is not None:
+            base_kwargs["llm_model"] = self._llm_model
 
-                if "llm_model" not in _kwargs and self._llm_model is not None:
-                    _kwargs["llm_model"] = self._llm_model
+        if "style_map" not in base_kwargs and self._style_map is not None:
+            base_kwargs["style_map"] = self._style_map
 
-                if "style_map" not in _kwargs and self._style_map is not None:
-                    _kwargs["style_map"] = self._style_map
+        if "exiftool_path" not in base_kwargs and self._exiftool_path is not None:
+            base_kwargs["exiftool_path"] = self._exiftool_path
 
-                if "exiftool_path" not in _kwargs and self._exiftool_path is not None:
-                    _kwargs["exiftool_path"] = self._exiftool_path
+        # Add the list of converters for nested processing
+        base_kwargs["_parent_converters"] = self._converters
 
-                # Add the list of converters for nested processing
-                _kwargs["_parent_converters"] = self._converters
+        # The results of expensive probes of these bytes, shared by all guesses (see cached_probe)
+        base_kwargs["_probe_cache"] = {}
 
-                # Add legaxy kwargs
-                if stream_info is not None:
-                    if stream_info.extension is not None:
-                        _kwargs["file_extension"] = stream_info.extension
+        for stream_info in planner.guesses(stream_info_guesses):
+            _kwargs = {k: v for k, v in base_kwargs.items()}
 
-                    if stream_info.url is not None:
-                        _kwargs["url"] = stream_info.url
+            # Add legaxy kwargs
+            if stream_info is not None:
+                if stream_info.extension is not None:
+                    _kwargs["file_extension"] = stream_info.extension
+
+                if stream_info.url is not None:
+                    _kwargs["url"] = stream_info.url
+
+            # Probe the likely candidates first, falling back to the remaining converters
+            for converter_registration in planner.converters(stream_info):
+                converter = converter_registration.converter
+                # Sanity check -- make sure the cur_pos is still the same
+                assert (
+                    cur_pos == file_stream.tell()
+                ), "File stream position should NOT change between guess iterations"
 
                 # Check if the converter will accept the file, and if so, try to convert it
                 _accepts = False
-                try:
-                    _accepts = converter.accepts(file_stream, stream_info, **_kwargs)
-                except NotImplementedError:
-                    pass
+                with self._stage(
+                    "accepts", converter=type(converter).__name__
+                ) as stage:
+                    try:
+                        _accepts = converter.accepts(
+                            file_stream, stream_info, **_kwargs
+                        )
+                    except NotImplementedError:
+                        pass
+                    stage.set("accepted", _accepts)
 
                 # accept() should not have changed the file stream position
                 assert (
@@ -591,24 +1637,38 @@ class MarkItDown:
                 # Attempt the conversion
                 if _accepts:
                     try:
-                        res = converter.convert(file_stream, stream_info, **_kwargs)
+                        with self._stage(
+                            "attempt",
+                            converter=type(converter).__name__,
+                            mimetype=stream_info.mimetype,
+                            extension=stream_info.extension,
+                        ):
+                            res = attempt(converter, stream_info, _kwargs)
                     except Exception:
+                        planner.record_failure(converter, stream_info)
                         failed_attempts.append(
                             FailedConversionAttempt(
                                 converter=converter, exc_info=sys.exc_info()
                             )
                         )
+                        if self._observer is not None:
+                            self._observer.counter_added(
+                                "failed_attempts",
+                                1,
+                                {"converter": type(converter).__name__},
+                            )
                     finally:
                         file_stream.seek(cur_pos)
 
                 if res is not None:
-                    # Normalize the content
-                    res.text_content = "\n".join(
-                        [line.rstrip() for line in re.split(r"\r?\n", res.text_content)]
-                    )
-                    res.text_content = re.sub(r"\n{3,}", "\n\n", res.text_content)
+                    enclosing_stage.set("converter", type(converter).__name__)
+                    enclosing_stage.set("guesses_tried", planner.guesses_tried)
+                    enclosing_stage.set("failed_attempts", len(failed_attempts))
                     return res
 
+        enclosing_stage.set("guesses_tried", planner.guesses_tried)
+        enclosing_stage.set("failed_attempts", len(failed_attempts))
+
         # If we got this far without success, report any exceptions
         if len(failed_attempts) > 0:
             raise FileConversionException(attempts=failed_attempts)
@@ -618,6 +1678,36 @@ class MarkItDown:
             "Could not convert stream to Markdown. No converter attempted a conversion, suggesting that the filetype is simply not supported."
         )
 
+    def _stage(self, name: str, **attributes: Any) -> ContextManager[Any]:
+        """
+        Time a stage of the conversion, reporting it to the observer. Without an observer,
+        this returns a shared no-op stage, so instrumentation costs next to nothing.
+        """
+        if self._observer is None:
+            return NULL_STAGE
+        return ConversionStage(name, self._observer, attributes)
+
+    def _conversion_stage(self, source: str) -> ContextManager[Any]:
+        """The "convert" stage enclosing a whole conversion, which also updates the counters."""
+        if self._observer is None:
+            return NULL_STAGE
+        return self._observed_conversion(self._observer, source)
+
+    @contextlib.contextmanager
+    def _observed_conversion(
+        self, observer: ConversionObserver, source: str
+    ) -> Iterator[ConversionStage]:
+        with ConversionStage("convert", observer, {"source": source}) as stage:
+            yield stage
+
+        attributes = stage.attributes
+        observer.counter_added(
+            "conversions", 1, {"converter": attributes.get("converter")}
+        )
+        for counter in ["input_bytes", "output_chars"]:
+            if counter in attributes:
+                observer.counter_added(counter, attributes[counter], {})
+
     def register_page_converter(self, converter: DocumentConverter) -> None:
         """DEPRECATED: User register_converter instead."""
         warn(
@@ -653,10 +1743,24 @@ class MarkItDown:
         Plugins can register converters with any priority, to appear before or
         after the built-ins. For example, a plugin with priority 9 will run
         before the PlainTextConverter, but after the built-in converters.
+
+        Converters that implement dispatch_hints() are added to a dispatch index,
+        so that they are only probed first for streams matching their hints. The
+        index is rebuilt on the next conversion after any registration.
         """
         self._converters.insert(
             0, ConverterRegistration(converter=converter, priority=priority)
         )
+        self._dispatch_index = None
+        self._converters_signature = None
+
+    def _get_dispatch_index(self) -> DispatchIndex:
+        """Return the dispatch index, (re)building it if the converters have changed."""
+        dispatch_index = self._dispatch_index
+        if dispatch_index is None:
+            dispatch_index = DispatchIndex(self._converters)
+            self._dispatch_index = dispatch_index
+        return dispatch_index
 
     def _get_stream_info_guesses(
         self, file_stream: BinaryIO, base_guess: StreamInfo
@@ -664,9 +1768,114 @@ class MarkItDown:
         """
         Given a base guess, attempt to guess or expand on the stream info using the stream content (via magika).
         """
+        # Call magika to guess from the stream
+        cur_pos = file_stream.tell()
+        try:
+            with self._stage("identify") as stage:
+                result = self._magika.identify_stream(file_stream)
+                file_stream.seek(cur_pos)
+                guesses = self._get_guesses_from_magika_result(
+                    result, file_stream=file_stream, base_guess=base_guess
+                )
+                stage.set("guesses", len(guesses))
+            return guesses
+        finally:
+            file_stream.seek(cur_pos)
+
+    def _get_guesses_from_magika_result(
+        self,
+        result: "magika.types.MagikaResult",
+        *,
+        file_stream: Optional[BinaryIO],
+        base_guess: StreamInfo,
+    ) -> List[StreamInfo]:
+        """
+        Combine the base guess with Magika's identification of the stream. If the stream is text,
+        its charset is also guessed from (up to) the next 4k bytes of file_stream.
+        """
         guesses: List[StreamInfo] = []
 
         # Enhance the base guess with information based on the extension or mimetype
+        enhanced_guess = self._enhance_guess(base_guess)
+
+        if result.status == "ok" and result.prediction.output.label != "unknown":
+            # If it's text, also guess the charset
+            charset = None
+            if result.prediction.output.is_text and file_stream is not None:
+                # Read the first 4k to guess the charset
+                cur_pos = file_stream.tell()
+                stream_page = file_stream.read(4096)
+                file_stream.seek(cur_pos)
+                import charset_normalizer
+
+                with self._stage("detect_charset") as stage:
+                    charset_result = charset_normalizer.from_bytes(stream_page).best()
+                    if charset_result is not None:
+                        charset = self._normalize_charset(charset_result.encoding)
+                    stage.set("charset", charset)
+
+            # Normalize the first extension listed
+            guessed_extension = None
+            if len(result.prediction.output.extensions) > 0:
+                guessed_extension = "." + result.prediction.output.extensions[0]
+
+            # Determine if the guess is compatible with the base guess
+            compatible = True
+            if (
+                base_guess.mimetype is not None
+                and base_guess.mimetype != result.prediction.output.mime_type
+            ):
+                compatible = False
+
+            if (
+                base_guess.extension is not None
+                and base_guess.extension.lstrip(".")
+                not in result.prediction.output.extensions
+            ):
+                compatible = False
+
+            if (
+                base_guess.charset is not None
+                and self._normalize_charset(base_guess.charset) != charset
+            ):
+                compatible = False
+
+            if compatible:
+                # Add the compatible base guess
+                guesses.append(
+                    StreamInfo(
+                        mimetype=base_guess.mimetype
+                        or result.prediction.output.mime_type,
+                        extension=base_guess.extension or guessed_extension,
+                        charset=base_guess.charset or charset,
+                        filename=base_guess.filename,
+                        local_path=base_guess.local_path,
+                        url=base_guess.url,
+                    )
+                )
+            else:
+                # The magika guess was incompatible with the base guess, so add both guesses
+                guesses.append(enhanced_guess)
+                guesses.append(
+                    StreamInfo(
+                        mimetype=result.prediction.output.mime_type,
+                        extension=guessed_extension,
+                        charset=charset,
+                        filename=base_guess.filename,
+                        local_path=base_guess.local_path,
+                        url=base_guess.url,
+                    )
+                )
+        else:
+            # There were no other guesses, so just add the base guess
+            guesses.append(enhanced_guess)
+
+        return guesses
+
+    def _enhance_guess(self, base_guess: StreamInfo) -> StreamInfo:
+        """
+        Fill in a missing mimetype or extension using the mimetypes database.
+        """
         enhanced_guess = base_guess.copy_and_update()
 
         # If there's an extension and no mimetype, try to guess the mimetype
@@ -683,81 +1892,7 @@ class MarkItDown:
             if len(_e) > 0:
                 enhanced_guess = enhanced_guess.copy_and_update(extension=_e[0])
 
-        # Call magika to guess from the stream
-        cur_pos = file_stream.tell()
-        try:
-            result = self._magika.identify_stream(file_stream)
-            if result.status == "ok" and result.prediction.output.label != "unknown":
-                # If it's text, also guess the charset
-                charset = None
-                if result.prediction.output.is_text:
-                    # Read the first 4k to guess the charset
-                    file_stream.seek(cur_pos)
-                    stream_page = file_stream.read(4096)
-                    charset_result = charset_normalizer.from_bytes(stream_page).best()
-
-                    if charset_result is not None:
-                        charset = self._normalize_charset(charset_result.encoding)
-
-                # Normalize the first extension listed
-                guessed_extension = None
-                if len(result.prediction.output.extensions) > 0:
-                    guessed_extension = "." + result.prediction.output.extensions[0]
-
-                # Determine if the guess is compatible with the base guess
-                compatible = True
-                if (
-                    base_guess.mimetype is not None
-                    and base_guess.mimetype != result.prediction.output.mime_type
-                ):
-                    compatible = False
-
-                if (
-                    base_guess.extension is not None
-                    and base_guess.extension.lstrip(".")
-                    not in result.prediction.output.extensions
-                ):
-                    compatible = False
-
-                if (
-                    base_guess.charset is not None
-                    and self._normalize_charset(base_guess.charset) != charset
-                ):
-                    compatible = False
-
-                if compatible:
-                    # Add the compatible base guess
-                    guesses.append(
-                        StreamInfo(
-                            mimetype=base_guess.mimetype
-                            or result.prediction.output.mime_type,
-                            extension=base_guess.extension or guessed_extension,
-                            charset=base_guess.charset or charset,
-                            filename=base_guess.filename,
-                            local_path=base_guess.local_path,
-                            url=base_guess.url,
-                        )
-                    )
-                else:
-                    # The magika guess was incompatible with the base guess, so add both guesses
-                    guesses.append(enhanced_guess)
-                    guesses.append(
-                        StreamInfo(
-                            mimetype=result.prediction.output.mime_type,
-                            extension=guessed_extension,
-                            charset=charset,
-                            filename=base_guess.filename,
-                            local_path=base_guess.local_path,
-                            url=base_guess.url,
-                        )
-                    )
-            else:
-                # There were no other guesses, so just add the base guess
-                guesses.append(enhanced_guess)
-        finally:
-            file_stream.seek(cur_pos)
-
-        return guesses
+        return enhanced_guess
 
     def _normalize_charset(self, charset: str | None) -> str | None:
         """
@@ -0,0 +1,255 @@
+import io
+import os
+import pickle
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from ._base_converter import DocumentConverterResult
+from ._exceptions import FileConversionException, MarkItDownException
+from ._stream_info import StreamInfo
+
+# Break otherwise circular import for type hinting
+if TYPE_CHECKING:
+    from ._markitdown import MarkItDown
+
+# Constructor kwargs that are specific to the parent process, and are not passed to workers.
+# (Workers load their own Magika model. Caches, executors and async clients hold locks, threads,
+# database connections or sockets. Observers are called in the process that converts. Workers
+# convert in-process, under the limits enforced by the parent.)
+_PARENT_ONLY_KWARGS = (
+    "magika",
+    "cache",
+    "executor",
+    "async_http_client",
+    "observer",
+    "resource_limits",
+)
+
+# The warm MarkItDown instance of a worker process (see _init_worker)
+_worker_markitdown: Optional["MarkItDown"] = None
+
+# A source, as sent to a worker: a path or uri, or the bytes of a stream
+_Payload = Union[str, Path, bytes]
+_Batch = List[Tuple[int, _Payload, Optional[StreamInfo]]]
+_Outcome = Union[DocumentConverterResult, Exception]
+
+
+def _init_worker(init_kwargs: Dict[str, Any]) -> None:
+    """Create the worker's MarkItDown instance, once, when the worker process starts."""
+    global _worker_markitdown
+    from ._markitdown import MarkItDown
+
+    _worker_markitdown = MarkItDown(**init_kwargs)
+
+
+def _convert_batch(batch: _Batch, kwargs: Dict[str, Any]) -> List[Tuple[int, _Outcome]]:
+    """Convert a batch of sources in a worker, returning (index, result or exception) pairs."""
+    assert _worker_markitdown is not None
+    outcomes: List[Tuple[int, _Outcome]] = []
+    for index, payload, stream_info in batch:
+        try:
+            if isinstance(payload, bytes):
+                result = _worker_markitdown.convert_stream(
+                    io.BytesIO(payload), stream_info=stream_info, **kwargs
+                )
+            else:
+                result = _worker_markitdown.convert(
+                    payload, stream_info=stream_info, **kwargs
+                )
+            outcomes.append((index, make_sendable(result)))
+        except Exception as e:
+            outcomes.append((index, _make_picklable(e)))
+    return outcomes
+
+
+def make_sendable(result: DocumentConverterResult) -> DocumentConverterResult:
+    """
+    Prepare a result to be sent to another process. Converters sometimes return str subclasses
+    (e.g., a BeautifulSoup NavigableString title, which references the whole parse tree), which
+    are replaced by plain strings.
+    """
+    result.markdown = str(result.markdown)
+    if result.title is not None:
+        result.title = str(result.title)
+    return result
+
+
+def _make_picklable(exc: Exception) -> Exception:
+    """
+    Exceptions are sent back to the parent process, so they must be picklable. Some are not
+    (e.g., FileConversionException holds tracebacks), and are replaced by an equivalent
+    exception that retains their message.
+    """
+    try:
+        pickle.dumps(exc)
+        return exc
+    except Exception:
+        pass
+
+    if isinstance(exc, FileConversionException):
+        return FileConversionException(message=str(exc))
+    return MarkItDownException(f"{type(exc).__name__}: {exc}")
+
+
+def _to_payload(source: Any) -> _Payload:
+    if isinstance(source, (str, Path, bytes)):
+        return source
+    if hasattr(source, "read") and callable(source.read):
+        # Streams can't be sent to other processes, so they are read here
+        return source.read()
+    raise TypeError(
+        f"Invalid source type: {type(source)}. Expected str, Path, bytes or BinaryIO."
+    )
+
+
+def get_worker_init_kwargs(init_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the MarkItDown constructor kwargs to use in worker processes. They are sent to the
+    workers (see get_mp_context), so they must be picklable: TypeError is raised otherwise.
+    """
+    worker_kwargs = {
+        k: v for k, v in init_kwargs.items() if k not in _PARENT_ONLY_KWARGS
+    }
+    unpicklable = []
+    for name, value in worker_kwargs.items():
+        try:
+            pickle.dumps(value)
+        except Exception:
+            unpicklable.append(name)
+    if unpicklable:
+        raise TypeError(
+            "The constructor arguments of MarkItDown are sent to its worker processes, so they must be "
+            f"picklable. These are not: {', '.join(unpicklable)}"
+        )
+    return worker_kwargs
+
+
+def get_mp_context() -> Any:
+    """
+    Return the multiprocessing context of worker processes: forkserver where it is available
+    (POSIX), otherwise spawn. Workers are never forked from the parent, since MarkItDown may be
+    used from several threads, and a worker forked while another thread held a lock (e.g., of
+    logging, or of an executor) would deadlock on its copy of the lock.
+    """
+    import multiprocessing
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def convert_in_pool(
+    sources: Iterable[Any],
+    *,
+    init_kwargs: Dict[str, Any],
+    max_workers: Optional[int],
+    chunksize: int,
+    ordered: bool,
+    kwargs: Dict[str, Any],
+) -> Iterator[Tuple[Any, _Outcome]]:
+    """
+    Convert sources in a pool of worker processes, each holding a MarkItDown instance created
+    with init_kwargs. Sources are sent in batches of chunksize, and only a bounded number of
+    batches are in flight at any time, so sources can be a (lazy) iterable of any length.
+
+    Each source is either a str, Path, bytes or binary stream, or a (source, StreamInfo) pair.
+    Yields (source, result or exception) pairs, as they complete, or in order if ordered is True.
+
+    If a worker dies (e.g., it crashes, or is killed for its memory), every batch in flight fails,
+    and the outcome of each of their sources is the BrokenProcessPool exception. The next batches
+    are converted in a new pool.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_in_flight = 2 * max_workers
+
+    # The original sources of the batches in flight, by index
+    originals: Dict[int, Any] = {}
+    # The indices of the sources of each batch in flight
+    batch_indices: Dict[Future, List[int]] = {}
+
+    def _batches() -> Iterator[_Batch]:
+        batch: _Batch = []
+        for index, item in enumerate(sources):
+            source, stream_info = item if isinstance(item, tuple) else (item, None)
+            originals[index] = source
+            batch.append((index, _to_payload(source), stream_info))
+            if len(batch) >= chunksize:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _new_executor() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=get_mp_context(),
+            initializer=_init_worker,
+            initargs=(get_worker_init_kwargs(init_kwargs),),
+        )
+
+    executor = _new_executor()
+
+    def _submit(batch: _Batch) -> Future:
+        nonlocal executor
+        try:
+            future = executor.submit(_convert_batch, batch, kwargs)
+        except BrokenProcessPool:
+            # A worker died: the batches in flight fail (see _outcomes), and the next ones go to a new pool
+            executor.shutdown(wait=False)
+            executor = _new_executor()
+            future = executor.submit(_convert_batch, batch, kwargs)
+        batch_indices[future] = [index for index, _, _ in batch]
+        return future
+
+    def _outcomes(future: Future) -> Iterator[Tuple[Any, _Outcome]]:
+        indices = batch_indices.pop(future)
+        try:
+            outcomes: List[Tuple[int, _Outcome]] = future.result()
+        except BrokenProcessPool as e:
+            outcomes = [(index, e) for index in indices]
+        for index, outcome in outcomes:
+            yield originals.pop(index), outcome
+
+    try:
+        batches = _batches()
+        if ordered:
+            queue: Deque[Future] = deque()
+            for batch in batches:
+                queue.append(_submit(batch))
+                if len(queue) >= max_in_flight:
+                    yield from _outcomes(queue.popleft())
+            while queue:
+                yield from _outcomes(queue.popleft())
+        else:
+            in_flight = set()
+            for batch in batches:
+                in_flight.add(_submit(batch))
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from _outcomes(future)
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from _outcomes(future)
+    finally:
+        # If the caller stops early, the batches that have not started are cancelled (the
+        # running ones are waited for, so that no worker outlives the pool)
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,235 @@
+import io
+import mmap
+import os
+import tempfile
+from typing import AsyncIterable, BinaryIO, Iterable, Optional, Union
+
+# Buffers up to this size are kept in memory. Larger ones are spilled to a temporary file.
+DEFAULT_SPOOL_THRESHOLD = 32 * 1024 * 1024
+
+# The size of the reads used to copy streams into buffers
+DEFAULT_READ_CHUNK_SIZE = 1024 * 1024
+
+
+class _Spool:
+    """
+    A write-only buffer that stays in memory up to a threshold, then spills to a temporary
+    file. If the final size is known in advance, the in-memory buffer is allocated once,
+    up front (or, if too large, the data goes straight to disk).
+    """
+
+    def __init__(self, spool_threshold: int, expected_size: Optional[int] = None):
+        self._threshold = spool_threshold
+        self._size = 0
+        self._file: Union[io.BytesIO, BinaryIO]
+
+        if expected_size is not None and expected_size > spool_threshold:
+            self._file = tempfile.TemporaryFile()
+        elif expected_size is not None and expected_size > 0:
+            # Writes within the preallocated region overwrite in place, without reallocating
+            self._file = io.BytesIO(bytes(expected_size))
+        else:
+            self._file = io.BytesIO()
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        if isinstance(self._file, io.BytesIO) and (
+            self._size + len(data) > self._threshold
+        ):
+            # Spill to disk
+            spilled = tempfile.TemporaryFile()
+            with self._file.getbuffer() as view:
+                spilled.write(view[: self._size])
+            self._file.close()
+            self._file = spilled
+
+        self._file.write(data)
+        self._size += len(data)
+
+    def finish(self) -> BinaryIO:
+        """Return the (seekable) buffer, positioned at the start of the data."""
+        # Drop any unused preallocated space
+        self._file.truncate(self._size)
+        self._file.seek(0)
+        return self._file
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def spool_stream(
+    stream: BinaryIO,
+    *,
+    spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+    chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+    expected_size: Optional[int] = None,
+) -> BinaryIO:
+    """
+    Copy the remainder of a (possibly non-seekable) binary stream into a new seekable buffer,
+    which is kept in memory up to spool_threshold bytes, and otherwise spilled to a temporary file.
+    The caller is responsible for closing the returned buffer.
+    """
+    spool = _Spool(spool_threshold, expected_size)
+    try:
+        readinto = getattr(stream, "readinto", None)
+        if readinto is not None:
+            # Reuse a single chunk buffer, rather than allocating a bytes object per read
+            chunk = bytearray(chunk_size)
+            with memoryview(chunk) as view:
+                while True:
+                    n = readinto(view)
+                    if not n:
+                        break
+                    spool.write(view[:n])
+        else:
+            while True:
+                data = stream.read(chunk_size)
+                if not data:
+                    break
+                spool.write(data)
+        return spool.finish()
+    except BaseException:
+        spool.close()
+        raise
+
+
+def spool_chunks(
+    chunks: Iterable[bytes],
+    *,
+    spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+    expected_size: Optional[int] = None,
+) -> BinaryIO:
+    """
+    Like spool_stream(), but for an iterable of byte chunks (e.g., requests.Response.iter_content).
+    """
+    spool = _Spool(spool_threshold, expected_size)
+    try:
+        for data in chunks:
+            spool.write(data)
+        return spool.finish()
+    except BaseException:
+        spool.close()
+        raise
+
+
+async def spool_async_chunks(
+    chunks: AsyncIterable[bytes],
+    *,
+    spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+    expected_size: Optional[int] = None,
+) -> BinaryIO:
+    """
+    Like spool_chunks(), but for an async iterable of byte chunks (e.g., httpx.Response.aiter_bytes).
+    """
+    spool = _Spool(spool_threshold, expected_size)
+    try:
+        async for data in chunks:
+            spool.write(data)
+        return spool.finish()
+    except BaseException:
+        spool.close()
+        raise
+
+
+class MappedFileStream(io.BufferedIOBase):
+    """
+    A read-only, seekable binary stream over a memory-mapped file. Reads are served from
+    the page cache, and getbuffer() exposes the whole file as a zero-copy memoryview.
+    """
+
+    def __init__(self, mapping: mmap.mmap, name: Optional[str] = None):
+        super().__init__()
+        self._mmap = mapping
+        self._pos = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        self._checkClosed()
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._mmap) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+        self._pos = pos
+        return pos
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        self._checkClosed()
+        end = len(self._mmap)
+        if size is not None and size >= 0:
+            end = min(end, self._pos + size)
+        data = self._mmap[self._pos : end] if end > self._pos else b""
+        self._pos += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, b) -> int:
+        self._checkClosed()
+        with memoryview(b) as target:
+            n = max(0, min(len(target), len(self._mmap) - self._pos))
+            target[:n] = self._mmap[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def getbuffer(self) -> memoryview:
+        """Return a read-only memoryview of the whole file, without copying it."""
+        self._checkClosed()
+        return memoryview(self._mmap)
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A memoryview is still exported. The mapping is released when it is garbage collected.
+                pass
+        super().close()
+
+
+def open_local_stream(path: Union[str, os.PathLike]) -> BinaryIO:
+    """
+    Open a local file for reading, memory-mapping it if possible. Files that cannot be
+    mapped (e.g., empty files, pipes, or special files) are opened as regular buffered files.
+    """
+    fh = open(path, "rb")
+    try:
+        mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return fh
+
+    # The mapping holds its own reference to the file
+    fh.close()
+    return MappedFileStream(mapping, name=str(path))
+
+
+def read_as_buffer(file_stream: BinaryIO) -> Union[bytes, memoryview]:
+    """
+    Read the remainder of the stream, like file_stream.read(). If the stream supports getbuffer()
+    (e.g., MappedFileStream, io.BytesIO), a zero-copy memoryview is returned instead of a bytes copy.
+    Callers should not hold on to the view, since it keeps the underlying buffer alive (and, for
+    io.BytesIO, prevents it from being resized).
+    """
+    getbuffer = getattr(file_stream, "getbuffer", None)
+    if getbuffer is None:
+        return file_stream.read()
+
+    pos = file_stream.tell()
+    view = getbuffer()
+    file_stream.seek(0, io.SEEK_END)
+    return view[pos:]
@@ -0,0 +1,70 @@
+from typing import List
+
+
+class MarkdownNormalizer:
+    """
+    Incrementally normalizes converter output, in a single pass:
+    - Line endings are normalized to LF
+    - Trailing whitespace is stripped from every line
+    - Runs of blank lines are collapsed into one (i.e., at most two consecutive newlines)
+
+    Text can be fed in chunks of any size (even splitting lines, or CRLF pairs). feed()
+    returns the normalized text for all the lines completed so far, and flush() returns
+    the rest. The concatenated output is the same as that of normalize_markdown() on the
+    whole text.
+    """
+
+    def __init__(self):
+        # The last, not yet terminated, line
+        self._partial_line = ""
+        # Newlines that have been seen, but not yet emitted (they might be collapsed)
+        self._pending_newlines = 0
+        # Whether any line has been seen (the first line is not preceded by a newline)
+        self._started = False
+
+    def feed(self, text: str) -> str:
+        """Add text, and return the normalized text for the lines it completes."""
+        lines = text.split("\n")
+        if len(lines) == 1:
+            # No line was completed
+            self._partial_line += text
+            return ""
+
+        lines[0] = self._partial_line + lines[0]
+        self._partial_line = lines.pop()
+
+        output: List[str] = []
+        for line in lines:
+            self._append_line(line.rstrip(), output)
+        return "".join(output)
+
+    def flush(self) -> str:
+        """Return the normalized text that remains, and reset the normalizer."""
+        output: List[str] = []
+        self._append_line(self._partial_line.rstrip(), output)
+        output.append("\n" * min(self._pending_newlines, 2))
+
+        self._partial_line = ""
+        self._pending_newlines = 0
+        self._started = False
+        return "".join(output)
+
+    def _append_line(self, line: str, output: List[str]) -> None:
+        if self._started:
+            self._pending_newlines += 1
+        self._started = True
+
+        if line:
+            if self._pending_newlines > 0:
+                output.append("\n" * min(self._pending_newlines, 2))
+                self._pending_newlines = 0
+            output.append(line)
+
+
+def normalize_markdown(text: str) -> str:
+    """
+    Normalize line endings to LF, strip trailing whitespace from every line, and collapse
+    runs of blank lines into one. See MarkdownNormalizer.
+    """
+    normalizer = MarkdownNormalizer()
+    return normalizer.feed(text) + normalizer.flush()
@@ -1,12 +1,14 @@
 import base64
 import os
 from typing import Tuple, Dict
-from urllib.request import url2pathname
 from urllib.parse import urlparse, unquote_to_bytes
 
 
 def file_uri_to_path(file_uri: str) -> Tuple[str | None, str]:
     """Convert a file URI to a local file path"""
+    # (urllib.request is slow to import, and only needed here)
+    from urllib.request import url2pathname
+
     parsed = urlparse(file_uri)
     if parsed.scheme != "file":
         raise ValueError(f"Not a file URL: {file_uri}")
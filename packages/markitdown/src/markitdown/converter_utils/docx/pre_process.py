@@ -1,99 +1,77 @@
+import copy
+import re
+import struct
 import zipfile
 from io import BytesIO
-from typing import BinaryIO
-from xml.etree import ElementTree as ET
+from typing import Any, BinaryIO, Dict
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 
 from .math.omml import OMML_NS, oMath2Latex
 
-MATH_ROOT_TEMPLATE = "".join(
-    (
-        "<w:document ",
-        'xmlns:wpc="http://schemas.microsoft.com/office/word/2010/wordprocessingCanvas" ',
-        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" ',
-        'xmlns:o="urn:schemas-microsoft-com:office:office" ',
-        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" ',
-        'xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math" ',
-        'xmlns:v="urn:schemas-microsoft-com:vml" ',
-        'xmlns:wp14="http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing" ',
-        'xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" ',
-        'xmlns:w10="urn:schemas-microsoft-com:office:word" ',
-        'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" ',
-        'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml" ',
-        'xmlns:wpg="http://schemas.microsoft.com/office/word/2010/wordprocessingGroup" ',
-        'xmlns:wpi="http://schemas.microsoft.com/office/word/2010/wordprocessingInk" ',
-        'xmlns:wne="http://schemas.microsoft.com/office/word/2006/wordml" ',
-        'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" mc:Ignorable="w14 wp14">',
-        "{0}</w:document>",
-    )
-)
+# The files that need to be pre-processed from .docx
+PRE_PROCESS_FILES = [
+    "word/document.xml",
+    "word/footnotes.xml",
+    "word/endnotes.xml",
+]
 
+# The start tag of an OMML element (oMath, or oMathPara), whatever its namespace prefix
+_OMATH_TAG_RE = re.compile(rb"<(?:[\w.-]+:)?oMath[\s/>P]")
 
-def _convert_omath_to_latex(tag: Tag) -> str:
-    """
-    Converts an OMML (Office Math Markup Language) tag to LaTeX format.
+# Set in the flags of encrypted members
+_ENCRYPTED_FLAG = 0x01
 
-    Args:
-        tag (Tag): A BeautifulSoup Tag object representing the OMML element.
+# Set in the flags of members whose CRC and sizes follow their data, instead of their header
+_DATA_DESCRIPTOR_FLAG = 0x08
 
-    Returns:
-        str: The LaTeX representation of the OMML element.
-    """
-    # Format the tag into a complete XML document string
-    math_root = ET.fromstring(MATH_ROOT_TEMPLATE.format(str(tag)))
-    # Find the 'oMath' element within the XML document
-    math_element = math_root.find(OMML_NS + "oMath")
-    # Convert the 'oMath' element to LaTeX using the oMath2Latex function
-    latex = oMath2Latex(math_element).latex
-    return latex
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_OMATH = OMML_NS + "oMath"
+_OMATH_PARA = OMML_NS + "oMathPara"
 
 
-def _get_omath_tag_replacement(tag: Tag, block: bool = False) -> Tag:
+def _get_omath_replacement(element: Any, block: bool = False) -> Any:
     """
-    Creates a replacement tag for an OMML (Office Math Markup Language) element.
+    Creates a replacement run for an OMML (Office Math Markup Language) element.
 
     Args:
-        tag (Tag): A BeautifulSoup Tag object representing the "oMath" element.
+        element (Any): An lxml element representing the "oMath" element.
         block (bool, optional): If True, the LaTeX will be wrapped in double dollar signs for block mode. Defaults to False.
 
     Returns:
-        Tag: A BeautifulSoup Tag object representing the replacement element.
+        Any: An lxml "w:r" element, with the LaTeX as its text.
     """
-    t_tag = Tag(name="w:t")
-    t_tag.string = (
-        f"$${_convert_omath_to_latex(tag)}$$"
-        if block
-        else f"${_convert_omath_to_latex(tag)}$"
-    )
-    r_tag = Tag(name="w:r")
-    r_tag.append(t_tag)
-    return r_tag
+    latex = oMath2Latex(element).latex
+    r_element = etree.Element(W_NS + "r")
+    t_element = etree.SubElement(r_element, W_NS + "t")
+    t_element.text = f"$${latex}$$" if block else f"${latex}$"
+    return r_element
 
 
-def _replace_equations(tag: Tag):
+def _replace_equation(element: Any) -> None:
     """
-    Replaces OMML (Office Math Markup Language) elements with their LaTeX equivalents.
+    Replaces an OMML (Office Math Markup Language) element with its LaTeX equivalent, in place.
 
     Args:
-        tag (Tag): A BeautifulSoup Tag object representing the OMML element. Could be either "oMathPara" or "oMath".
+        element (Any): An lxml element representing the OMML element. Could be either "oMathPara" or "oMath".
 
     Raises:
-        ValueError: If the tag is not supported.
+        ValueError: If the element is not supported.
     """
-    if tag.name == "oMathPara":
-        # Create a new paragraph tag
-        p_tag = Tag(name="w:p")
-        # Replace each 'oMath' child tag with its LaTeX equivalent as block equations
-        for child_tag in tag.find_all("oMath"):
-            p_tag.append(_get_omath_tag_replacement(child_tag, block=True))
-        # Replace the original 'oMathPara' tag with the new paragraph tag
-        tag.replace_with(p_tag)
-    elif tag.name == "oMath":
-        # Replace the 'oMath' tag with its LaTeX equivalent as inline equation
-        tag.replace_with(_get_omath_tag_replacement(tag, block=False))
+    if element.tag == _OMATH_PARA:
+        # Create a new paragraph, with each 'oMath' element as a block equation
+        replacement = etree.Element(W_NS + "p")
+        for child in element.iter(_OMATH):
+            replacement.append(_get_omath_replacement(child, block=True))
+    elif element.tag == _OMATH:
+        # An inline equation
+        replacement = _get_omath_replacement(element, block=False)
     else:
-        raise ValueError(f"Not supported tag: {tag.name}")
+        raise ValueError(f"Not supported tag: {element.tag}")
+
+    # (lxml's replace() drops the tail of the replaced element)
+    replacement.tail = element.tail
+    element.getparent().replace(element, replacement)
 
 
 def _pre_process_math(content: bytes) -> bytes:
@@ -101,56 +79,176 @@ def _pre_process_math(content: bytes) -> bytes:
     Pre-processes the math content in a DOCX -> XML file by converting OMML (Office Math Markup Language) elements to LaTeX.
     This preprocessed content can be directly replaced in the DOCX file -> XMLs.
 
+    The content is parsed in a single event-based pass, in which each equation is converted, and
+    replaced, as soon as its end tag is parsed. The rest of the content is not touched.
+
     Args:
         content (bytes): The XML content of the DOCX file as bytes.
 
     Returns:
         bytes: The processed content with OMML elements replaced by their LaTeX equivalents, encoded as bytes.
     """
-    soup = BeautifulSoup(content.decode(), features="xml")
-    for tag in soup.find_all("oMathPara"):
-        _replace_equations(tag)
-    for tag in soup.find_all("oMath"):
-        _replace_equations(tag)
-    return str(soup).encode()
+    events = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=(_OMATH, _OMATH_PARA),
+        resolve_entities=False,
+        no_network=True,
+    )
+    for _, element in events:
+        if element.getparent() is None:
+            continue
+        if element.tag == _OMATH:
+            if next(element.iterancestors(_OMATH_PARA), None) is not None:
+                # Converted with its 'oMathPara' element, as a block equation
+                continue
+        _replace_equation(element)
+
+    tree = events.root.getroottree()
+    return etree.tostring(
+        tree,
+        xml_declaration=True,
+        encoding="UTF-8",
+        standalone=tree.docinfo.standalone,
+    )
+
+
+def _has_math(content: bytes) -> bool:
+    """
+    Checks whether the XML content contains OMML (Office Math Markup Language) elements, with a
+    scan of the raw bytes (no parsing).
+
+    Args:
+        content (bytes): The XML content of the DOCX file as bytes.
+
+    Returns:
+        bool: True if the content contains an "oMath" or "oMathPara" element.
+    """
+    return b"oMath" in content and _OMATH_TAG_RE.search(content) is not None
+
+
+def _can_copy_raw(
+    zip_input: zipfile.ZipFile, info: zipfile.ZipInfo, zip_output: zipfile.ZipFile
+) -> bool:
+    """
+    Checks whether a member can be copied as it is stored (see _copy_member): it is neither
+    encrypted nor followed by a data descriptor, and the undocumented zipfile internals that
+    the copy relies on are present.
+
+    Args:
+        zip_input (zipfile.ZipFile): The archive to copy the member from.
+        info (zipfile.ZipInfo): The member to copy.
+        zip_output (zipfile.ZipFile): The archive to copy the member to, open for writing.
+
+    Returns:
+        bool: True if the compressed data of the member can be copied verbatim.
+    """
+    return (
+        not info.flag_bits & (_ENCRYPTED_FLAG | _DATA_DESCRIPTOR_FLAG)
+        and getattr(zip_input, "fp", None) is not None
+        and getattr(zip_output, "fp", None) is not None
+        and isinstance(getattr(zip_output, "filelist", None), list)
+        and isinstance(getattr(zip_output, "NameToInfo", None), dict)
+        and hasattr(zip_output, "start_dir")
+        and callable(getattr(info, "FileHeader", None))
+        and hasattr(zipfile, "sizeFileHeader")
+    )
+
+
+def _copy_member(
+    zip_input: zipfile.ZipFile, info: zipfile.ZipInfo, zip_output: zipfile.ZipFile
+) -> None:
+    """
+    Copies a member of zip_input to zip_output as it is stored: its compressed data is copied
+    verbatim, without being decompressed and compressed again (e.g., for large images).
+
+    zipfile has no API for this, so the member is appended the way ZipFile.writestr does. Members
+    that cannot be copied this way (see _can_copy_raw) are read, and written again.
+
+    Args:
+        zip_input (zipfile.ZipFile): The archive to copy the member from.
+        info (zipfile.ZipInfo): The member to copy.
+        zip_output (zipfile.ZipFile): The archive to copy the member to, open for writing.
+    """
+    if not _can_copy_raw(zip_input, info, zip_output):
+        member = copy.copy(info)
+        member.extra = b""
+        zip_output.writestr(member, zip_input.read(info))
+        return
+
+    # Skip the local header (whose name and extra fields may differ from the central directory)
+    fp = zip_input.fp
+    assert fp is not None
+    fp.seek(info.header_offset)
+    header = fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<2H", header[26:30])
+    fp.seek(info.header_offset + len(header) + name_length + extra_length)
+    data = fp.read(info.compress_size)
+
+    member = copy.copy(info)
+    # Extra fields (e.g., timestamps) are dropped, since zip64 fields would then be duplicated
+    member.extra = b""
+
+    output_fp = zip_output.fp
+    assert output_fp is not None
+    member.header_offset = output_fp.tell()
+    output_fp.write(member.FileHeader())
+    output_fp.write(data)
+    zip_output.filelist.append(member)
+    zip_output.NameToInfo[member.filename] = member
+    zip_output.start_dir = output_fp.tell()
 
 
 def pre_process_docx(input_docx: BinaryIO) -> BinaryIO:
     """
     Pre-processes a DOCX file with provided steps.
 
-    The process works by unzipping the DOCX file in memory, transforming specific XML files
-    (such as converting OMML elements to LaTeX), and then zipping everything back into a
-    DOCX file without writing to disk.
+    The files that may need it (see PRE_PROCESS_FILES) are first scanned for OMML elements. If
+    there are none, which is the case of most documents, the input stream is returned as is
+    (at its original position). Otherwise, the DOCX file is zipped again in memory, with the
+    transformed XML files (OMML elements converted to LaTeX), and every other member copied
+    without being decompressed.
 
     Args:
         input_docx (BinaryIO): A binary input stream representing the DOCX file.
 
     Returns:
-        BinaryIO: A binary output stream representing the processed DOCX file.
+        BinaryIO: A binary stream representing the processed DOCX file, which is input_docx
+        if no pre-processing was needed.
     """
-    output_docx = BytesIO()
-    # The files that need to be pre-processed from .docx
-    pre_process_enable_files = [
-        "word/document.xml",
-        "word/footnotes.xml",
-        "word/endnotes.xml",
-    ]
+    cur_pos = input_docx.tell()
     with zipfile.ZipFile(input_docx, mode="r") as zip_input:
-        files = {name: zip_input.read(name) for name in zip_input.namelist()}
+        updated_files: Dict[str, bytes] = {}
+        for name in PRE_PROCESS_FILES:
+            try:
+                content = zip_input.read(name)
+            except KeyError:
+                continue
+            if not _has_math(content):
+                continue
+            try:
+                # Pre-process the content
+                updated_files[name] = _pre_process_math(content)
+                # In the future, if there are more pre-processing steps, they can be added here
+            except Exception:
+                # If there is an error in processing the content, keep the original content
+                pass
+
+        if not updated_files:
+            input_docx.seek(cur_pos)
+            return input_docx
+
+        output_docx = BytesIO()
         with zipfile.ZipFile(output_docx, mode="w") as zip_output:
             zip_output.comment = zip_input.comment
-            for name, content in files.items():
-                if name in pre_process_enable_files:
-                    try:
-                        # Pre-process the content
-                        updated_content = _pre_process_math(content)
-                        # In the future, if there are more pre-processing steps, they can be added here
-                        zip_output.writestr(name, updated_content)
-                    except Exception:
-                        # If there is an error in processing the content, write the original content
-                        zip_output.writestr(name, content)
+            for info in zip_input.infolist():
+                if info.filename in updated_files:
+                    # (Stored, since the archive is only read once, from memory)
+                    member = copy.copy(info)
+                    member.compress_type = zipfile.ZIP_STORED
+                    member.extra = b""
+                    zip_output.writestr(member, updated_files[info.filename])
                 else:
-                    zip_output.writestr(name, content)
+                    _copy_member(zip_input, info, zip_output)
     output_docx.seek(0)
     return output_docx
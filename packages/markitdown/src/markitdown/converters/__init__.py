@@ -9,7 +9,14 @@ from ._wikipedia_converter import WikipediaConverter
 from ._youtube_converter import YouTubeConverter
 from ._ipynb_converter import IpynbConverter
 from ._bing_serp_converter import BingSerpConverter
-from ._pdf_converter import PdfConverter
+from ._pdf_converter import (
+    PdfConverter,
+    PdfPageCoverage,
+    PdfTextCoverage,
+    PdfminerBackend,
+)
+from ._pdf_backends import PdfBackend, PypdfBackend, PypdfiumBackend
+from ._page_selection import PageSelection
 from ._docx_converter import DocxConverter
 from ._xlsx_converter import XlsxConverter, XlsConverter
 from ._pptx_converter import PptxConverter
@@ -33,6 +40,13 @@ __all__ = [
     "IpynbConverter",
     "BingSerpConverter",
     "PdfConverter",
+    "PdfPageCoverage",
+    "PdfTextCoverage",
+    "PdfBackend",
+    "PdfminerBackend",
+    "PypdfiumBackend",
+    "PypdfBackend",
+    "PageSelection",
     "DocxConverter",
     "XlsxConverter",
     "XlsConverter",
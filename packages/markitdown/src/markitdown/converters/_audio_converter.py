@@ -4,6 +4,7 @@ from ._exiftool import exiftool_metadata
 from ._transcribe_audio import transcribe_audio
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
 from .._exceptions import MissingDependencyException
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -43,6 +44,12 @@ class AudioConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -3,11 +3,10 @@ import base64
 import binascii
 from urllib.parse import parse_qs, urlparse
 from typing import Any, BinaryIO
-from bs4 import BeautifulSoup
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from ._markdownify import _CustomMarkdownify
+from .._dispatch_index import DispatchHints
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -19,6 +18,8 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+BING_SERP_URL_PATTERN = r"^https://www\.bing\.com/search\?q="
+
 
 class BingSerpConverter(DocumentConverter):
     """
@@ -40,7 +41,7 @@ class BingSerpConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if not re.search(r"^https://www\.bing\.com/search\?q=", url):
+        if not re.search(BING_SERP_URL_PATTERN, url):
             # Not a Bing SERP URL
             return False
 
@@ -54,12 +55,22 @@ class BingSerpConverter(DocumentConverter):
         # Not HTML content
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+            url_patterns=[BING_SERP_URL_PATTERN],
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        from bs4 import BeautifulSoup
+        from ._markdownify import _CustomMarkdownify
+
         assert stream_info.url is not None
 
         # Parse the query parameters
@@ -1,9 +1,10 @@
 import csv
 import io
 from typing import BinaryIO, Any
-from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._stream_utils import read_as_buffer
+from .._dispatch_index import DispatchHints
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/csv",
@@ -35,6 +36,12 @@ class CsvConverter(DocumentConverter):
                 return True
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -43,9 +50,11 @@ class CsvConverter(DocumentConverter):
     ) -> DocumentConverterResult:
         # Read the file content
         if stream_info.charset:
-            content = file_stream.read().decode(stream_info.charset)
+            content = str(read_as_buffer(file_stream), stream_info.charset)
         else:
-            content = str(from_bytes(file_stream.read()).best())
+            from charset_normalizer import from_bytes
+
+            content = str(from_bytes(bytes(read_as_buffer(file_stream))).best())
 
         # Parse CSV content
         reader = csv.reader(io.StringIO(content))
@@ -1,17 +1,17 @@
-import sys
 import re
 import os
-from typing import BinaryIO, Any, List
+from typing import BinaryIO, Any, List, TYPE_CHECKING
 from enum import Enum
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
 from .._exceptions import MissingDependencyException
+from .._import_utils import OptionalDependencies
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
+# Optional (but in this case, required) dependencies are slow to import, so they are imported
+# on first use. Exceptions are saved for reporting later (see OptionalDependencies)
+if TYPE_CHECKING:
     from azure.ai.documentintelligence import DocumentIntelligenceClient
     from azure.ai.documentintelligence.models import (
         AnalyzeDocumentRequest,
@@ -20,31 +20,22 @@ try:
     )
     from azure.core.credentials import AzureKeyCredential, TokenCredential
     from azure.identity import DefaultAzureCredential
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
 
-    # Define these types for type hinting when the package is not available
-    class AzureKeyCredential:
-        pass
 
-    class TokenCredential:
-        pass
-
-    class DocumentIntelligenceClient:
-        pass
-
-    class AnalyzeDocumentRequest:
-        pass
-
-    class AnalyzeResult:
-        pass
+def _import_dependencies() -> None:
+    global DocumentIntelligenceClient, AnalyzeDocumentRequest, AnalyzeResult
+    global DocumentAnalysisFeature, AzureKeyCredential, DefaultAzureCredential
+    from azure.ai.documentintelligence import DocumentIntelligenceClient
+    from azure.ai.documentintelligence.models import (
+        AnalyzeDocumentRequest,
+        AnalyzeResult,
+        DocumentAnalysisFeature,
+    )
+    from azure.core.credentials import AzureKeyCredential
+    from azure.identity import DefaultAzureCredential
 
-    class DocumentAnalysisFeature:
-        pass
 
-    class DefaultAzureCredential:
-        pass
+_dependencies = OptionalDependencies(_import_dependencies)
 
 
 # TODO: currently, there is a bug in the document intelligence SDK with importing the "ContentFormat" enum.
@@ -130,7 +121,7 @@ class DocumentIntelligenceConverter(DocumentConverter):
         *,
         endpoint: str,
         api_version: str = "2024-07-31-preview",
-        credential: AzureKeyCredential | TokenCredential | None = None,
+        credential: "AzureKeyCredential | TokenCredential | None" = None,
         file_types: List[DocumentIntelligenceFileType] = [
             DocumentIntelligenceFileType.DOCX,
             DocumentIntelligenceFileType.PPTX,
@@ -158,6 +149,7 @@ class DocumentIntelligenceConverter(DocumentConverter):
         # Raise an error if the dependencies are not available.
         # This is different than other converters since this one isn't even instantiated
         # unless explicitly requested.
+        _dependency_exc_info = _dependencies.load()
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 "DocumentIntelligenceConverter requires the optional dependency [az-doc-intel] (or [all]) to be installed. E.g., `pip install markitdown[az-doc-intel]`"
@@ -199,6 +191,12 @@ class DocumentIntelligenceConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=_get_file_extensions(self._file_types),
+            mimetype_prefixes=_get_mime_type_prefixes(self._file_types),
+        )
+
     def _analysis_features(self, stream_info: StreamInfo) -> List[str]:
         """
         Helper needed to determine which analysis features to use.
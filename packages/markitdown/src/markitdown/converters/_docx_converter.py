@@ -1,21 +1,40 @@
-import sys
-
-from typing import BinaryIO, Any
+import base64
+import re
+from typing import BinaryIO, Any, Dict, TYPE_CHECKING
 
 from ._html_converter import HtmlConverter
-from ..converter_utils.docx.pre_process import pre_process_docx
 from .._base_converter import DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._import_utils import OptionalDependencies
+
+# Optional (but in this case, required) dependencies are slow to import, so they are imported
+# on first use. Exceptions are saved for reporting later (see OptionalDependencies)
+if TYPE_CHECKING:
+    import mammoth
+
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
+def _import_dependencies() -> None:
+    global mammoth
     import mammoth
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+    import lxml.etree  # (Used to pre-process the math of documents)
+
+
+_dependencies = OptionalDependencies(_import_dependencies)
+
+
+def _image_attributes(image: Any) -> Dict[str, str]:
+    """
+    The attributes of the <img> element of an image, as mammoth's default (a data URI), except that
+    the line breaks of the alt text become spaces, as when the XML attribute holds them unescaped.
+    """
+    with image.open() as image_bytes:
+        encoded_src = base64.b64encode(image_bytes.read()).decode("ascii")
+    attributes = {"src": f"data:{image.content_type};base64,{encoded_src}"}
+    if image.alt_text:
+        attributes["alt"] = re.sub(r"[\r\n\t]", " ", image.alt_text)
+    return attributes
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -52,6 +71,12 @@ class DocxConverter(HtmlConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -59,6 +84,7 @@ class DocxConverter(HtmlConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         # Check: the dependencies
+        _dependency_exc_info = _dependencies.load()
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -73,8 +99,14 @@ class DocxConverter(HtmlConverter):
             )
 
         style_map = kwargs.get("style_map", None)
+        from ..converter_utils.docx.pre_process import pre_process_docx
+
         pre_process_stream = pre_process_docx(file_stream)
         return self._html_converter.convert_string(
-            mammoth.convert_to_html(pre_process_stream, style_map=style_map).value,
+            mammoth.convert_to_html(
+                pre_process_stream,
+                style_map=style_map,
+                convert_image=mammoth.images.img_element(_image_attributes),
+            ).value,
             **kwargs,
         )
@@ -2,6 +2,7 @@ import json
 import subprocess
 import locale
 from typing import BinaryIO, Any, Union
+from .._stream_utils import read_as_buffer
 
 
 def exiftool_metadata(
@@ -18,7 +19,7 @@ def exiftool_metadata(
     try:
         output = subprocess.run(
             [exiftool_path, "-json", "-"],
-            input=file_stream.read(),
+            input=read_as_buffer(file_stream),
             capture_output=True,
             text=False,
         ).stdout
@@ -1,10 +1,9 @@
 import io
 from typing import Any, BinaryIO, Optional
-from bs4 import BeautifulSoup
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from ._markdownify import _CustomMarkdownify
+from .._dispatch_index import DispatchHints
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -38,12 +37,22 @@ class HtmlConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        # bs4 and markdownify are slow to import, so they are imported on first use
+        from bs4 import BeautifulSoup
+        from ._markdownify import _CustomMarkdownify
+
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
         soup = BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
@@ -4,6 +4,8 @@ import mimetypes
 from ._exiftool import exiftool_metadata
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._stream_utils import read_as_buffer
+from .._dispatch_index import DispatchHints
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "image/jpeg",
@@ -36,6 +38,12 @@ class ImageConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -108,7 +116,7 @@ class ImageConverter(DocumentConverter):
         # Convert to base64
         cur_pos = file_stream.tell()
         try:
-            base64_image = base64.b64encode(file_stream.read()).decode("utf-8")
+            base64_image = base64.b64encode(read_as_buffer(file_stream)).decode("utf-8")
         except Exception as e:
             return None
         finally:
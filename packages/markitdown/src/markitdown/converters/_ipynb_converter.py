@@ -4,6 +4,8 @@ import json
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import FileConversionException
 from .._stream_info import StreamInfo
+from .._stream_utils import read_as_buffer
+from .._dispatch_index import DispatchHints
 
 CANDIDATE_MIME_TYPE_PREFIXES = [
     "application/json",
@@ -33,7 +35,7 @@ class IpynbConverter(DocumentConverter):
                 cur_pos = file_stream.tell()
                 try:
                     encoding = stream_info.charset or "utf-8"
-                    notebook_content = file_stream.read().decode(encoding)
+                    notebook_content = str(read_as_buffer(file_stream), encoding)
                     return (
                         "nbformat" in notebook_content
                         and "nbformat_minor" in notebook_content
@@ -43,6 +45,12 @@ class IpynbConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=CANDIDATE_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -51,7 +59,7 @@ class IpynbConverter(DocumentConverter):
     ) -> DocumentConverterResult:
         # Parse and convert the notebook
         encoding = stream_info.charset or "utf-8"
-        notebook_content = file_stream.read().decode(encoding=encoding)
+        notebook_content = str(read_as_buffer(file_stream), encoding)
         return self._convert(json.loads(notebook_content))
 
     def _convert(self, notebook_content: dict) -> DocumentConverterResult:
@@ -2,6 +2,7 @@ from typing import BinaryIO, Union
 import base64
 import mimetypes
 from .._stream_info import StreamInfo
+from .._stream_utils import read_as_buffer
 
 
 def llm_caption(
@@ -20,7 +21,7 @@ def llm_caption(
     # Convert to base64
     cur_pos = file_stream.tell()
     try:
-        base64_image = base64.b64encode(file_stream.read()).decode("utf-8")
+        base64_image = base64.b64encode(read_as_buffer(file_stream)).decode("utf-8")
     except Exception as e:
         return None
     finally:
@@ -1,18 +1,20 @@
-import sys
 from typing import Any, Union, BinaryIO
 from .._stream_info import StreamInfo
-from .._base_converter import DocumentConverter, DocumentConverterResult
+from .._base_converter import DocumentConverter, DocumentConverterResult, cached_probe
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._import_utils import OptionalDependencies
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
+# Optional (but in this case, required) dependencies are slow to import, so they are imported
+# on first use. Exceptions are saved for reporting later (see OptionalDependencies)
 olefile = None
-try:
+
+
+def _import_dependencies() -> None:
+    global olefile
     import olefile  # type: ignore[no-redef]
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+
+
+_dependencies = OptionalDependencies(_import_dependencies)
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "application/vnd.ms-outlook",
@@ -46,7 +48,16 @@ class OutlookMsgConverter(DocumentConverter):
             if mimetype.startswith(prefix):
                 return True
 
+        # Brute force (once per stream, whatever the guess)
+        return cached_probe(
+            kwargs,
+            f"{__name__}.is_outlook_msg",
+            lambda: self._is_outlook_msg(file_stream),
+        )
+
+    def _is_outlook_msg(self, file_stream: BinaryIO) -> bool:
         # Brute force, check if we have an OLE file
+        _dependencies.load()
         cur_pos = file_stream.tell()
         try:
             if olefile and not olefile.isOleFile(file_stream):
@@ -77,6 +88,7 @@ class OutlookMsgConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         # Check: the dependencies
+        _dependency_exc_info = _dependencies.load()
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -0,0 +1,103 @@
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple, Union
+
+# A page reference: a page number ("12"), the last page ("z"), or the n-th page from the end ("r3")
+_PAGE_PATTERN = r"(?:\d+|z|r\d+)"
+_ITEM_RE = re.compile(rf"^({_PAGE_PATTERN})?(?:(-)({_PAGE_PATTERN})?)?$")
+
+# A page, as a 1-based page number, or a 1-based position from the end (when from_end is True)
+_PageRef = Tuple[int, bool]
+
+
+def _parse_page(token: str) -> _PageRef:
+    if token == "z":
+        return (1, True)
+    if token.startswith("r"):
+        number, from_end = int(token[1:]), True
+    else:
+        number, from_end = int(token), False
+    if number < 1:
+        raise ValueError(f"Invalid page: {token}. Pages are numbered from 1.")
+    return (number, from_end)
+
+
+@dataclass(frozen=True)
+class PageSelection:
+    """
+    A selection of pages, parsed from a specification like "1-5,8,12-" (see parse). Pages are
+    always extracted in document order, whatever the order of the specification.
+    """
+
+    # Inclusive ranges of page references
+    ranges: Tuple[Tuple[_PageRef, _PageRef], ...]
+
+    @classmethod
+    def parse(
+        cls, spec: Union[str, int, Iterable[int], "PageSelection"]
+    ) -> "PageSelection":
+        """
+        Parse a page selection. The specification is a comma-separated list of items, each of
+        which is a page or an inclusive range of pages. Pages are numbered from 1, "z" is the
+        last page, and "rN" is the N-th page from the end (so "r1" is "z"). For example:
+
+        - "1-5": the first 5 pages
+        - "r5-z": the last 5 pages
+        - "3,7,10-": pages 3 and 7, and pages 10 to the end
+        - "-4": pages 1 to 4
+
+        A page number, or an iterable of page numbers (e.g., range(1, 6)), is also accepted.
+        Pages beyond the end of the document are ignored, as are ranges that are empty once
+        resolved (e.g., "r1-2", in a 5-page document).
+        """
+        if isinstance(spec, PageSelection):
+            return spec
+        if isinstance(spec, int):
+            spec = [spec]
+        if not isinstance(spec, str):
+            refs = [_parse_page(str(number)) for number in spec]
+            return cls(ranges=tuple((ref, ref) for ref in refs))
+
+        ranges = []
+        for item in spec.replace(" ", "").lower().split(","):
+            match = _ITEM_RE.match(item)
+            if not item or match is None or match.group(0) == "-":
+                raise ValueError(f"Invalid page selection: {spec!r}")
+            first, dash, last = match.groups()
+            start = _parse_page(first) if first else (1, False)
+            if dash is None:
+                end = start
+            else:
+                end = _parse_page(last) if last else (1, True)
+            if not start[1] and not end[1] and start[0] > end[0]:
+                raise ValueError(f"Invalid page range: {item!r}")
+            ranges.append((start, end))
+        return cls(ranges=tuple(ranges))
+
+    @property
+    def needs_page_count(self) -> bool:
+        """True if the selection refers to pages from the end, so the page count must be known."""
+        return any(start[1] or end[1] for start, end in self.ranges)
+
+    def resolve(self, num_pages: Optional[int] = None) -> List[int]:
+        """
+        Return the sorted, 0-based numbers of the selected pages. num_pages is required if
+        needs_page_count is True. Otherwise, it is optional, and pages beyond it are dropped.
+        """
+        if num_pages is None and self.needs_page_count:
+            raise ValueError("The page count is needed to resolve this page selection")
+
+        def _index(ref: _PageRef) -> int:
+            number, from_end = ref
+            if from_end:
+                assert num_pages is not None
+                return num_pages - number
+            return number - 1
+
+        selected = set()
+        for start, end in self.ranges:
+            first, last = _index(start), _index(end)
+            if num_pages is not None:
+                first, last = max(first, 0), min(last, num_pages - 1)
+            selected.update(range(first, last + 1))
+        return sorted(selected)
@@ -0,0 +1,166 @@
+# The text extraction backends of PdfConverter that use other engines than pdfminer (which is in
+# _pdf_converter). Each backend imports its engine on first use, so this module is cheap to import.
+import importlib.util
+import io
+import threading
+from typing import Any, BinaryIO, Iterator, List, Optional, Tuple
+
+from .._exceptions import MissingDependencyException
+from .._stream_utils import read_as_buffer
+
+# PDFium is not thread-safe, so all calls into it, from any thread, are serialized
+_pdfium_lock = threading.Lock()
+
+
+def _format_page(text: str) -> str:
+    """Format the text of a page like pdfminer does: ended by a form feed, which is alone if the page is empty."""
+    text = text.rstrip()
+    return f"{text}\n\f" if text else "\f"
+
+
+class PdfBackend:
+    """
+    An engine that extracts the text of PDFs, for PdfConverter (see its pdf_backend option).
+
+    Backends share the conventions of PdfConverter, so that its page selection, page markers and
+    parallel extraction work with any of them: pages are numbered from 0, and the text of each
+    page ends with a form feed (a page with no text is a lone form feed). Backends must be
+    picklable, since they are sent to the worker processes of parallel extractions.
+    """
+
+    name: str = ""
+    module: str = ""  # The module that the backend imports
+    package: str = ""  # The package that provides it
+    reports_text_coverage: bool = False  # See extract_pages
+
+    def is_available(self) -> bool:
+        """True if the engine is installed (without importing it)."""
+        return importlib.util.find_spec(self.module) is not None
+
+    def check_dependencies(self) -> None:
+        """Raise MissingDependencyException if the engine is not installed."""
+        if not self.is_available():
+            raise MissingDependencyException(
+                f"The {self.name} PDF backend requires the {self.package} package. "
+                f"Install it with `pip install {self.package}`, or use another pdf_backend."
+            )
+
+    def count_pages(self, file_stream: BinaryIO) -> int:
+        """Count the pages of the document. The position of file_stream is kept."""
+        raise NotImplementedError()
+
+    def extract_pages(
+        self,
+        file_stream: BinaryIO,
+        page_numbers: Optional[List[int]],
+        mode: str,
+        coverage: Optional[List[Any]] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the (0-based) number and the text of each selected page (all pages if page_numbers
+        is None), in order, as it is extracted. page_numbers is sorted, and pages beyond the end
+        of the document are ignored. mode is one of PDF_MODES, which backends interpret as best
+        they can.
+
+        Backends that scan the text layer of the pages (if reports_text_coverage is True) append
+        the PdfPageCoverage of each page to coverage, if it is given. Others ignore it.
+        """
+        raise NotImplementedError()
+
+
+class PypdfiumBackend(PdfBackend):
+    """
+    Extracts text with PDFium (through pypdfium2), the engine of Chrome. Typically much faster
+    than pdfminer, and robust to malformed documents. Text is extracted in the order in which it
+    is drawn, with line breaks, so the mode is ignored.
+    """
+
+    name = "pypdfium2"
+    module = "pypdfium2"
+    package = "pypdfium2"
+
+    def count_pages(self, file_stream: BinaryIO) -> int:
+        import pypdfium2
+
+        cur_pos = file_stream.tell()
+        try:
+            with _pdfium_lock:
+                document = pypdfium2.PdfDocument(bytes(read_as_buffer(file_stream)))
+                try:
+                    return len(document)
+                finally:
+                    document.close()
+        finally:
+            file_stream.seek(cur_pos)
+
+    def extract_pages(
+        self,
+        file_stream: BinaryIO,
+        page_numbers: Optional[List[int]],
+        mode: str,
+        coverage: Optional[List[Any]] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        import pypdfium2
+
+        # (The lock is not held while the caller consumes a page, which may take any time)
+        with _pdfium_lock:
+            document = pypdfium2.PdfDocument(bytes(read_as_buffer(file_stream)))
+        try:
+            num_pages = len(document)
+            if page_numbers is None:
+                page_numbers = list(range(num_pages))
+            for number in page_numbers:
+                if number >= num_pages:
+                    break
+                with _pdfium_lock:
+                    page = document[number]
+                    text_page = page.get_textpage()
+                    text = text_page.get_text_range()
+                    text_page.close()
+                    page.close()
+                yield number, _format_page(text.replace("\r\n", "\n"))
+        finally:
+            with _pdfium_lock:
+                document.close()
+
+
+class PypdfBackend(PdfBackend):
+    """
+    Extracts text with pypdf, a pure-Python library. Usually several times faster than pdfminer.
+    The layout mode uses pypdf's layout extraction, which keeps the positions of the text with
+    spaces; the other modes use its plain extraction.
+    """
+
+    name = "pypdf"
+    module = "pypdf"
+    package = "pypdf"
+
+    def count_pages(self, file_stream: BinaryIO) -> int:
+        import pypdf
+
+        cur_pos = file_stream.tell()
+        try:
+            return len(pypdf.PdfReader(io.BytesIO(read_as_buffer(file_stream))).pages)
+        finally:
+            file_stream.seek(cur_pos)
+
+    def extract_pages(
+        self,
+        file_stream: BinaryIO,
+        page_numbers: Optional[List[int]],
+        mode: str,
+        coverage: Optional[List[Any]] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        import pypdf
+
+        reader = pypdf.PdfReader(io.BytesIO(read_as_buffer(file_stream)))
+        num_pages = len(reader.pages)
+        if page_numbers is None:
+            page_numbers = list(range(num_pages))
+
+        extraction_mode = "layout" if mode == "layout" else "plain"
+        for number in page_numbers:
+            if number >= num_pages:
+                break
+            text = reader.pages[number].extract_text(extraction_mode=extraction_mode)
+            yield number, _format_page(text)
@@ -1,23 +1,62 @@
-import sys
 import io
+import itertools
+from dataclasses import asdict, dataclass
 
-from typing import BinaryIO, Any
+from typing import (
+    BinaryIO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._import_utils import OptionalDependencies
+from .._stream_utils import read_as_buffer
+from ._page_selection import PageSelection
+from ._pdf_backends import PdfBackend, PypdfBackend, PypdfiumBackend
 
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
+# Optional (but in this case, required) dependencies are slow to import, so they are imported
+# on first use. Exceptions are saved for reporting later (see OptionalDependencies)
+if TYPE_CHECKING:
     import pdfminer
     import pdfminer.high_level
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
+    from ._pdf_raw_device import RawTextDevice
+    from ._pdf_text_layer import scan_text_layer
+
+
+def _import_dependencies() -> None:
+    global pdfminer, TextConverter, LAParams, PDFDocument
+    global PDFPageInterpreter, PDFResourceManager, PDFPage, PDFParser, RawTextDevice
+    global scan_text_layer
+    import pdfminer
+    import pdfminer.high_level
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
+    from ._pdf_raw_device import RawTextDevice
+    from ._pdf_text_layer import scan_text_layer
+
+
+_dependencies = OptionalDependencies(_import_dependencies)
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -27,10 +66,270 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".pdf"]
 
+# The extraction modes (see PdfConverter)
+PDF_MODES = ("fast", "balanced", "layout")
+DEFAULT_PDF_MODE = "balanced"
+
+# Documents with fewer (selected) pages are extracted serially, even if pdf_workers is set
+DEFAULT_PARALLEL_MIN_PAGES = 16
+
+# Each worker's share of the pages is split into this many chunks, to balance uneven pages
+_CHUNKS_PER_WORKER = 4
+
+# The metadata of results that holds their text coverage (see PdfTextCoverage.from_result)
+_TEXT_COVERAGE_METADATA = "text_coverage"
+
+# The document being extracted by a worker process of a parallel extraction (see _init_page_worker)
+_worker_pdf_data: Optional[bytes] = None
+
+
+@dataclass(frozen=True)
+class PdfPageCoverage:
+    """The text layer of a page of a PDF (see PdfConverter.analyze)."""
+
+    page: int  # The page number, from 1
+    text_operators: int  # The number of operators that show text
+    images: int  # The number of images (in the page's resources, or inline)
+
+    @property
+    def has_text(self) -> bool:
+        return self.text_operators > 0
+
+
+@dataclass(frozen=True)
+class PdfTextCoverage:
+    """The text layers of the (selected) pages of a PDF (see PdfConverter.analyze)."""
+
+    pages: Tuple[PdfPageCoverage, ...]
+
+    @property
+    def text_pages(self) -> List[int]:
+        """The numbers of the pages that have a text layer."""
+        return [page.page for page in self.pages if page.has_text]
+
+    @property
+    def image_only_pages(self) -> List[int]:
+        """The numbers of the pages that have images, but no text layer (e.g., scanned pages)."""
+        return [page.page for page in self.pages if not page.has_text and page.images]
+
+    @property
+    def coverage(self) -> float:
+        """The fraction of the pages that have a text layer."""
+        if len(self.pages) == 0:
+            return 0.0
+        return len(self.text_pages) / len(self.pages)
+
+    @property
+    def is_scanned(self) -> bool:
+        """True if no page has a text layer, but some have images: the document needs OCR."""
+        return len(self.text_pages) == 0 and len(self.image_only_pages) > 0
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Return the coverage as JSON-serializable metadata (see DocumentConverterResult.metadata)."""
+        return {"pages": [asdict(page) for page in self.pages]}
+
+    @classmethod
+    def from_result(
+        cls, result: DocumentConverterResult
+    ) -> Optional["PdfTextCoverage"]:
+        """
+        Return the text coverage reported by the result of a conversion (see PdfConverter), or None
+        if there is none (e.g., the document is not a PDF, or the backend does not scan text layers).
+        """
+        metadata = result.metadata.get(_TEXT_COVERAGE_METADATA)
+        if metadata is None:
+            return None
+        return cls(pages=tuple(PdfPageCoverage(**page) for page in metadata["pages"]))
+
+
+def _make_device(mode: str, resource_manager: Any, output: io.StringIO) -> Any:
+    """Create the pdfminer device that extracts the text of the pages in the given mode."""
+    if mode == "fast":
+        return RawTextDevice(resource_manager, output)
+    if mode == "layout":
+        laparams = LAParams(all_texts=True, detect_vertical=True)
+    else:
+        laparams = LAParams()
+    return TextConverter(resource_manager, output, codec="utf-8", laparams=laparams)
+
+
+def _get_pages(
+    file_stream: BinaryIO, page_numbers: Optional[List[int]]
+) -> Iterable[Tuple[int, Any]]:
+    """
+    Return the (0-based) numbers and the pdfminer PDFPages of the selected pages (all pages if
+    page_numbers is None). If page_numbers (sorted, and not empty) is given, pages after the last
+    selected one are not even read.
+    """
+    if page_numbers is None:
+        return enumerate(PDFPage.get_pages(file_stream, caching=True))
+
+    # (get_pages yields the selected pages that exist, in order)
+    return zip(
+        page_numbers,
+        PDFPage.get_pages(
+            file_stream,
+            pagenos=set(page_numbers),
+            maxpages=page_numbers[-1] + 1,
+            caching=True,
+        ),
+    )
+
+
+def _extract_pages(
+    file_stream: BinaryIO,
+    page_numbers: Optional[List[int]],
+    mode: str,
+    coverage: Optional[List[PdfPageCoverage]] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield the (0-based) number and the text of each selected page, as it is extracted. Pages with
+    no text layer (e.g., scanned pages) are found by a cheap scan of their content streams, and
+    are not interpreted. In the balanced mode, the concatenated text of all pages is the same as
+    that of pdfminer's extract_text. The scan of each page is appended to coverage, if given.
+    """
+    output = io.StringIO()
+    resource_manager = PDFResourceManager(caching=True)
+    device = _make_device(mode, resource_manager, output)
+    interpreter = PDFPageInterpreter(resource_manager, device)
+
+    for number, page in _get_pages(file_stream, page_numbers):
+        text_operators, images = scan_text_layer(page)
+        if coverage is not None:
+            coverage.append(PdfPageCoverage(number + 1, text_operators, images))
+        if text_operators == 0:
+            # (All devices output an empty page as a lone form feed)
+            yield number, "\f"
+            continue
+
+        interpreter.process_page(page)
+        yield number, output.getvalue()
+        output.seek(0)
+        output.truncate()
+
+
+def _count_pages(file_stream: BinaryIO) -> int:
+    """Count the pages of the document, reading only its page tree (not the contents of the pages)."""
+    cur_pos = file_stream.tell()
+    try:
+        document = PDFDocument(PDFParser(file_stream))
+        return sum(1 for _ in PDFPage.create_pages(document))
+    finally:
+        file_stream.seek(cur_pos)
+
+
+class PdfminerBackend(PdfBackend):
+    """
+    Extracts text with pdfminer, in any of the modes of PdfConverter. Pages with no text layer
+    (e.g., scanned pages) are found by a cheap scan of their content streams, and are not
+    interpreted. This is the default backend.
+    """
+
+    name = "pdfminer"
+    module = "pdfminer"
+    package = "pdfminer.six"
+    reports_text_coverage = True
+
+    def check_dependencies(self) -> None:
+        _dependency_exc_info = _dependencies.load()
+        if _dependency_exc_info is not None:
+            raise MissingDependencyException(
+                MISSING_DEPENDENCY_MESSAGE.format(
+                    converter=PdfConverter.__name__,
+                    extension=".pdf",
+                    feature="pdf",
+                )
+            ) from _dependency_exc_info[
+                1
+            ].with_traceback(  # type: ignore[union-attr]
+                _dependency_exc_info[2]
+            )
+
+    def count_pages(self, file_stream: BinaryIO) -> int:
+        return _count_pages(file_stream)
+
+    def extract_pages(
+        self,
+        file_stream: BinaryIO,
+        page_numbers: Optional[List[int]],
+        mode: str,
+        coverage: Optional[List[Any]] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        return _extract_pages(file_stream, page_numbers, mode, coverage)
+
+
+# The backends, by name (see PdfConverter's pdf_backend option)
+PDF_BACKENDS: Dict[str, PdfBackend] = {
+    backend.name: backend
+    for backend in (PdfminerBackend(), PypdfiumBackend(), PypdfBackend())
+}
+DEFAULT_PDF_BACKEND = "pdfminer"
+
+# The order in which pdf_backend="auto" tries the backends: the fastest installed one is used
+AUTO_PDF_BACKENDS = ("pypdfium2", "pypdf", "pdfminer")
+
+
+def _init_page_worker(data: bytes) -> None:
+    """Receive the document, once, when a worker process of a parallel extraction starts."""
+    global _worker_pdf_data
+    _worker_pdf_data = data
+
+
+def _extract_page_chunk(
+    page_numbers: List[int], mode: str, backend: PdfBackend
+) -> Tuple[List[Tuple[int, str]], List[PdfPageCoverage]]:
+    """
+    Extract the text of some pages of the worker's document, opening it independently. Returns
+    the pages, and their text coverage (if the backend reports it).
+    """
+    assert _worker_pdf_data is not None
+    backend.check_dependencies()
+    coverage: List[PdfPageCoverage] = []
+    pages = list(
+        backend.extract_pages(
+            io.BytesIO(_worker_pdf_data), page_numbers, mode, coverage
+        )
+    )
+    return pages, coverage
+
+
+def _split_pages(page_numbers: List[int], num_chunks: int) -> List[List[int]]:
+    """Split the pages into num_chunks contiguous chunks of (almost) equal length."""
+    num_chunks = max(1, min(len(page_numbers), num_chunks))
+    bounds = [len(page_numbers) * i // num_chunks for i in range(num_chunks + 1)]
+    return [page_numbers[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
 
 class PdfConverter(DocumentConverter):
     """
     Converts PDFs to Markdown. Most style information is ignored, so the results are essentially plain-text.
+
+    Options (passed to convert() or convert_iter()):
+    - pdf_backend: The engine that extracts the text: "pdfminer" (the default), "pypdfium2" or
+      "pypdf" (see PDF_BACKENDS), "auto" for the fastest one that is installed, or a PdfBackend.
+      All backends follow the same conventions, so the other options work with any of them.
+    - pdf_mode: The extraction mode, which trades layout fidelity for speed:
+      - "fast": The text runs of each page are written in the order in which they are drawn,
+        with no layout analysis (see RawTextDevice). Typically an order of magnitude faster.
+      - "balanced": pdfminer's default layout analysis, which groups characters into lines
+        and text boxes. This is the default.
+      - "layout": The full layout analysis, which also groups the text of figures, and
+        detects vertical text. Slower, but recovers text that the balanced mode misses.
+      Backends other than pdfminer interpret the modes as best they can (see their docstrings).
+    - pages: Only extract these pages, e.g. "1-5" (the first 5 pages), "r5-z" (the last 5 pages),
+      or "3,7,10-". See PageSelection.parse. Unselected pages are not parsed.
+    - pdf_page_markers: Precede the text of each page with a marker, e.g. <!-- Page 12 -->.
+    - pdf_workers: If greater than 1, extract the pages in parallel, in up to this many worker
+      processes. The pages are split into chunks, each of which is extracted by a worker that
+      opens the document independently, and the text is reassembled in order. The output is
+      the same as that of a serial extraction.
+    - pdf_parallel_min_pages: Extract documents with fewer (selected) pages serially, since
+      starting the workers would cost more than it saves. Default: 16.
+
+    With pdfminer, pages with no text layer (e.g., scanned pages) are detected by a cheap scan of
+    their content streams, and are not extracted. The result of convert() then reports the text
+    coverage of the pages (see PdfTextCoverage.from_result), so that callers can route
+    scans to OCR. Use analyze() to find them before converting.
     """
 
     def accepts(
@@ -51,27 +350,206 @@ class PdfConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Check the dependencies
-        if _dependency_exc_info is not None:
-            raise MissingDependencyException(
-                MISSING_DEPENDENCY_MESSAGE.format(
-                    converter=type(self).__name__,
-                    extension=".pdf",
-                    feature="pdf",
+        backend = self._get_backend(kwargs)
+        coverage: List[PdfPageCoverage] = []
+        markdown = "".join(self._iter_markdown(file_stream, backend, kwargs, coverage))
+        metadata: Dict[str, Any] = {}
+        if backend.reports_text_coverage:
+            metadata[_TEXT_COVERAGE_METADATA] = PdfTextCoverage(
+                pages=tuple(coverage)
+            ).to_metadata()
+        return DocumentConverterResult(markdown=markdown, metadata=metadata)
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """Yield the text of each (selected) page, in order, as it is extracted."""
+        yield from self._iter_markdown(
+            file_stream, self._get_backend(kwargs), kwargs, None
+        )
+
+    def _iter_markdown(
+        self,
+        file_stream: BinaryIO,
+        backend: PdfBackend,
+        kwargs: Dict[str, Any],
+        coverage: Optional[List[PdfPageCoverage]],
+    ) -> Iterator[str]:
+        """Yield the Markdown of each selected page, collecting their text coverage (if given)."""
+        backend.check_dependencies()
+
+        page_markers = kwargs.get("pdf_page_markers", False)
+        for number, text in self._iter_pages(file_stream, backend, kwargs, coverage):
+            if page_markers:
+                # The marker replaces the form feed that ends each page
+                page_text = text.rstrip()
+                yield f"<!-- Page {number + 1} -->\n\n{page_text}\n\n"
+            else:
+                yield text
+
+    def _iter_pages(
+        self,
+        file_stream: BinaryIO,
+        backend: PdfBackend,
+        kwargs: Dict[str, Any],
+        coverage: Optional[List[PdfPageCoverage]] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """Yield the number and text of each selected page, extracting them serially or in parallel."""
+        mode = kwargs.get("pdf_mode") or DEFAULT_PDF_MODE
+        if mode not in PDF_MODES:
+            raise ValueError(
+                f"Invalid pdf_mode: {mode}. Expected one of: {', '.join(PDF_MODES)}"
+            )
+
+        page_numbers = self._select_pages(file_stream, backend, kwargs)
+        if page_numbers is not None and len(page_numbers) == 0:
+            return
+
+        chunks = self._get_parallel_chunks(file_stream, page_numbers, backend, kwargs)
+        if chunks is None:
+            yield from backend.extract_pages(file_stream, page_numbers, mode, coverage)
+        else:
+            yield from self._extract_parallel(
+                file_stream, chunks, mode, backend, kwargs, coverage
+            )
+
+    def _get_backend(self, kwargs: Dict[str, Any]) -> PdfBackend:
+        """Return the backend selected by the pdf_backend option."""
+        backend = kwargs.get("pdf_backend") or DEFAULT_PDF_BACKEND
+        if isinstance(backend, PdfBackend):
+            return backend
+        if backend == "auto":
+            for name in AUTO_PDF_BACKENDS:
+                if PDF_BACKENDS[name].is_available():
+                    return PDF_BACKENDS[name]
+            return PDF_BACKENDS[DEFAULT_PDF_BACKEND]
+        if backend not in PDF_BACKENDS:
+            raise ValueError(
+                f"Invalid pdf_backend: {backend}. Expected one of: {', '.join(PDF_BACKENDS)}, auto"
+            )
+        return PDF_BACKENDS[backend]
+
+    def analyze(self, file_stream: BinaryIO, **kwargs: Any) -> PdfTextCoverage:
+        """
+        Scan the text layer of the (selected, see the pages option) pages, without extracting
+        their text. This is much cheaper than a conversion, and lets callers route documents that
+        have no text layer (e.g., scans) to a converter that does OCR. For example:
+
+            coverage = PdfConverter().analyze(file_stream)
+            if coverage.is_scanned:
+                ... # E.g., convert with a MarkItDown that uses Document Intelligence
+
+        Text layers are found by searching the content streams of the pages (and of the forms
+        that they draw) for text-showing operators, so invisible text (e.g., the OCR layer of a
+        searchable scan) counts as text. The position of file_stream is kept.
+        """
+        self._check_dependencies()
+
+        cur_pos = file_stream.tell()
+        try:
+            page_numbers = self._select_pages(
+                file_stream, PDF_BACKENDS["pdfminer"], kwargs
+            )
+            if page_numbers is not None and len(page_numbers) == 0:
+                return PdfTextCoverage(pages=())
+            return PdfTextCoverage(
+                pages=tuple(
+                    PdfPageCoverage(number + 1, *scan_text_layer(page))
+                    for number, page in _get_pages(file_stream, page_numbers)
                 )
-            ) from _dependency_exc_info[
-                1
-            ].with_traceback(  # type: ignore[union-attr]
-                _dependency_exc_info[2]
             )
+        finally:
+            file_stream.seek(cur_pos)
 
-        assert isinstance(file_stream, io.IOBase)  # for mypy
-        return DocumentConverterResult(
-            markdown=pdfminer.high_level.extract_text(file_stream),
+    def _select_pages(
+        self, file_stream: BinaryIO, backend: PdfBackend, kwargs: Dict[str, Any]
+    ) -> Optional[List[int]]:
+        """Return the sorted (0-based) numbers of the pages selected by the pages option, or None for all."""
+        if kwargs.get("pages") is None:
+            return None
+        selection = PageSelection.parse(kwargs["pages"])
+        num_pages = (
+            backend.count_pages(file_stream) if selection.needs_page_count else None
         )
+        return selection.resolve(num_pages)
+
+    def _get_parallel_chunks(
+        self,
+        file_stream: BinaryIO,
+        page_numbers: Optional[List[int]],
+        backend: PdfBackend,
+        kwargs: Dict[str, Any],
+    ) -> Optional[List[List[int]]]:
+        """Return the chunks of pages to extract in parallel, or None to extract serially."""
+        import multiprocessing
+
+        workers = kwargs.get("pdf_workers") or 1
+        if workers <= 1:
+            return None
+
+        # Daemonic processes (e.g., the workers of a MarkItDown with resource limits) can't have children
+        if multiprocessing.current_process().daemon:
+            return None
+
+        num_pages = backend.count_pages(file_stream)
+        if page_numbers is None:
+            page_numbers = list(range(num_pages))
+        else:
+            page_numbers = [n for n in page_numbers if n < num_pages]
+
+        min_pages = kwargs.get("pdf_parallel_min_pages", DEFAULT_PARALLEL_MIN_PAGES)
+        if len(page_numbers) < max(2, min_pages):
+            return None
+        return _split_pages(page_numbers, workers * _CHUNKS_PER_WORKER)
+
+    def _extract_parallel(
+        self,
+        file_stream: BinaryIO,
+        chunks: List[List[int]],
+        mode: str,
+        backend: PdfBackend,
+        kwargs: Dict[str, Any],
+        coverage: Optional[List[PdfPageCoverage]] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """Extract the chunks of pages in worker processes, yielding the pages in order."""
+        from concurrent.futures import ProcessPoolExecutor
+        from .._process_pool import get_mp_context
+
+        data = bytes(read_as_buffer(file_stream))
+        executor = ProcessPoolExecutor(
+            max_workers=min(kwargs["pdf_workers"], len(chunks)),
+            mp_context=get_mp_context(),
+            initializer=_init_page_worker,
+            initargs=(data,),
+        )
+        try:
+            for pages, pages_coverage in executor.map(
+                _extract_page_chunk,
+                chunks,
+                itertools.repeat(mode),
+                itertools.repeat(backend),
+            ):
+                if coverage is not None:
+                    coverage.extend(pages_coverage)
+                yield from pages
+        finally:
+            # (If the caller stops early, the remaining chunks are not extracted)
+            executor.shutdown(cancel_futures=True)
+
+    def _check_dependencies(self) -> None:
+        PDF_BACKENDS["pdfminer"].check_dependencies()
@@ -0,0 +1,69 @@
+# The fast extraction mode of PdfConverter. This module imports pdfminer, so it is only imported
+# (by _pdf_converter._import_dependencies) when a PDF is converted.
+from typing import Any, List, Optional, TextIO, Tuple
+
+from pdfminer.pdfdevice import PDFDevice, PDFTextSeq
+from pdfminer.pdffont import PDFUnicodeNotDefined
+
+# In TJ arrays, adjustments of at least a tenth of an em (100 thousandths) to the right are word
+# gaps. (Kerning rarely exceeds that, and justified word spacing rarely falls below it)
+_WORD_GAP = 100
+
+
+class RawTextDevice(PDFDevice):
+    """
+    A pdfminer device that writes the text runs of each page in the order in which they are drawn,
+    with no layout analysis: no characters are measured or positioned, and no lines or text boxes
+    are grouped. A run that starts lower or higher than the previous one starts a new line; one
+    that starts elsewhere on the same line is separated by a space. Each page ends with a form feed.
+
+    This is several times faster than the layout analysis of LAParams, and works well for the
+    (common) PDFs whose content streams draw text in reading order. Multi-column layouts, tables
+    and text drawn out of order are not reconstructed.
+    """
+
+    def __init__(self, rsrcmgr: Any, outfp: TextIO):
+        super().__init__(rsrcmgr)
+        self.outfp = outfp
+        self._parts: List[str] = []
+        self._origin: Optional[Tuple[float, float]] = None
+
+    def begin_page(self, page: Any, ctm: Any) -> None:
+        super().begin_page(page, ctm)
+        self._parts = []
+        self._origin = None
+
+    def end_page(self, page: Any) -> None:
+        if self._parts:
+            self._parts.append("\n")
+        self._parts.append("\f")
+        self.outfp.write("".join(self._parts))
+        self._parts = []
+
+    def render_string(
+        self, textstate: Any, seq: PDFTextSeq, ncs: Any, graphicstate: Any
+    ) -> None:
+        font = textstate.font
+        if font is None:
+            return
+
+        # Td, TD, T*, Tm, ' and " move the origin of the line, and text runs continue from it
+        matrix = textstate.matrix
+        origin = (matrix[4], matrix[5])
+        if self._origin is not None and origin != self._origin:
+            if abs(origin[1] - self._origin[1]) > 0.01:
+                self._parts.append("\n")
+            else:
+                self._parts.append(" ")
+        self._origin = origin
+
+        parts = self._parts
+        for obj in seq:
+            if isinstance(obj, bytes):
+                for cid in font.decode(obj):
+                    try:
+                        parts.append(font.to_unichr(cid))
+                    except PDFUnicodeNotDefined:
+                        parts.append(f"(cid:{cid})")
+            elif isinstance(obj, (int, float)) and obj <= -_WORD_GAP:
+                parts.append(" ")
@@ -0,0 +1,67 @@
+# The scan of the text layer of PDF pages, made by PdfConverter before extracting them. This module
+# imports pdfminer, so it is only imported (by _pdf_converter._import_dependencies) when needed.
+import re
+from typing import Any, List, Set, Tuple
+
+from pdfminer.pdftypes import PDFStream, resolve1
+from pdfminer.psparser import LIT
+
+# Text-showing operators (Tj, TJ, ' and "), which follow a string or an array of strings
+_TEXT_OPERATOR_RE = re.compile(rb"[)>\]]\s*(?:Tj|TJ|'|\")")
+_INLINE_IMAGE_RE = re.compile(rb"(?:^|\s)BI\s")
+
+_LITERAL_IMAGE = LIT("Image")
+_LITERAL_FORM = LIT("Form")
+
+
+def _as_dict(obj: Any) -> dict:
+    obj = resolve1(obj)
+    return obj if isinstance(obj, dict) else {}
+
+
+def scan_text_layer(page: Any) -> Tuple[int, int]:
+    """
+    Return the number of text-showing operators, and of images, of a pdfminer PDFPage, including
+    those of the form XObjects that it draws. Only the content streams are searched: nothing is
+    interpreted, so this is much cheaper than extracting the text.
+
+    Content streams are only searched for text if a font is available to them, since text cannot
+    be shown without one. The content streams that are decoded are cached by pdfminer, so they are
+    not decoded again if the page is then extracted.
+    """
+    text_operators = 0
+    images = 0
+    seen: Set[int] = set()
+
+    # The (resources, content streams) to scan
+    pending: List[Tuple[dict, List[Any]]] = [
+        (_as_dict(page.resources), list(page.contents))
+    ]
+    while pending:
+        resources, contents = pending.pop()
+
+        for xobject in _as_dict(resources.get("XObject")).values():
+            stream = resolve1(xobject)
+            if not isinstance(stream, PDFStream) or id(stream) in seen:
+                continue
+            seen.add(id(stream))
+
+            subtype = resolve1(stream.get("Subtype"))
+            if subtype is _LITERAL_IMAGE:
+                images += 1
+            elif subtype is _LITERAL_FORM:
+                # Forms without resources use those of the page (deprecated, but allowed)
+                form_resources = _as_dict(stream.get("Resources")) or resources
+                pending.append((form_resources, [stream]))
+
+        has_fonts = len(_as_dict(resources.get("Font"))) > 0
+        for content in contents:
+            stream = resolve1(content)
+            if not isinstance(stream, PDFStream):
+                continue
+            data = stream.get_data()
+            images += len(_INLINE_IMAGE_RE.findall(data))
+            if has_fonts:
+                text_operators += len(_TEXT_OPERATOR_RE.findall(data))
+
+    return text_operators, images
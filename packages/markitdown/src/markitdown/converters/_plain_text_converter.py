@@ -1,18 +1,7 @@
-import sys
-
 from typing import BinaryIO, Any
-from charset_normalizer import from_bytes
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    import mammoth  # noqa: F401
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+from .._stream_utils import read_as_buffer
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/",
@@ -64,8 +53,11 @@ class PlainTextConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         if stream_info.charset:
-            text_content = file_stream.read().decode(stream_info.charset)
+            text_content = str(read_as_buffer(file_stream), stream_info.charset)
         else:
-            text_content = str(from_bytes(file_stream.read()).best())
+            # Imported here, since it is slow to import, and rarely needed with Magika
+            from charset_normalizer import from_bytes
+
+            text_content = str(from_bytes(bytes(read_as_buffer(file_stream))).best())
 
         return DocumentConverterResult(markdown=text_content)
@@ -1,27 +1,32 @@
-import sys
 import base64
 import os
 import io
 import re
 import html
 
-from typing import BinaryIO, Any
+from typing import BinaryIO, Any, Iterator, TYPE_CHECKING
 from operator import attrgetter
 
 from ._html_converter import HtmlConverter
 from ._llm_caption import llm_caption
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._import_utils import OptionalDependencies
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
+# Optional (but in this case, required) dependencies are slow to import, so they are imported
+# on first use. Exceptions are saved for reporting later (see OptionalDependencies)
+if TYPE_CHECKING:
     import pptx
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+
+
+def _import_dependencies() -> None:
+    global pptx
+    import pptx
+
+
+_dependencies = OptionalDependencies(_import_dependencies)
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -58,13 +63,31 @@ class PptxConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult(
+            markdown="".join(self.convert_iter(file_stream, stream_info, **kwargs))
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """Yield the Markdown of each slide, as it is converted."""
         # Check the dependencies
+        _dependency_exc_info = _dependencies.load()
         if _dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -80,12 +103,11 @@ class PptxConverter(DocumentConverter):
 
         # Perform the conversion
         presentation = pptx.Presentation(file_stream)
-        md_content = ""
         slide_num = 0
         for slide in presentation.slides:
             slide_num += 1
 
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
+            md_content = f"\n\n<!-- Slide number: {slide_num} -->\n"
 
             title = slide.shapes.title
 
@@ -176,16 +198,17 @@ class PptxConverter(DocumentConverter):
             for shape in sorted_shapes:
                 get_shape_content(shape, **kwargs)
 
-            md_content = md_content.strip()
+            md_content = md_content.rstrip()
 
             if slide.has_notes_slide:
                 md_content += "\n\n### Notes:\n"
                 notes_frame = slide.notes_slide.notes_text_frame
                 if notes_frame is not None:
                     md_content += notes_frame.text
-                md_content = md_content.strip()
+                md_content = md_content.rstrip()
 
-        return DocumentConverterResult(markdown=md_content.strip())
+            # The output never starts with blank lines
+            yield md_content.lstrip() if slide_num == 1 else md_content
 
     def _is_picture(self, shape):
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
@@ -1,11 +1,9 @@
-from defusedxml import minidom
 from xml.dom.minidom import Document, Element
-from typing import BinaryIO, Any, Union
-from bs4 import BeautifulSoup
+from typing import BinaryIO, Any, Dict, Iterator, Tuple, Union
 
-from ._markdownify import _CustomMarkdownify
 from .._stream_info import StreamInfo
-from .._base_converter import DocumentConverter, DocumentConverterResult
+from .._dispatch_index import DispatchHints
+from .._base_converter import DocumentConverter, DocumentConverterResult, cached_probe
 
 PRECISE_MIME_TYPE_PREFIXES = [
     "application/rss",
@@ -29,10 +27,6 @@ CANDIDATE_FILE_EXTENSIONS = [
 class RssConverter(DocumentConverter):
     """Convert RSS / Atom type to markdown"""
 
-    def __init__(self):
-        super().__init__()
-        self._kwargs = {}
-
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -52,15 +46,29 @@ class RssConverter(DocumentConverter):
 
         # Check for precise mimetypes and file extensions
         if extension in CANDIDATE_FILE_EXTENSIONS:
-            return self._check_xml(file_stream)
+            return self._check_xml(file_stream, kwargs)
 
         for prefix in CANDIDATE_MIME_TYPE_PREFIXES:
             if mimetype.startswith(prefix):
-                return self._check_xml(file_stream)
+                return self._check_xml(file_stream, kwargs)
 
         return False
 
-    def _check_xml(self, file_stream: BinaryIO) -> bool:
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=PRECISE_FILE_EXTENSIONS + CANDIDATE_FILE_EXTENSIONS,
+            mimetype_prefixes=PRECISE_MIME_TYPE_PREFIXES + CANDIDATE_MIME_TYPE_PREFIXES,
+        )
+
+    def _check_xml(self, file_stream: BinaryIO, kwargs: Dict[str, Any]) -> bool:
+        # Parsing is expensive, so it is done once per stream, whatever the guess
+        return cached_probe(
+            kwargs, f"{__name__}.is_feed", lambda: self._is_feed(file_stream)
+        )
+
+    def _is_feed(self, file_stream: BinaryIO) -> bool:
+        from defusedxml import minidom
+
         cur_pos = file_stream.tell()
         try:
             doc = minidom.parse(file_stream)
@@ -87,92 +95,117 @@ class RssConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        self._kwargs = kwargs
-        doc = minidom.parse(file_stream)
-        feed_type = self._feed_type(doc)
+        doc, feed_type = self._parse_feed(file_stream)
 
         if feed_type == "rss":
-            return self._parse_rss_type(doc)
-        elif feed_type == "atom":
-            return self._parse_atom_type(doc)
+            channel = self._get_rss_channel(doc)
+            return DocumentConverterResult(
+                markdown="".join(self._iter_rss_type(channel, **kwargs)),
+                title=self._get_data_by_tag_name(channel, "title"),
+            )
         else:
-            raise ValueError("Unknown feed type")
+            root = doc.getElementsByTagName("feed")[0]
+            return DocumentConverterResult(
+                markdown="".join(self._iter_atom_type(root, **kwargs)),
+                title=self._get_data_by_tag_name(root, "title"),
+            )
 
-    def _parse_atom_type(self, doc: Document) -> DocumentConverterResult:
-        """Parse the type of an Atom feed.
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """Yield the Markdown of the feed's header, then of each entry (or item), as it is converted."""
+        doc, feed_type = self._parse_feed(file_stream)
 
-        Returns None if the feed type is not recognized or something goes wrong.
-        """
-        root = doc.getElementsByTagName("feed")[0]
+        if feed_type == "rss":
+            yield from self._iter_rss_type(self._get_rss_channel(doc), **kwargs)
+        else:
+            yield from self._iter_atom_type(
+                doc.getElementsByTagName("feed")[0], **kwargs
+            )
+
+    def _parse_feed(self, file_stream: BinaryIO) -> Tuple[Document, str]:
+        """Parse the feed, and return the document and the feed type."""
+        from defusedxml import minidom
+
+        doc = minidom.parse(file_stream)
+        feed_type = self._feed_type(doc)
+        if feed_type is None:
+            raise ValueError("Unknown feed type")
+        return doc, feed_type
+
+    def _iter_atom_type(self, root: Element, **kwargs: Any) -> Iterator[str]:
+        """Yield the Markdown of an Atom feed: its header, then each entry."""
         title = self._get_data_by_tag_name(root, "title")
         subtitle = self._get_data_by_tag_name(root, "subtitle")
-        entries = root.getElementsByTagName("entry")
         md_text = f"# {title}\n"
         if subtitle:
             md_text += f"{subtitle}\n"
-        for entry in entries:
+        yield md_text
+
+        for entry in root.getElementsByTagName("entry"):
             entry_title = self._get_data_by_tag_name(entry, "title")
             entry_summary = self._get_data_by_tag_name(entry, "summary")
             entry_updated = self._get_data_by_tag_name(entry, "updated")
             entry_content = self._get_data_by_tag_name(entry, "content")
 
+            md_text = ""
             if entry_title:
                 md_text += f"\n## {entry_title}\n"
             if entry_updated:
                 md_text += f"Updated on: {entry_updated}\n"
             if entry_summary:
-                md_text += self._parse_content(entry_summary)
+                md_text += self._parse_content(entry_summary, **kwargs)
             if entry_content:
-                md_text += self._parse_content(entry_content)
-
-        return DocumentConverterResult(
-            markdown=md_text,
-            title=title,
-        )
-
-    def _parse_rss_type(self, doc: Document) -> DocumentConverterResult:
-        """Parse the type of an RSS feed.
+                md_text += self._parse_content(entry_content, **kwargs)
+            yield md_text
 
-        Returns None if the feed type is not recognized or something goes wrong.
-        """
+    def _get_rss_channel(self, doc: Document) -> Element:
         root = doc.getElementsByTagName("rss")[0]
         channel_list = root.getElementsByTagName("channel")
         if not channel_list:
             raise ValueError("No channel found in RSS feed")
-        channel = channel_list[0]
+        return channel_list[0]
+
+    def _iter_rss_type(self, channel: Element, **kwargs: Any) -> Iterator[str]:
+        """Yield the Markdown of an RSS channel: its header, then each item."""
         channel_title = self._get_data_by_tag_name(channel, "title")
         channel_description = self._get_data_by_tag_name(channel, "description")
-        items = channel.getElementsByTagName("item")
+        md_text = ""
         if channel_title:
             md_text = f"# {channel_title}\n"
         if channel_description:
             md_text += f"{channel_description}\n"
-        for item in items:
+        yield md_text
+
+        for item in channel.getElementsByTagName("item"):
             title = self._get_data_by_tag_name(item, "title")
             description = self._get_data_by_tag_name(item, "description")
             pubDate = self._get_data_by_tag_name(item, "pubDate")
             content = self._get_data_by_tag_name(item, "content:encoded")
 
+            md_text = ""
             if title:
                 md_text += f"\n## {title}\n"
             if pubDate:
                 md_text += f"Published on: {pubDate}\n"
             if description:
-                md_text += self._parse_content(description)
+                md_text += self._parse_content(description, **kwargs)
             if content:
-                md_text += self._parse_content(content)
-
-        return DocumentConverterResult(
-            markdown=md_text,
-            title=channel_title,
-        )
+                md_text += self._parse_content(content, **kwargs)
+            yield md_text
 
-    def _parse_content(self, content: str) -> str:
+    def _parse_content(self, content: str, **kwargs: Any) -> str:
         """Parse the content of an RSS feed item"""
+        from bs4 import BeautifulSoup
+        from ._markdownify import _CustomMarkdownify
+
         try:
             # using bs4 because many RSS feeds have HTML-styled content
             soup = BeautifulSoup(content, "html.parser")
-            return _CustomMarkdownify(**self._kwargs).convert_soup(soup)
+            return _CustomMarkdownify(**kwargs).convert_soup(soup)
         except BaseException as _:
             return content
 
@@ -1,27 +1,33 @@
 import io
-import sys
-from typing import BinaryIO
+import warnings
+from typing import BinaryIO, TYPE_CHECKING
 from .._exceptions import MissingDependencyException
+from .._import_utils import OptionalDependencies
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_dependency_exc_info = None
-try:
-    # Suppress some warnings on library import
-    import warnings
+# Optional (but in this case, required) dependencies are slow to import, so they are imported
+# on first use. Exceptions are saved for reporting later (see OptionalDependencies)
+if TYPE_CHECKING:
+    import speech_recognition as sr
+    import pydub
+
+
+def _import_dependencies() -> None:
+    global sr, pydub
 
+    # Suppress some warnings on library import
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=DeprecationWarning)
         warnings.filterwarnings("ignore", category=SyntaxWarning)
         import speech_recognition as sr
         import pydub
-except ImportError:
-    # Preserve the error and stack trace for later
-    _dependency_exc_info = sys.exc_info()
+
+
+_dependencies = OptionalDependencies(_import_dependencies)
 
 
 def transcribe_audio(file_stream: BinaryIO, *, audio_format: str = "wav") -> str:
     # Check for installed dependencies
+    _dependency_exc_info = _dependencies.load()
     if _dependency_exc_info is not None:
         raise MissingDependencyException(
             "Speech transcription requires installing MarkItdown with the [audio-transcription] optional dependencies. E.g., `pip install markitdown[audio-transcription]` or `pip install markitdown[all]`"
@@ -1,10 +1,9 @@
 import re
-import bs4
 from typing import Any, BinaryIO
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from ._markdownify import _CustomMarkdownify
+from .._dispatch_index import DispatchHints
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -16,6 +15,8 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+WIKIPEDIA_URL_PATTERN = r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/"
+
 
 class WikipediaConverter(DocumentConverter):
     """Handle Wikipedia pages separately, focusing only on the main document content."""
@@ -34,7 +35,7 @@ class WikipediaConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if not re.search(r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/", url):
+        if not re.search(WIKIPEDIA_URL_PATTERN, url):
             # Not a Wikipedia URL
             return False
 
@@ -48,12 +49,22 @@ class WikipediaConverter(DocumentConverter):
         # Not HTML content
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+            url_patterns=[WIKIPEDIA_URL_PATTERN],
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        import bs4
+        from ._markdownify import _CustomMarkdownify
+
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
         soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
@@ -1,25 +1,31 @@
-import sys
-from typing import BinaryIO, Any
+from typing import BinaryIO, Any, Iterator, TYPE_CHECKING
 from ._html_converter import HtmlConverter
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import MissingDependencyException, MISSING_DEPENDENCY_MESSAGE
+from .._import_utils import OptionalDependencies
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
 
-# Try loading optional (but in this case, required) dependencies
-# Save reporting of any exceptions for later
-_xlsx_dependency_exc_info = None
-try:
+# Optional (but in this case, required) dependencies are slow to import, so they are imported
+# on first use. Exceptions are saved for reporting later (see OptionalDependencies)
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _import_xlsx_dependencies() -> None:
+    global pd
     import pandas as pd
     import openpyxl  # noqa: F401
-except ImportError:
-    _xlsx_dependency_exc_info = sys.exc_info()
 
-_xls_dependency_exc_info = None
-try:
-    import pandas as pd  # noqa: F811
+
+def _import_xls_dependencies() -> None:
+    global pd
+    import pandas as pd
     import xlrd  # noqa: F401
-except ImportError:
-    _xls_dependency_exc_info = sys.exc_info()
+
+
+_xlsx_dependencies = OptionalDependencies(_import_xlsx_dependencies)
+_xls_dependencies = OptionalDependencies(_import_xls_dependencies)
 
 ACCEPTED_XLSX_MIME_TYPE_PREFIXES = [
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -60,13 +66,33 @@ class XlsxConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_XLSX_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_XLSX_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult(
+            markdown="".join(
+                self.convert_iter(file_stream, stream_info, **kwargs)
+            ).strip()
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """Yield the Markdown of each sheet, as it is read."""
         # Check the dependencies
+        _xlsx_dependency_exc_info = _xlsx_dependencies.load()
         if _xlsx_dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -80,19 +106,9 @@ class XlsxConverter(DocumentConverter):
                 _xlsx_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="openpyxl")
-        md_content = ""
-        for s in sheets:
-            md_content += f"## {s}\n"
-            html_content = sheets[s].to_html(index=False)
-            md_content += (
-                self._html_converter.convert_string(
-                    html_content, **kwargs
-                ).markdown.strip()
-                + "\n\n"
-            )
-
-        return DocumentConverterResult(markdown=md_content.strip())
+        yield from _iter_sheets(
+            self._html_converter, file_stream, engine="openpyxl", **kwargs
+        )
 
 
 class XlsConverter(DocumentConverter):
@@ -122,13 +138,33 @@ class XlsConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_XLS_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_XLS_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult(
+            markdown="".join(
+                self.convert_iter(file_stream, stream_info, **kwargs)
+            ).strip()
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """Yield the Markdown of each sheet, as it is read."""
         # Load the dependencies
+        _xls_dependency_exc_info = _xls_dependencies.load()
         if _xls_dependency_exc_info is not None:
             raise MissingDependencyException(
                 MISSING_DEPENDENCY_MESSAGE.format(
@@ -142,16 +178,20 @@ class XlsConverter(DocumentConverter):
                 _xls_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="xlrd")
-        md_content = ""
-        for s in sheets:
-            md_content += f"## {s}\n"
-            html_content = sheets[s].to_html(index=False)
-            md_content += (
-                self._html_converter.convert_string(
-                    html_content, **kwargs
-                ).markdown.strip()
-                + "\n\n"
+        yield from _iter_sheets(
+            self._html_converter, file_stream, engine="xlrd", **kwargs
+        )
+
+
+def _iter_sheets(
+    html_converter: HtmlConverter, file_stream: BinaryIO, *, engine: str, **kwargs: Any
+) -> Iterator[str]:
+    """Read the sheets of a workbook one at a time, and yield each as a Markdown table."""
+    with pd.ExcelFile(file_stream, engine=engine) as workbook:
+        for i, sheet_name in enumerate(workbook.sheet_names):
+            html_content = workbook.parse(sheet_name).to_html(index=False)
+            md_content = (
+                f"## {sheet_name}\n"
+                + html_converter.convert_string(html_content, **kwargs).markdown.strip()
             )
-
-        return DocumentConverterResult(markdown=md_content.strip())
+            yield md_content if i == 0 else "\n\n" + md_content
@@ -1,26 +1,31 @@
 import json
 import time
 import re
-import bs4
-from typing import Any, BinaryIO, Dict, List, Union
+import warnings
+from typing import Any, BinaryIO, Dict, List, Union, TYPE_CHECKING
 from urllib.parse import parse_qs, urlparse, unquote
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
+from .._import_utils import OptionalDependencies
 
-# Optional YouTube transcription support
-try:
-    # Suppress some warnings on library import
-    import warnings
+# Optional YouTube transcription support, imported on first use (see OptionalDependencies)
+if TYPE_CHECKING:
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+
+def _import_dependencies() -> None:
+    global YouTubeTranscriptApi
 
+    # Suppress some warnings on library import
     with warnings.catch_warnings():
         warnings.filterwarnings("ignore", category=SyntaxWarning)
         # Patch submitted upstream to fix the SyntaxWarning
         from youtube_transcript_api import YouTubeTranscriptApi
 
-    IS_YOUTUBE_TRANSCRIPT_CAPABLE = True
-except ModuleNotFoundError:
-    IS_YOUTUBE_TRANSCRIPT_CAPABLE = False
+
+_dependencies = OptionalDependencies(_import_dependencies)
 
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
@@ -33,6 +38,9 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+# A loose match, for dispatch only. Urls may arrive percent-encoded (see accepts())
+YOUTUBE_URL_PATTERN = r"www\.youtube\.com"
+
 
 class YouTubeConverter(DocumentConverter):
     """Handle YouTube specially, focusing on the video title, description, and transcript."""
@@ -67,12 +75,21 @@ class YouTubeConverter(DocumentConverter):
         # Not HTML content
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+            url_patterns=[YOUTUBE_URL_PATTERN],
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        import bs4
+
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
         soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
@@ -144,7 +161,7 @@ class YouTubeConverter(DocumentConverter):
         if description:
             webpage_text += f"\n### Description\n{description}\n"
 
-        if IS_YOUTUBE_TRANSCRIPT_CAPABLE:
+        if _dependencies.load() is None:
             ytt_api = YouTubeTranscriptApi()
             transcript_text = ""
             parsed_url = urlparse(stream_info.url)  # type: ignore
@@ -2,10 +2,11 @@ import zipfile
 import io
 import os
 
-from typing import BinaryIO, Any, TYPE_CHECKING
+from typing import BinaryIO, Any, Iterator, Optional, TYPE_CHECKING
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from .._dispatch_index import DispatchHints
 from .._exceptions import UnsupportedFormatException, FileConversionException
 
 # Break otherwise circular import for type hinting
@@ -58,6 +59,9 @@ class ZipConverter(DocumentConverter):
     - Cleans up temporary files after processing
     """
 
+    # The header names the archive
+    output_depends_on_path = True
+
     def __init__(
         self,
         *,
@@ -84,16 +88,40 @@ class ZipConverter(DocumentConverter):
 
         return False
 
+    def dispatch_hints(self) -> DispatchHints:
+        return DispatchHints(
+            extensions=ACCEPTED_FILE_EXTENSIONS,
+            mimetype_prefixes=ACCEPTED_MIME_TYPE_PREFIXES,
+        )
+
     def convert(
         self,
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
+        return DocumentConverterResult(
+            markdown="".join(self.convert_iter(file_stream, stream_info, **kwargs))
+        )
+
+    def convert_iter(
+        self,
+        file_stream: BinaryIO,
+        stream_info: StreamInfo,
+        **kwargs: Any,  # Options to pass to the converter
+    ) -> Iterator[str]:
+        """
+        Yield the Markdown of each file in the archive, as it is converted. The archive is opened
+        (and its directory read) before the header is yielded, so that a corrupt archive fails
+        before the first chunk, when MarkItDown can still fall back to other converters.
+        """
         file_path = stream_info.url or stream_info.local_path or stream_info.filename
-        md_content = f"Content from the zip file `{file_path}`:\n\n"
 
+        # Hold back one section, so the trailing whitespace of the last one can be stripped
+        pending: Optional[str] = None
         with zipfile.ZipFile(file_stream, "r") as zipObj:
+            yield f"Content from the zip file `{file_path}`:"
+
             for name in zipObj.namelist():
                 try:
                     z_file_stream = io.BytesIO(zipObj.read(name))
@@ -106,11 +134,13 @@ class ZipConverter(DocumentConverter):
                         stream_info=z_file_stream_info,
                     )
                     if result is not None:
-                        md_content += f"## File: {name}\n\n"
-                        md_content += result.markdown + "\n\n"
+                        if pending is not None:
+                            yield pending
+                        pending = f"\n\n## File: {name}\n\n" + result.markdown
                 except UnsupportedFormatException:
                     pass
                 except FileConversionException:
                     pass
 
-        return DocumentConverterResult(markdown=md_content.strip())
+        if pending is not None:
+            yield pending.rstrip()
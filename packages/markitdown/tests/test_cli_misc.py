@@ -1,7 +1,11 @@
 #!/usr/bin/env python3 -m pytest
+import json
+import os
 import subprocess
 from markitdown import __version__
 
+TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
+
 # This file contains CLI tests that are not directly tested by the FileTestVectors.
 # This includes things like help messages, version numbers, and invalid flags.
 
@@ -27,8 +31,77 @@ def test_invalid_flag() -> None:
     assert "SYNTAX" in result.stderr, "Expected 'SYNTAX' to appear in STDERR"
 
 
+def test_stats() -> None:
+    path = os.path.join(TEST_FILES_DIR, "test.docx")
+    result = subprocess.run(
+        ["python", "-m", "markitdown", path, "--stats"], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
+    assert "# Abstract" in result.stdout, "Expected the Markdown on STDOUT"
+
+    # The summary is written to STDERR, as JSON
+    stats = json.loads(result.stderr)
+    assert stats["converter"] == "DocxConverter"
+    assert stats["input_bytes"] == os.path.getsize(path)
+    assert stats["output_chars"] > 0
+    assert stats["output_bytes"] >= stats["output_chars"]
+    assert stats["guesses_tried"] == 1
+    assert stats["failed_attempts"] == []
+    assert stats["peak_traced_memory_bytes"] > 0
+    assert stats["error"] is None
+    for stage in ["convert", "identify", "accepts", "attempt", "normalize"]:
+        assert stats["stages"][stage]["count"] >= 1, stage
+
+
+def test_profile() -> None:
+    result = subprocess.run(
+        [
+            "python",
+            "-m",
+            "markitdown",
+            os.path.join(TEST_FILES_DIR, "test.docx"),
+            "--profile",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
+    assert "# Abstract" in result.stdout, "Expected the Markdown on STDOUT"
+    assert "markitdown.converters._docx_converter" in result.stderr
+    assert "mammoth" in result.stderr
+
+
+def test_pages() -> None:
+    path = os.path.join(TEST_FILES_DIR, "test_multipage.pdf")
+    result = subprocess.run(
+        ["python", "-m", "markitdown", path, "--pages", "r2-z", "--page-markers"],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, f"CLI exited with error: {result.stderr}"
+    assert result.stdout.startswith(
+        "<!-- Page 7 -->\n\nMultipage test document, page 7"
+    )
+    assert "<!-- Page 8 -->" in result.stdout
+    assert "page 6 of 8" not in result.stdout
+
+    result = subprocess.run(
+        ["python", "-m", "markitdown", path, "--pages", "5-3"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "Invalid page range" in result.stdout
+
+
 if __name__ == "__main__":
     """Runs this file's tests from the command line."""
     test_version()
     test_invalid_flag()
+    test_stats()
+    test_profile()
+    test_pages()
     print("All tests passed!")
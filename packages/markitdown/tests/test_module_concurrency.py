@@ -0,0 +1,114 @@
+#!/usr/bin/env python3 -m pytest
+import os
+import random
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__":
+    from _test_vectors import GENERAL_TEST_VECTORS, DATA_URI_TEST_VECTORS
+else:
+    from ._test_vectors import GENERAL_TEST_VECTORS, DATA_URI_TEST_VECTORS
+
+from markitdown import MarkItDown, StreamInfo
+
+TEST_FILES_DIR = os.path.join(os.path.dirname(__file__), "test_files")
+
+# Enough threads and rounds to interleave conversions of every test file, with and without the GIL
+NUM_THREADS = 8
+NUM_ROUNDS = 3
+
+
+def _convert_local(markitdown: MarkItDown, filename: str, url, **kwargs) -> str:
+    return markitdown.convert(
+        os.path.join(TEST_FILES_DIR, filename), url=url, **kwargs
+    ).markdown
+
+
+def _convert_stream(markitdown: MarkItDown, filename: str, url, **kwargs) -> str:
+    with open(os.path.join(TEST_FILES_DIR, filename), "rb") as stream:
+        return markitdown.convert_stream(
+            stream,
+            stream_info=StreamInfo(extension=os.path.splitext(filename)[1]),
+            url=url,
+            **kwargs,
+        ).markdown
+
+
+def _make_jobs():
+    """Return (function, filename, url, kwargs) tuples covering the whole test corpus."""
+    jobs = []
+    for test_vector in GENERAL_TEST_VECTORS:
+        for func in [_convert_local, _convert_stream]:
+            jobs.append((func, test_vector.filename, test_vector.url, {}))
+
+    # Options must not leak between concurrent calls
+    for test_vector in DATA_URI_TEST_VECTORS:
+        for keep_data_uris in [True, False]:
+            jobs.append(
+                (
+                    _convert_local,
+                    test_vector.filename,
+                    test_vector.url,
+                    {"keep_data_uris": keep_data_uris},
+                )
+            )
+    return jobs
+
+
+def test_shared_instance_across_threads() -> None:
+    """Convert the test corpus concurrently with one shared instance, and compare with serial runs."""
+    markitdown = MarkItDown()
+    jobs = _make_jobs()
+
+    expected = [func(markitdown, f, url, **kwargs) for func, f, url, kwargs in jobs]
+
+    # Shuffle so that different converters (and the same converter) run side by side
+    schedule = list(range(len(jobs))) * NUM_ROUNDS
+    random.Random(0).shuffle(schedule)
+
+    # Start all the threads at once, to maximize contention
+    barrier = threading.Barrier(NUM_THREADS)
+
+    def _run(i: int) -> str:
+        func, filename, url, kwargs = jobs[i]
+        return func(markitdown, filename, url, **kwargs)
+
+    def _worker(indices):
+        barrier.wait()
+        return [(i, _run(i)) for i in indices]
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        futures = [
+            executor.submit(_worker, schedule[t::NUM_THREADS])
+            for t in range(NUM_THREADS)
+        ]
+        for future in futures:
+            for i, markdown in future.result():
+                assert markdown == expected[i], jobs[i][1]
+
+
+def test_lazy_initialization_across_threads() -> None:
+    """State created on first use is created once, even when first used by many threads at once."""
+    markitdown = MarkItDown()
+    barrier = threading.Barrier(NUM_THREADS)
+
+    def _get_session():
+        barrier.wait()
+        return markitdown._requests_session
+
+    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        sessions = list(executor.map(lambda _: _get_session(), range(NUM_THREADS)))
+    assert all(session is sessions[0] for session in sessions)
+
+
+if __name__ == "__main__":
+    """Runs this file's tests from the command line."""
+    for test in [
+        test_shared_instance_across_threads,
+        test_lazy_initialization_across_threads,
+    ]:
+        print(f"Running {test.__name__}...", end="")
+        test()
+        print("OK")
+    print("All tests passed!")
@@ -1,17 +1,51 @@
 #!/usr/bin/env python3 -m pytest
+import asyncio
 import io
 import os
 import re
 import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import pytest
+import requests
+
+from types import SimpleNamespace
 
 from markitdown._uri_utils import parse_data_uri, file_uri_to_path
+from markitdown._text_utils import normalize_markdown, MarkdownNormalizer
+from markitdown._stream_utils import (
+    spool_stream,
+    spool_chunks,
+    open_local_stream,
+    read_as_buffer,
+    MappedFileStream,
+)
 
 from markitdown import (
     MarkItDown,
     UnsupportedFormatException,
     FileConversionException,
     StreamInfo,
+    DocumentConverter,
+    DocumentConverterResult,
+    DispatchHints,
+    MemoryConversionCache,
+    SqliteConversionCache,
+    ConversionObserver,
+    OpenTelemetryObserver,
+    MissingDependencyException,
+    ResourceLimits,
+    cached_probe,
+    ResourceLimitExceededException,
+)
+from markitdown.converters import (
+    HtmlConverter,
+    PdfConverter,
+    PdfTextCoverage,
+    PageSelection,
 )
 
 # This file contains module tests that are not directly tested by the FileTestVectors.
@@ -96,6 +130,95 @@ PPTX_TEST_STRINGS = [
 
 
 # --- Helper Functions ---
+class _MockMagika:
+    """Stands in for magika.Magika, counting identification calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def identify_stream(self, stream):
+        self.calls += 1
+        return SimpleNamespace(status="error")
+
+
+class _NonSeekableStream(io.RawIOBase):
+    """A readable, non-seekable stream (like sys.stdin.buffer, or a socket)."""
+
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        return self._data.readinto(b)
+
+
+class _CrashingSource(str):
+    """A path that kills the worker process that receives it (as a segfault or an OOM kill would)."""
+
+    def __reduce__(self):
+        return (os._exit, (1,))
+
+
+class _MockAsyncResponse:
+    """Stands in for an httpx.Response, as returned by httpx.AsyncClient.stream()."""
+
+    def __init__(self, url: str, headers: dict, content: bytes):
+        self.url = url
+        self.status_code = 200
+        self.headers = headers
+        self._content = content
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def aiter_bytes(self, chunk_size: int):
+        for i in range(0, len(self._content), chunk_size):
+            await asyncio.sleep(0)
+            yield self._content[i : i + chunk_size]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class _MockAsyncClient:
+    """Stands in for an httpx.AsyncClient, serving fixed responses."""
+
+    def __init__(self, responses: dict):
+        self._responses = responses
+        self.requests = []
+
+    def stream(self, method: str, url: str) -> _MockAsyncResponse:
+        self.requests.append((method, url))
+        headers, content = self._responses[url]
+        return _MockAsyncResponse(url, headers, content)
+
+
+class _SlowTextConverter(DocumentConverter):
+    """Converts .slow files, slowly, recording the maximum number of concurrent conversions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+
+    def accepts(self, file_stream, stream_info, **kwargs) -> bool:
+        return stream_info.extension == ".slow"
+
+    def convert(self, file_stream, stream_info, **kwargs) -> DocumentConverterResult:
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        time.sleep(0.05)
+        with self._lock:
+            self._active -= 1
+        return DocumentConverterResult(markdown=file_stream.read().decode("utf-8"))
+
+
 def validate_strings(result, expected_strings, exclude_strings=None):
     """Validate presence or absence of specific strings."""
     text_content = result.text_content.replace("\\", "")
@@ -273,6 +396,89 @@ def test_docx_equations() -> None:
     assert block_equations, "No block equations found in the document."
 
 
+def test_docx_pre_process() -> None:
+    import zipfile
+    from markitdown.converter_utils.docx.pre_process import (
+        pre_process_docx,
+        _pre_process_math,
+    )
+
+    # Equations are replaced by runs of LaTeX, and the rest of the content is kept
+    content = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+        'xmlns:m="http://schemas.openxmlformats.org/officeDocument/2006/math"><w:body>'
+        "<w:p><w:r><w:t>Let </w:t></w:r><m:oMath><m:r><m:t>x=1</m:t></m:r></m:oMath> "
+        "<w:r><w:t>so</w:t></w:r></w:p><w:p><m:oMathPara><m:oMath><m:r><m:t>y</m:t></m:r>"
+        "</m:oMath></m:oMathPara></w:p></w:body></w:document>"
+    ).encode()
+    processed = _pre_process_math(content).decode()
+    assert "oMath" not in processed
+    assert (
+        "<w:p><w:r><w:t>Let </w:t></w:r><w:r><w:t>$x=1$</w:t></w:r> "
+        "<w:r><w:t>so</w:t></w:r></w:p>"
+    ) in processed
+    assert "<w:p><w:p><w:r><w:t>$$y$$</w:t></w:r></w:p></w:p>" in processed
+
+    # Documents without math are not zipped again
+    with open(os.path.join(TEST_FILES_DIR, "test.docx"), "rb") as fh:
+        assert pre_process_docx(fh) is fh
+        assert fh.tell() == 0
+
+    # Other members are copied as they were compressed, unless they are followed by data
+    # descriptors (as written by streaming writers), in which case they are written again
+    class _Unseekable(io.RawIOBase):
+        def __init__(self, buffer):
+            self.buffer = buffer
+
+        def writable(self):
+            return True
+
+        def write(self, data):
+            return self.buffer.write(data)
+
+    for streamed in [False, True]:
+        # A document with math, and a deflated image
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(
+            os.path.join(TEST_FILES_DIR, "equations.docx")
+        ) as equations, zipfile.ZipFile(
+            os.path.join(TEST_FILES_DIR, "test.docx")
+        ) as images, zipfile.ZipFile(
+            _Unseekable(buffer) if streamed else buffer, "w", zipfile.ZIP_DEFLATED
+        ) as zip_output:
+            for name in equations.namelist():
+                zip_output.writestr(name, equations.read(name))
+            zip_output.writestr(
+                "word/media/image1.png", images.read("word/media/image1.png")
+            )
+
+        # Only the document is rewritten, and the other members are intact
+        buffer.seek(0)
+        with zipfile.ZipFile(buffer) as zip_input:
+            with zipfile.ZipFile(pre_process_docx(buffer)) as zip_output:
+                assert zip_output.testzip() is None
+                assert zip_output.namelist() == zip_input.namelist()
+                document = zip_output.read("word/document.xml")
+                assert b"oMath" not in document and b"$m=1$" in document
+                for name in zip_input.namelist():
+                    if name != "word/document.xml":
+                        assert (
+                            zip_output.getinfo(name).CRC == zip_input.getinfo(name).CRC
+                        )
+                        assert zip_output.read(name) == zip_input.read(name)
+                image = zip_output.getinfo("word/media/image1.png")
+                assert image.compress_type == zipfile.ZIP_DEFLATED
+                if not streamed:
+                    assert image.compress_size == (
+                        zip_input.getinfo("word/media/image1.png").compress_size
+                    )
+
+    # Line breaks in alt text become spaces
+    markdown = MarkItDown().convert(os.path.join(TEST_FILES_DIR, "test.docx")).markdown
+    assert "![图形用户界面, 文本, 应用程序, 信件  AI 生成的内容可能不正确。](" in markdown
+
+
 def test_input_as_strings() -> None:
     markitdown = MarkItDown()
 
@@ -396,13 +602,988 @@ def test_markitdown_llm() -> None:
     validate_strings(result, PPTX_TEST_STRINGS)
 
 
+def test_dispatch_index() -> None:
+    class _FooConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return (stream_info.extension or "").lower() == ".foo"
+
+        def dispatch_hints(self):
+            return DispatchHints(extensions=[".foo"])
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            return DocumentConverterResult(markdown="foo!")
+
+    class _CustomHtmlConverter(HtmlConverter):
+        # Overrides accepts(), but not dispatch_hints(), so must always be probed
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return (stream_info.extension or "").lower() == ".bar"
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            return DocumentConverterResult(markdown="bar!")
+
+    markitdown = MarkItDown()
+    markitdown.register_converter(_FooConverter())
+    markitdown.register_converter(_CustomHtmlConverter())
+
+    dispatch_index = markitdown._get_dispatch_index()
+    candidates = [
+        type(dispatch_index.sorted_registrations[i].converter).__name__
+        for i in dispatch_index.candidates(StreamInfo(extension=".foo"))
+    ]
+    assert "_FooConverter" in candidates
+    assert "_CustomHtmlConverter" in candidates
+    assert "PdfConverter" not in candidates
+    assert "HtmlConverter" not in candidates
+
+    # Mimetype prefixes and url patterns are honored
+    candidates = [
+        type(dispatch_index.sorted_registrations[i].converter).__name__
+        for i in dispatch_index.candidates(
+            StreamInfo(mimetype="text/html", url="https://en.wikipedia.org/wiki/Foo")
+        )
+    ]
+    assert "HtmlConverter" in candidates
+    assert "WikipediaConverter" in candidates
+    assert "BingSerpConverter" not in candidates
+    assert "_FooConverter" not in candidates
+
+    # The plan always covers every registration, candidates first
+    plan = list(dispatch_index.plan(StreamInfo(extension=".foo")))
+    assert len(plan) == len(markitdown._converters)
+    assert type(plan[0].converter).__name__ == "_CustomHtmlConverter"
+
+    result = markitdown.convert_stream(
+        io.BytesIO(b"data"), stream_info=StreamInfo(extension=".foo")
+    )
+    assert result.markdown == "foo!"
+    result = markitdown.convert_stream(
+        io.BytesIO(b"data"), stream_info=StreamInfo(extension=".bar")
+    )
+    assert result.markdown == "bar!"
+
+    # Registering a converter invalidates the index
+    markitdown.register_converter(_FooConverter())
+    assert markitdown._get_dispatch_index() is not dispatch_index
+
+
+def test_shared_magika() -> None:
+    # Instances share a single, lazily loaded, Magika model
+    assert MarkItDown()._magika is MarkItDown()._magika
+
+    # ... unless one is injected
+    mock_magika = _MockMagika()
+    markitdown = MarkItDown(magika=mock_magika)
+    result = markitdown.convert_stream(
+        io.BytesIO(b"Hello, world!"), stream_info=StreamInfo(extension=".txt")
+    )
+    assert mock_magika.calls == 1
+    assert "Hello, world!" in result.markdown
+
+
+def test_sniff_policies() -> None:
+    html = b"<html><body><h1>Test</h1></body></html>"
+    full_hints = StreamInfo(extension=".html", mimetype="text/html", charset="utf-8")
+
+    # By default, the content is always sniffed
+    mock_magika = _MockMagika()
+    markitdown = MarkItDown(magika=mock_magika)
+    markitdown.convert_stream(io.BytesIO(html), stream_info=full_hints)
+    assert mock_magika.calls == 1
+
+    # Unambiguous hints are trusted
+    mock_magika = _MockMagika()
+    markitdown = MarkItDown(magika=mock_magika, sniff="when_ambiguous")
+    result = markitdown.convert_stream(io.BytesIO(html), stream_info=full_hints)
+    assert "# Test" in result.markdown
+    assert mock_magika.calls == 0
+
+    # ... but text without a charset is ambiguous
+    markitdown.convert_stream(
+        io.BytesIO(html), stream_info=StreamInfo(extension=".html")
+    )
+    assert mock_magika.calls == 1
+
+    # If nothing accepts the trusted hints, fall back to sniffing
+    with pytest.raises(UnsupportedFormatException):
+        markitdown.convert_stream(
+            io.BytesIO(html),
+            stream_info=StreamInfo(extension=".xyz", mimetype="application/x-xyz"),
+        )
+    assert mock_magika.calls == 2
+
+    # Never sniff (the policy can be overridden per call)
+    mock_magika = _MockMagika()
+    markitdown = MarkItDown(magika=mock_magika)
+    result = markitdown.convert_stream(
+        io.BytesIO(html), stream_info=StreamInfo(extension=".html"), sniff="never"
+    )
+    assert "# Test" in result.markdown
+    with pytest.raises(UnsupportedFormatException):
+        markitdown.convert_stream(io.BytesIO(b"\x00\x01"), sniff="never")
+    assert mock_magika.calls == 0
+
+    with pytest.raises(ValueError):
+        MarkItDown(sniff="sometimes")
+
+
+def test_identify_many() -> None:
+    markitdown = MarkItDown()
+    paths = [
+        os.path.join(TEST_FILES_DIR, "test.docx"),
+        os.path.join(TEST_FILES_DIR, "test_blog.html"),
+        os.path.join(TEST_FILES_DIR, "test.json"),
+    ]
+    with open(os.path.join(TEST_FILES_DIR, "test.pdf"), "rb") as fh:
+        all_guesses = markitdown.identify_many(paths + [fh], batch_size=2)
+        assert fh.tell() == 0
+
+    # The batched guesses are the same as those computed one at a time
+    assert len(all_guesses) == 4
+    for path, guesses in zip(paths, all_guesses):
+        with open(path, "rb") as fh:
+            expected = markitdown._get_stream_info_guesses(
+                file_stream=fh,
+                base_guess=StreamInfo(
+                    local_path=path,
+                    extension=os.path.splitext(path)[1],
+                    filename=os.path.basename(path),
+                ),
+            )
+        assert guesses == expected
+    assert all_guesses[3][0].mimetype == "application/pdf"
+
+    # The guesses can be reused, without identifying the content again
+    mock_magika = _MockMagika()
+    markitdown = MarkItDown(magika=mock_magika)
+    result = markitdown.convert(paths[1], stream_info_guesses=all_guesses[1])
+    assert "Large language models" in result.markdown
+    assert mock_magika.calls == 0
+
+
+def test_spooled_buffers() -> None:
+    data = bytes(range(256)) * 4
+
+    # Small buffers stay in memory, large ones are spilled to disk
+    with spool_stream(_NonSeekableStream(data), spool_threshold=2048) as buffer:
+        assert isinstance(buffer, io.BytesIO)
+        assert buffer.read() == data
+    with spool_stream(
+        _NonSeekableStream(data), spool_threshold=100, chunk_size=64
+    ) as buffer:
+        assert not isinstance(buffer, io.BytesIO)
+        assert buffer.tell() == 0
+        assert buffer.read() == data
+
+    # The expected size preallocates the buffer, but the actual size prevails
+    for expected_size in [0, 10, len(data), 5000, 1000000]:
+        with spool_chunks(
+            [data[:100], data[100:]], spool_threshold=4096, expected_size=expected_size
+        ) as buffer:
+            assert buffer.read() == data
+
+    # Conversion of non-seekable streams and responses
+    html = b"<html><body><h1>Test</h1>" + b"<p>Hello</p>" * 100 + b"</body></html>"
+    markitdown = MarkItDown(spool_threshold=256, read_chunk_size=100)
+    result = markitdown.convert_stream(
+        _NonSeekableStream(html), stream_info=StreamInfo(extension=".html")
+    )
+    assert "# Test" in result.markdown
+
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://example.com/test.html"
+    response.headers["content-type"] = "text/html; charset=utf-8"
+    response.headers["content-length"] = str(len(html))
+    response.raw = io.BytesIO(html)
+    result = markitdown.convert_response(response)
+    assert "# Test" in result.markdown
+
+
+def test_mapped_file_stream() -> None:
+    path = os.path.join(TEST_FILES_DIR, "test.json")
+    with open(path, "rb") as fh:
+        expected = fh.read()
+
+    with open_local_stream(path) as stream:
+        assert isinstance(stream, MappedFileStream)
+        assert stream.read(10) == expected[:10]
+        assert stream.tell() == 10
+
+        # Buffers are views of the remainder of the stream
+        view = read_as_buffer(stream)
+        assert isinstance(view, memoryview)
+        assert view == expected[10:]
+        assert stream.tell() == len(expected)
+        assert stream.read() == b""
+        view.release()
+
+        stream.seek(-5, io.SEEK_END)
+        buffer = bytearray(10)
+        assert stream.readinto(buffer) == 5
+        assert bytes(buffer[:5]) == expected[-5:]
+
+    # Empty files can't be mapped, and are opened normally
+    with tempfile.TemporaryDirectory() as tmpdir:
+        empty_path = os.path.join(tmpdir, "empty.txt")
+        open(empty_path, "wb").close()
+        with open_local_stream(empty_path) as stream:
+            assert not isinstance(stream, MappedFileStream)
+            assert read_as_buffer(stream) == b""
+
+
+def test_normalize_markdown() -> None:
+    cases = [
+        ("", ""),
+        ("a", "a"),
+        ("a\n", "a\n"),
+        ("a  \r\nb\t\r\n", "a\nb\n"),
+        ("\n\n\n\na", "\n\na"),
+        ("a\n\n \n\t\r\n\nb", "a\n\nb"),
+        ("a\rb\r", "a\rb"),
+        ("a\n\n\n\n", "a\n\n"),
+        ("\n \n \n", "\n\n"),
+    ]
+    for text, expected in cases:
+        assert normalize_markdown(text) == expected
+
+        # Feeding the text in chunks (here, one character at a time) gives the same result
+        normalizer = MarkdownNormalizer()
+        output = "".join(normalizer.feed(c) for c in text) + normalizer.flush()
+        assert output == expected
+
+
+def test_conversion_cache() -> None:
+    html = (
+        b"<html><body><h1>Test</h1><img src='data:image/png;base64,AAAA'></body></html>"
+    )
+
+    mock_magika = _MockMagika()
+    cache = MemoryConversionCache()
+    markitdown = MarkItDown(magika=mock_magika, cache=cache)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = [os.path.join(tmpdir, "a.html"), os.path.join(tmpdir, "b.html")]
+        for path in paths:
+            with open(path, "wb") as fh:
+                fh.write(html)
+
+        # Converting the same file again hits the cache (skipping Magika)
+        first = markitdown.convert(paths[0])
+        second = markitdown.convert(paths[0])
+        assert first.markdown == second.markdown
+        assert "# Test" in second.markdown
+        assert mock_magika.calls == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+        # ... and so does the same content at another path
+        markitdown.convert(paths[1])
+        assert mock_magika.calls == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+
+        # ... but the options are part of the key
+        result = markitdown.convert(paths[0], keep_data_uris=True)
+        assert "data:image/png;base64" in result.markdown
+        assert mock_magika.calls == 2
+        assert cache.stats().misses == 2
+
+        # Identical archives at different paths keep their own headers, since the output of
+        # the ZIP converter depends on the path
+        with open(os.path.join(TEST_FILES_DIR, "test_files.zip"), "rb") as fh:
+            archive = fh.read()
+        zip_paths = [os.path.join(tmpdir, "a.zip"), os.path.join(tmpdir, "b.zip")]
+        for path in zip_paths:
+            with open(path, "wb") as fh:
+                fh.write(archive)
+        for path in zip_paths:
+            markdown = markitdown.convert(path).markdown
+            assert f"Content from the zip file `{path}`" in markdown
+
+        # ... and are still cached by path
+        hits = cache.stats().hits
+        markdown = markitdown.convert(zip_paths[0]).markdown
+        assert f"Content from the zip file `{zip_paths[0]}`" in markdown
+        assert cache.stats().hits == hits + 1
+
+    # Results are copied in and out of the cache
+    second.markdown = "Modified"
+    result = markitdown.convert_stream(
+        io.BytesIO(html), stream_info=StreamInfo(extension=".html")
+    )
+    assert "# Test" in result.markdown
+
+    # The in-memory cache evicts the least recently used entries
+    cache = MemoryConversionCache(max_entries=2)
+    markitdown = MarkItDown(cache=cache)
+    for i in range(3):
+        markitdown.convert_stream(
+            io.BytesIO(f"Document {i}".encode("utf-8")),
+            stream_info=StreamInfo(extension=".txt"),
+        )
+    assert cache.stats().entries == 2
+
+    # The on-disk cache persists results, and is bounded by size
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, "cache.db")
+        cache = SqliteConversionCache(db_path)
+        markitdown = MarkItDown(cache=cache)
+        markitdown.convert_stream(
+            io.BytesIO(html), stream_info=StreamInfo(extension=".html")
+        )
+        cache.close()
+
+        cache = SqliteConversionCache(db_path, max_bytes=30)
+        mock_magika = _MockMagika()
+        markitdown = MarkItDown(magika=mock_magika, cache=cache)
+        result = markitdown.convert_stream(
+            io.BytesIO(html), stream_info=StreamInfo(extension=".html")
+        )
+        assert "# Test" in result.markdown
+        assert mock_magika.calls == 0
+        assert cache.stats().hits == 1
+
+        for i in range(5):
+            markitdown.convert_stream(
+                io.BytesIO(f"Document {i}".encode("utf-8")),
+                stream_info=StreamInfo(extension=".txt"),
+            )
+        stats = cache.stats()
+        assert stats.size_bytes <= 30
+        assert stats.entries == 3
+
+        # The running total of the sizes follows inserts, replacements and evictions
+        cache.set("replaced", DocumentConverterResult(markdown="12345"))
+        cache.set("replaced", DocumentConverterResult(markdown="123"))
+        cache.close()
+        import sqlite3
+
+        connection = sqlite3.connect(db_path)
+        ((total,),) = connection.execute("SELECT size FROM totals").fetchall()
+        (expected,) = connection.execute("SELECT SUM(size) FROM conversions").fetchone()
+        connection.close()
+        assert total == expected <= 30
+        cache = SqliteConversionCache(db_path)
+        assert cache.stats().size_bytes == total
+        cache.close()
+
+    # LLM clients are told apart by their type and base URL
+    keys = set()
+    for base_url in ["https://a.example.com/v1", "https://b.example.com/v1"]:
+        markitdown = MarkItDown(
+            cache=MemoryConversionCache(),
+            llm_client=SimpleNamespace(base_url=base_url),
+        )
+        keys.add(
+            markitdown._get_cache_keys(
+                file_stream=io.BytesIO(html), base_guess=StreamInfo(extension=".html")
+            )
+        )
+    assert len(keys) == 2 and None not in keys
+
+
+def test_convert_many() -> None:
+    markitdown = MarkItDown()
+    sources = [
+        os.path.join(TEST_FILES_DIR, "test.docx"),
+        (
+            b"<html><body><h1>Hello</h1></body></html>",
+            StreamInfo(extension=".html"),
+        ),
+        os.path.join(TEST_FILES_DIR, "does_not_exist.pdf"),
+        io.BytesIO(b"Hello, world!"),
+        os.path.join(TEST_FILES_DIR, "test_blog.html"),
+    ]
+
+    outcomes = list(
+        markitdown.convert_many(sources, max_workers=2, chunksize=2, ordered=True)
+    )
+    assert len(outcomes) == len(sources)
+
+    # Results are yielded in order, with their (original) sources
+    assert outcomes[0][0] == sources[0]
+    assert "AutoGen" in outcomes[0][1].markdown
+    assert outcomes[1][0] == sources[1][0]
+    assert "# Hello" in outcomes[1][1].markdown
+    assert isinstance(outcomes[2][1], FileNotFoundError)
+    assert outcomes[3][0] is sources[3]
+    assert "Hello, world!" in outcomes[3][1].markdown
+    assert "Large language models" in outcomes[4][1].markdown
+
+    # Unordered results are the same, in any order
+    unordered = list(
+        markitdown.convert_many(
+            [os.path.join(TEST_FILES_DIR, "test.docx"), b"Hello, world!"] * 3,
+            max_workers=2,
+        )
+    )
+    assert len(unordered) == 6
+    assert all(isinstance(result, DocumentConverterResult) for _, result in unordered)
+
+    # A dead worker fails the batches in flight, and the next batches go to a new pool
+    from concurrent.futures.process import BrokenProcessPool
+
+    crashing = _CrashingSource("crash.txt")
+    sources = [b"Before"] * 2 + [crashing] + [b"After"] * 5
+    outcomes = list(
+        markitdown.convert_many(sources, max_workers=1, chunksize=1, ordered=True)
+    )
+    assert [source for source, _ in outcomes] == sources
+    assert isinstance(outcomes[2][1], BrokenProcessPool)
+    assert outcomes[2][0] is crashing
+    assert "After" in outcomes[-1][1].markdown
+
+    # Workers are started with forkserver or spawn, so their arguments must be picklable
+    import threading
+
+    with pytest.raises(TypeError, match="llm_client"):
+        list(MarkItDown(llm_client=threading.Lock()).convert_many([b"Hello"]))
+
+
+def test_convert_async() -> None:
+    html = b"<html><head><title>Test</title></head><body><h1>Hello</h1></body></html>"
+    client = _MockAsyncClient(
+        {
+            "https://example.com/page": (
+                {"content-type": "text/html; charset=utf-8"},
+                html,
+            ),
+        }
+    )
+    markitdown = MarkItDown(async_http_client=client, read_chunk_size=16)
+
+    async def _convert_all():
+        return await asyncio.gather(
+            markitdown.convert_async("https://example.com/page"),
+            markitdown.convert_async(os.path.join(TEST_FILES_DIR, "test_blog.html")),
+            markitdown.convert_uri_async("data:text/plain;charset=utf-8,Hello%20async"),
+        )
+
+    page, blog, data = asyncio.run(_convert_all())
+    assert client.requests == [("GET", "https://example.com/page")]
+    assert page.title == "Test"
+    assert "# Hello" in page.markdown
+    assert "Large language models" in blog.markdown
+    assert "Hello async" in data.markdown
+
+    # Concurrency is limited
+    slow_converter = _SlowTextConverter()
+    markitdown = MarkItDown(max_concurrency=2)
+    markitdown.register_converter(slow_converter)
+
+    async def _convert_slowly():
+        return await asyncio.gather(
+            *[
+                markitdown.convert_async(
+                    io.BytesIO(f"Document {i}".encode("utf-8")),
+                    stream_info=StreamInfo(extension=".slow"),
+                )
+                for i in range(6)
+            ]
+        )
+
+    results = asyncio.run(_convert_slowly())
+    assert [r.markdown for r in results] == [f"Document {i}" for i in range(6)]
+    assert slow_converter.max_active == 2
+
+
+def test_convert_iter() -> None:
+    markitdown = MarkItDown()
+
+    # The chunks add up to the result of convert(), and multi-part inputs are split
+    for filename, min_chunks in [
+        ("test.pdf", 2),
+        ("test.pptx", 4),
+        ("test.xlsx", 2),
+        ("test_files.zip", 4),
+        ("test.epub", 3),
+        ("test_rss.xml", 4),
+        ("test_blog.html", 1),
+    ]:
+        path = os.path.join(TEST_FILES_DIR, filename)
+        chunks = list(markitdown.convert_iter(path))
+        assert len(chunks) >= min_chunks, filename
+        assert "".join(chunks) == markitdown.convert(path).markdown, filename
+
+    # Streams work too
+    with open(os.path.join(TEST_FILES_DIR, "test.pptx"), "rb") as fh:
+        streamed = "".join(markitdown.convert_iter(fh))
+    assert (
+        streamed
+        == markitdown.convert(os.path.join(TEST_FILES_DIR, "test.pptx")).markdown
+    )
+
+    # Errors are raised by the first call to next()
+    chunks = markitdown.convert_iter(os.path.join(TEST_FILES_DIR, "random.bin"))
+    with pytest.raises(UnsupportedFormatException):
+        next(chunks)
+
+    # ... including those of corrupt archives, which fail as they do with convert()
+    with open(os.path.join(TEST_FILES_DIR, "test_files.zip"), "rb") as fh:
+        truncated = fh.read(300)
+    chunks = markitdown.convert_iter(
+        io.BytesIO(truncated), stream_info=StreamInfo(extension=".zip")
+    )
+    with pytest.raises(FileConversionException):
+        next(chunks)
+
+    # Cache hits are yielded as a single chunk
+    cache = MemoryConversionCache()
+    cached_markitdown = MarkItDown(cache=cache)
+    path = os.path.join(TEST_FILES_DIR, "test.xlsx")
+    expected = cached_markitdown.convert(path).markdown
+    assert list(cached_markitdown.convert_iter(path)) == [expected]
+
+
+def test_lazy_imports() -> None:
+    # Importing markitdown must not import the (slow) dependencies of the converters, or
+    # requests, Magika, etc. They are imported when first needed.
+    code = "; ".join(
+        [
+            "import sys",
+            "before = set(sys.modules)",
+            "import markitdown",
+            "print('\\n'.join(sorted(set(sys.modules) - before)))",
+        ]
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {name.split(".")[0] for name in process.stdout.split()}
+    for name in [
+        "asyncio",
+        "azure",
+        "bs4",
+        "charset_normalizer",
+        "lxml",
+        "magika",
+        "mammoth",
+        "markdownify",
+        "multiprocessing",
+        "olefile",
+        "openpyxl",
+        "pandas",
+        "pdfminer",
+        "pptx",
+        "pydub",
+        "pypdf",
+        "pypdfium2",
+        "requests",
+        "speech_recognition",
+        "xlrd",
+        "youtube_transcript_api",
+    ]:
+        assert name not in imported, f"{name} is imported by `import markitdown`"
+
+    # The dependencies are imported (once) when first needed
+    markitdown = MarkItDown()
+    result = markitdown.convert(os.path.join(TEST_FILES_DIR, "test.pptx"))
+    assert "AutoGen" in result.markdown
+
+
+def test_observer() -> None:
+    class _RecordingObserver(ConversionObserver):
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.started = []
+            self.finished = []
+            self.counters = []
+
+        def stage_started(self, stage):
+            with self.lock:
+                self.started.append(stage)
+
+        def stage_finished(self, stage):
+            with self.lock:
+                self.finished.append(stage)
+
+        def counter_added(self, name, value, attributes):
+            with self.lock:
+                self.counters.append((name, value, attributes))
+
+    class _FailingConverter(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            return stream_info.extension == ".html"
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            raise ValueError("Broken converter")
+
+    observer = _RecordingObserver()
+    markitdown = MarkItDown(observer=observer, cache=MemoryConversionCache())
+    markitdown.register_converter(_FailingConverter())
+
+    path = os.path.join(TEST_FILES_DIR, "test_blog.html")
+    result = markitdown.convert(path)
+
+    # Every stage that started, finished, and all nest under the convert stage
+    assert len(observer.started) == len(observer.finished)
+    (root,) = [s for s in observer.finished if s.name == "convert"]
+    assert root.parent is None
+    assert root.duration > 0
+    assert root.attributes["source"] == "local"
+    assert root.attributes["converter"] == "HtmlConverter"
+    assert root.attributes["input_bytes"] == os.path.getsize(path)
+    assert root.attributes["output_chars"] == len(result.markdown)
+    assert root.attributes["failed_attempts"] == 1
+    assert root.attributes["guesses_tried"] == 1
+
+    names = {s.name for s in observer.finished}
+    assert {"cache_lookup", "identify", "accepts", "attempt", "normalize"} <= names
+    for stage in observer.finished:
+        if stage is not root:
+            parent = stage.parent
+            while parent is not None and parent is not root:
+                parent = parent.parent
+            assert parent is root, stage
+
+    # Failed attempts are timed too, and carry their error
+    attempts = [s for s in observer.finished if s.name == "attempt"]
+    assert [s.attributes["converter"] for s in attempts] == [
+        "_FailingConverter",
+        "HtmlConverter",
+    ]
+    assert isinstance(attempts[0].error, ValueError)
+    assert attempts[1].error is None
+
+    assert ("conversions", 1, {"converter": "HtmlConverter"}) in observer.counters
+    assert ("input_bytes", os.path.getsize(path), {}) in observer.counters
+    assert ("output_chars", len(result.markdown), {}) in observer.counters
+    assert ("failed_attempts", 1, {"converter": "_FailingConverter"}) in (
+        observer.counters
+    )
+
+    # Cache hits skip the conversion stages
+    observer.finished.clear()
+    markitdown.convert(path)
+    assert [s.name for s in observer.finished] == ["cache_lookup", "convert"]
+    assert observer.finished[-1].attributes["cache_hit"] is True
+
+    # Non-seekable streams are buffered
+    observer.finished.clear()
+    with open(path, "rb") as fh:
+        html = fh.read()
+    markitdown.convert_stream(
+        _NonSeekableStream(html), stream_info=StreamInfo(extension=".txt")
+    )
+    assert "buffer" in [s.name for s in observer.finished]
+
+    # The OpenTelemetry adapter is optional
+    try:
+        import opentelemetry  # noqa: F401
+    except ImportError:
+        with pytest.raises(MissingDependencyException):
+            OpenTelemetryObserver()
+
+
+def test_resource_limits() -> None:
+    path = os.path.join(TEST_FILES_DIR, "test_wikipedia.html")
+    expected = MarkItDown().convert(path).markdown
+
+    # Within the limits, conversions run in workers, which are recycled as configured
+    markitdown = MarkItDown(
+        resource_limits=ResourceLimits(
+            timeout=120, max_rss_bytes=4 << 30, max_conversions_per_worker=2
+        )
+    )
+    assert markitdown.convert(path).markdown == expected
+    (worker,) = markitdown._isolated_workers._idle
+    assert markitdown.convert(path).markdown == expected
+    assert markitdown._isolated_workers._idle == []
+    assert not worker.process.is_alive()
+    assert "".join(markitdown.convert_iter(path)) == expected
+
+    # Errors of the conversion are raised as usual
+    with pytest.raises(UnsupportedFormatException):
+        markitdown.convert(os.path.join(TEST_FILES_DIR, "random.bin"))
+
+    # Violations kill the worker, which is replaced by the next conversion
+    for limits, limit in [
+        (ResourceLimits(timeout=0.01), "timeout"),
+        (ResourceLimits(max_rss_bytes=1 << 20), "max_rss_bytes"),
+    ]:
+        markitdown = MarkItDown(resource_limits=limits)
+        with pytest.raises(ResourceLimitExceededException) as exc_info:
+            markitdown.convert(path)
+        assert exc_info.value.limit == limit
+        assert markitdown._isolated_workers._idle == []
+
+    # Oversized output is discarded, but the worker is kept
+    markitdown = MarkItDown(resource_limits=ResourceLimits(max_output_chars=100))
+    with pytest.raises(ResourceLimitExceededException) as exc_info:
+        markitdown.convert(path)
+    assert exc_info.value.limit == "max_output_chars"
+    assert exc_info.value.value == len(expected)
+    assert len(markitdown._isolated_workers._idle) == 1
+
+
+def test_attempt_planner() -> None:
+    class _CountingConverter(DocumentConverter):
+        def __init__(self):
+            self.probes = 0
+            self.accepts_calls = 0
+            self.charsets = []
+
+        def _probe(self):
+            self.probes += 1
+            return True
+
+        def accepts(self, file_stream, stream_info, **kwargs):
+            self.accepts_calls += 1
+            return cached_probe(kwargs, "test_attempt_planner.probe", self._probe)
+
+        def convert(self, file_stream, stream_info, **kwargs):
+            self.charsets.append(stream_info.charset)
+            raise ValueError("Broken converter")
+
+    converter = _CountingConverter()
+    markitdown = MarkItDown(enable_builtins=False)
+    markitdown.register_converter(converter)
+
+    guesses = [
+        StreamInfo(extension=".xyz"),
+        StreamInfo(extension=".XYZ"),  # Equivalent to the first guess
+        StreamInfo(extension=".xyz", mimetype="application/x-xyz"),
+        StreamInfo(extension=".xyz", charset="latin-1"),
+        StreamInfo(extension=".xyz", charset="ISO-8859-1"),  # Same charset
+    ]
+    with pytest.raises(FileConversionException) as exc_info:
+        markitdown._convert(
+            file_stream=io.BytesIO(b"\x00\x01\x02"), stream_info_guesses=guesses
+        )
+
+    # Of the four distinct guesses (including the final empty one), the converter
+    # is only probed again for the new charset, and the expensive probe runs once
+    assert converter.accepts_calls == 2
+    assert converter.probes == 1
+    assert converter.charsets == [None, "latin-1"]
+    assert len(exc_info.value.attempts) == 2
+
+    # Without a cache (e.g., when accepts() is called directly), the probe just runs
+    assert cached_probe({}, "key", lambda: 42) == 42
+
+
+def test_pdf_parallel() -> None:
+    markitdown = MarkItDown()
+    path = os.path.join(TEST_FILES_DIR, "test_multipage.pdf")
+    expected = markitdown.convert(path).markdown
+    assert "page 8 of 8" in expected
+
+    # The pages are extracted in worker processes, and reassembled in order
+    options = {"pdf_workers": 3, "pdf_parallel_min_pages": 2}
+    assert markitdown.convert(path, **options).markdown == expected
+    assert "".join(markitdown.convert_iter(path, **options)) == expected
+
+    # The ranges cover all pages, and short documents are extracted serially
+    with open(path, "rb") as fh:
+        converter = PdfConverter()
+        backend = converter._get_backend(options)
+        chunks = converter._get_parallel_chunks(fh, None, backend, options)
+        assert chunks is not None and len(chunks) == 8
+        assert sum(chunks, []) == list(range(8))
+        assert fh.tell() == 0
+        assert (
+            converter._get_parallel_chunks(fh, None, backend, {"pdf_workers": 3})
+            is None
+        )
+
+    # Selected pages are split too
+    options["pages"] = "2-7"
+    assert markitdown.convert(path, **options).markdown == (
+        markitdown.convert(path, pages="2-7").markdown
+    )
+
+
+def test_pdf_pages() -> None:
+    markitdown = MarkItDown()
+    path = os.path.join(TEST_FILES_DIR, "test_multipage.pdf")
+
+    def _markers(markdown: str):
+        return re.findall(r"<!-- Page (\d+) -->", markdown)
+
+    for pages, expected in [
+        ("1-3", ["1", "2", "3"]),
+        ("r2-z", ["7", "8"]),
+        ("8,2,5-", ["2", "5", "6", "7", "8"]),
+        ("-2", ["1", "2"]),
+        (range(4, 6), ["4", "5"]),
+        (3, ["3"]),
+        ("9-", []),
+    ]:
+        result = markitdown.convert(path, pages=pages, pdf_page_markers=True)
+        assert _markers(result.markdown) == expected, pages
+        for page in range(1, 9):
+            assert (f"page {page} of 8" in result.markdown) == (str(page) in expected)
+
+    # Pages are streamed one by one
+    chunks = list(markitdown.convert_iter(path, pdf_page_markers=True))
+    assert _markers("".join(chunks)) == [str(page) for page in range(1, 9)]
+    assert len(chunks) >= 8
+
+    # Without markers, the output is the same as before
+    assert markitdown.convert(path, pages="1-").markdown == (
+        markitdown.convert(path).markdown
+    )
+
+    with pytest.raises(ValueError):
+        PageSelection.parse("3-1")
+    with pytest.raises(ValueError):
+        PageSelection.parse("0")
+    assert PageSelection.parse("r1-2").resolve(5) == []
+
+
+def test_pdf_modes() -> None:
+    markitdown = MarkItDown()
+    path = os.path.join(TEST_FILES_DIR, "test.pdf")
+    balanced = markitdown.convert(path).markdown
+    assert markitdown.convert(path, pdf_mode="balanced").markdown == balanced
+
+    # The layout analysis finds the same words, and the fast mode the same sentences
+    layout = markitdown.convert(path, pdf_mode="layout").markdown
+    assert layout.split() == balanced.split()
+    fast = markitdown.convert(path, pdf_mode="fast").markdown
+    for sentence in [
+        "Large language models (LLMs) are becoming a crucial building block",
+        "While there is contemporaneous exploration of multi-agent approaches",
+    ]:
+        assert sentence in " ".join(fast.split())
+
+    # The fast mode keeps pages apart
+    path = os.path.join(TEST_FILES_DIR, "test_multipage.pdf")
+    markdown = markitdown.convert(
+        path, pdf_mode="fast", pages="2-3", pdf_page_markers=True
+    ).markdown
+    assert markdown.startswith(
+        "<!-- Page 2 -->\n\nMultipage test document, page 2 of 8\nLine 1 of page 2:"
+    )
+    assert "<!-- Page 3 -->\n\nMultipage test document, page 3 of 8" in markdown
+
+    with pytest.raises(FileConversionException):
+        markitdown.convert(path, pdf_mode="fastest")
+
+
+def test_pdf_scanned_pages() -> None:
+    import pdfminer.high_level
+
+    path = os.path.join(TEST_FILES_DIR, "test_scanned_page.pdf")
+
+    # Page 2 is an image, and page 3 draws its text in a form
+    with open(path, "rb") as fh:
+        coverage = PdfConverter().analyze(fh)
+        assert fh.tell() == 0
+    assert [page.page for page in coverage.pages] == [1, 2, 3]
+    assert coverage.text_pages == [1, 3]
+    assert coverage.image_only_pages == [2]
+    assert coverage.coverage == pytest.approx(2 / 3)
+    assert not coverage.is_scanned
+
+    with open(path, "rb") as fh:
+        coverage = PdfConverter().analyze(fh, pages="2")
+    assert coverage.is_scanned and coverage.coverage == 0.0
+
+    # Skipping the image-only page doesn't change the output
+    markitdown = MarkItDown()
+    assert markitdown.convert(path).markdown == normalize_markdown(
+        pdfminer.high_level.extract_text(path)
+    )
+    markdown = markitdown.convert(path, pdf_page_markers=True).markdown
+    assert "<!-- Page 2 -->\n\n<!-- Page 3 -->\n\nPage 3 draws its text" in markdown
+
+    # Conversions report the coverage of the (selected) pages, without a second pass
+    with open(path, "rb") as fh:
+        coverage = PdfConverter().analyze(fh)
+    from_result = PdfTextCoverage.from_result
+    assert from_result(markitdown.convert(path)) == coverage
+    assert from_result(markitdown.convert(path, pages="2")).is_scanned
+    parallel = {"pdf_workers": 2, "pdf_parallel_min_pages": 2}
+    assert from_result(markitdown.convert(path, **parallel)) == coverage
+    html_path = os.path.join(TEST_FILES_DIR, "test_blog.html")
+    assert from_result(markitdown.convert(html_path)) is None
+
+    # ... which caches keep
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for cache in [
+            MemoryConversionCache(),
+            SqliteConversionCache(os.path.join(tmpdir, "cache.db")),
+        ]:
+            cached_markitdown = MarkItDown(cache=cache)
+            cached_markitdown.convert(path)
+            assert from_result(cached_markitdown.convert(path)) == coverage
+            assert cache.stats().hits == 1
+            if isinstance(cache, SqliteConversionCache):
+                cache.close()
+
+
+def test_pdf_backends() -> None:
+    from markitdown.converters._pdf_converter import PDF_BACKENDS
+
+    markitdown = MarkItDown()
+    path = os.path.join(TEST_FILES_DIR, "test_multipage.pdf")
+    expected = markitdown.convert(
+        path, pages="2-3", pdf_page_markers=True
+    ).markdown.split()
+
+    # Installed backends follow the conventions of pdfminer (the default)
+    available = [name for name, b in PDF_BACKENDS.items() if b.is_available()]
+    assert "pdfminer" in available
+    for name in available:
+        markdown = markitdown.convert(
+            path, pdf_backend=name, pages="2-3", pdf_page_markers=True
+        ).markdown
+        assert markdown.startswith(
+            "<!-- Page 2 -->\n\nMultipage test document, page 2 of 8\n"
+        )
+        assert markdown.split() == expected
+
+        # Counting pages from the end, and skipping empty pages
+        markdown = markitdown.convert(path, pdf_backend=name, pages="r1").markdown
+        assert markdown.startswith("Multipage test document, page 8 of 8")
+        with open(os.path.join(TEST_FILES_DIR, "test_scanned_page.pdf"), "rb") as fh:
+            pages = list(PDF_BACKENDS[name].extract_pages(fh, [0, 1, 2, 5], "balanced"))
+        assert [number for number, _ in pages] == [0, 1, 2]
+        assert pages[1][1] == "\f"
+        assert all(text.endswith("\f") for _, text in pages)
+
+    # "auto" picks the fastest installed backend
+    converter = PdfConverter()
+    fastest = next(n for n in ("pypdfium2", "pypdf", "pdfminer") if n in available)
+    assert converter._get_backend({"pdf_backend": "auto"}).name == fastest
+    assert converter._get_backend({}).name == "pdfminer"
+
+    with pytest.raises(FileConversionException):
+        markitdown.convert(path, pdf_backend="ghostscript")
+
+
 if __name__ == "__main__":
     """Runs this file's tests from the command line."""
     for test in [
         test_stream_info_operations,
         test_data_uris,
         test_file_uris,
+        test_dispatch_index,
+        test_shared_magika,
+        test_sniff_policies,
+        test_identify_many,
+        test_spooled_buffers,
+        test_mapped_file_stream,
+        test_normalize_markdown,
+        test_conversion_cache,
+        test_convert_many,
+        test_convert_async,
+        test_convert_iter,
+        test_lazy_imports,
+        test_observer,
+        test_resource_limits,
+        test_attempt_planner,
+        test_pdf_parallel,
+        test_pdf_pages,
+        test_pdf_modes,
+        test_pdf_scanned_pages,
+        test_pdf_backends,
         test_docx_comments,
+        test_docx_pre_process,
         test_input_as_strings,
         test_markitdown_remote,
         test_speech_transcription,
@@ -89,6 +89,27 @@ def test_convert_stream_with_hints(test_vector):
             assert string not in result.markdown
 
 
+@pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
+def test_convert_stream_with_trusted_hints(test_vector):
+    """Test the conversion of a stream with full stream info, and no content sniffing."""
+    markitdown = MarkItDown(sniff="never")
+
+    stream_info = StreamInfo(
+        extension=os.path.splitext(test_vector.filename)[1],
+        mimetype=test_vector.mimetype,
+        charset=test_vector.charset,
+    )
+
+    with open(os.path.join(TEST_FILES_DIR, test_vector.filename), "rb") as stream:
+        result = markitdown.convert(
+            stream, stream_info=stream_info, url=test_vector.url
+        )
+        for string in test_vector.must_include:
+            assert string in result.markdown
+        for string in test_vector.must_not_include:
+            assert string not in result.markdown
+
+
 @pytest.mark.parametrize("test_vector", GENERAL_TEST_VECTORS)
 def test_convert_stream_without_hints(test_vector):
     """Test the conversion of a stream with no stream info."""
@@ -207,6 +228,7 @@ if __name__ == "__main__":
         test_guess_stream_info,
         test_convert_local,
         test_convert_stream_with_hints,
+        test_convert_stream_with_trusted_hints,
         test_convert_stream_without_hints,
         test_convert_http_uri,
         test_convert_file_uri,